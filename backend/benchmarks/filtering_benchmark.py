@@ -0,0 +1,176 @@
+#!/usr/bin/env python3
+"""
+Benchmark the filtering engine on synthetic dumps.
+
+    python filtering_benchmark.py --sizes 1MB,100MB,1GB --output bench.json
+    python filtering_benchmark.py --sizes 1MB --compare bench.json
+
+Times every detector and the whole analyze_github_dump, records peak memory,
+and writes machine-readable JSON so runs on different commits can be compared.
+"""
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+import tracemalloc
+from datetime import datetime
+from pathlib import Path
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+BENCH_DIR = Path(__file__).parent
+sys.path.insert(0, str(BENCH_DIR.parent / 'translation'))
+
+import filtering  # noqa: E402
+from synthetic_dump import generate_dump, parse_mix, parse_size, DEFAULT_MIX  # noqa: E402
+
+
+def peak_rss_mb():
+    """Peak resident set size of this process in MB (None where unsupported)"""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is KB on Linux, bytes on macOS
+    return round(peak / (1024 * 1024 if sys.platform == 'darwin' else 1024), 1)
+
+
+def measure(stage, fn, trace_memory):
+    """Run fn once, returning (result, {'seconds', 'peak_mb'})"""
+    if trace_memory:
+        tracemalloc.start()
+    start = time.perf_counter()
+    result = fn()
+    seconds = time.perf_counter() - start
+    peak_mb = None
+    if trace_memory:
+        peak_mb = round(tracemalloc.get_traced_memory()[1] / 1024 / 1024, 2)
+        tracemalloc.stop()
+    print(f"  {stage:.<32} {seconds:8.3f}s" + (f"  peak {peak_mb} MB" if peak_mb is not None else ''))
+    return result, {'seconds': round(seconds, 4), 'peak_mb': peak_mb}
+
+
+def benchmark_dump(dump_file, trace_memory):
+    """Time each detector over every repo in the dump, then the full pipeline"""
+    with open(dump_file, 'r', encoding='utf-8', errors='ignore') as f:
+        text = f.read()
+
+    stages = {}
+    repos, stages['parse_repositories'] = measure(
+        'parse_repositories', lambda: filtering.parse_repositories(text), trace_memory)
+    contents = [repo['content'] for repo in repos]
+
+    files, stages['parse_files'] = measure(
+        'parse_files', lambda: [filtering.parse_files(c) for c in contents], trace_memory)
+    deps, stages['detect_dependencies'] = measure(
+        'detect_dependencies', lambda: [filtering.detect_dependencies(fs) for fs in files], trace_memory)
+
+    detectors = {
+        'detect_languages': lambda: [filtering.detect_languages(c) for c in contents],
+        'detect_libraries': lambda: [filtering.detect_libraries(fs, d) for fs, d in zip(files, deps)],
+        'detect_frameworks': lambda: [filtering.detect_frameworks(c) for c in contents],
+        'parse_commits': lambda: [filtering.parse_commits(c) for c in contents],
+        'analyze_file_types': lambda: [filtering.analyze_file_types(c) for c in contents],
+        'estimate_test_coverage': lambda: [filtering.estimate_test_coverage(c) for c in contents],
+    }
+    for stage, fn in detectors.items():
+        _, stages[stage] = measure(stage, fn, trace_memory)
+
+    # Whole pipeline; worker processes are not visible to tracemalloc, so only time it
+    _, stages['analyze_github_dump'] = measure(
+        'analyze_github_dump', lambda: filtering.analyze_github_dump(text), False)
+
+    return stages
+
+
+def git_commit():
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output=True,
+                              text=True, cwd=BENCH_DIR, check=True).stdout.strip()
+    except (subprocess.CalledProcessError, OSError):
+        return None
+
+
+def compare(results, baseline_file):
+    """Print per-stage time ratios against an earlier results file"""
+    with open(baseline_file, 'r', encoding='utf-8') as f:
+        baseline = json.load(f)
+    old_runs = {run['size']: run for run in baseline['runs']}
+
+    print(f"\nComparison against {baseline_file} (commit {baseline.get('commit')}):")
+    for run in results['runs']:
+        old = old_runs.get(run['size'])
+        if not old:
+            continue
+        print(f"  {run['size']}:")
+        for stage, stats in run['stages'].items():
+            old_stats = old['stages'].get(stage)
+            if not old_stats or not old_stats['seconds']:
+                continue
+            ratio = stats['seconds'] / old_stats['seconds']
+            flag = '  REGRESSION' if ratio > 1.1 else ''
+            print(f"    {stage:.<32} {old_stats['seconds']:8.3f}s -> {stats['seconds']:8.3f}s  x{ratio:.2f}{flag}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark filtering.analyze_github_dump")
+    parser.add_argument('--sizes', default='1MB,100MB,1GB', help="comma-separated dump sizes")
+    parser.add_argument('--mix', default=None, help="language=weight,... (default: %s)" %
+                        ','.join(f"{k}={v}" for k, v in DEFAULT_MIX.items()))
+    parser.add_argument('--repos', type=int, default=5, help="repositories per dump")
+    parser.add_argument('--minified-ratio', type=float, default=0.02)
+    parser.add_argument('--pathological-ratio', type=float, default=0.005)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--workdir', default=str(BENCH_DIR / 'dumps'), help="where generated dumps are kept")
+    parser.add_argument('--no-tracemalloc', action='store_true', help="skip per-stage memory tracing (faster)")
+    parser.add_argument('--output', default='bench_results.json')
+    parser.add_argument('--compare', default=None, help="earlier results file to diff against")
+    args = parser.parse_args()
+
+    mix = parse_mix(args.mix) if args.mix else DEFAULT_MIX
+    workdir = Path(args.workdir)
+    workdir.mkdir(parents=True, exist_ok=True)
+
+    results = {
+        'commit': git_commit(),
+        'timestamp': datetime.now().isoformat(),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'cpu_count': os.cpu_count(),
+        'params': {'mix': mix, 'repos': args.repos, 'minified_ratio': args.minified_ratio,
+                   'pathological_ratio': args.pathological_ratio, 'seed': args.seed},
+        'runs': []
+    }
+
+    for size in args.sizes.split(','):
+        target = parse_size(size)
+        dump_file = workdir / f"dump_{size.strip()}_{args.seed}.txt"
+        if not dump_file.exists():
+            print(f"Generating {size} dump at {dump_file}...")
+            generate_dump(dump_file, target, mix, args.repos, args.minified_ratio,
+                          args.pathological_ratio, args.seed)
+
+        print(f"\nBenchmarking {size} ({dump_file.stat().st_size / 1024 / 1024:.1f} MB):")
+        stages = benchmark_dump(dump_file, not args.no_tracemalloc)
+        results['runs'].append({
+            'size': size.strip(),
+            'bytes': dump_file.stat().st_size,
+            'stages': stages,
+            'peak_rss_mb': peak_rss_mb()
+        })
+
+    with open(args.output, 'w', encoding='utf-8') as f:
+        json.dump(results, f, indent=2)
+    print(f"\nSaved results to {args.output}")
+
+    if args.compare:
+        compare(results, args.compare)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+"""
+Local stand-in for the Backboard API.
+
+    python fake_backboard.py --port 9102 --first-token-ms 400 --chunk-ms 25
+
+Implements the assistant, thread and message calls the API makes through
+backboard-sdk. Replies are canned scoping JSON whose confidence rises with each
+turn; streamed replies arrive as `content_streaming` SSE events after a
+configurable time-to-first-token, a few characters per chunk.
+"""
+import argparse
+import asyncio
+import json
+import uuid
+from datetime import datetime, timezone
+from urllib.parse import parse_qs
+
+import uvicorn
+from fastapi import FastAPI, HTTPException, Request
+from fastapi.responses import StreamingResponse
+
+QUESTIONS = [
+    "Who are the main users of this project, and what problem does it solve for them?",
+    "Which features are must-haves for the first version, and which can wait?",
+    "What tech stack or existing systems does this need to work with?",
+    "Are there constraints on timeline, budget or team size I should know about?",
+    "How will you measure whether the project succeeded?",
+]
+
+
+def now():
+    return datetime.now(timezone.utc).isoformat()
+
+
+def scoping_reply(turn):
+    """The assistant's JSON reply for the given turn of a thread (0-based)"""
+    confidence = round(min(0.2 + 0.2 * turn, 0.9), 2)
+    question = "Ready to proceed!" if confidence >= 0.85 else QUESTIONS[turn % len(QUESTIONS)]
+    return json.dumps({
+        "question": question,
+        "confidence": confidence,
+        "reasoning": f"Turn {turn + 1}: building up the project picture.",
+        "understood_so_far": {"problem": "Synthetic load-test project", "users": "Developers",
+                              "features": ["auth", "dashboard"], "constraints": ["four weeks"]},
+    })
+
+
+class FakeBackboard:
+    def __init__(self, first_token_ms=300, chunk_ms=20, chunk_chars=8):
+        self.first_token_ms = first_token_ms
+        self.chunk_ms = chunk_ms
+        self.chunk_chars = chunk_chars
+        self.assistants = {}
+        self.turns = {}  # thread_id -> replies sent so far
+
+    async def stream_reply(self, thread_id, text):
+        await asyncio.sleep(self.first_token_ms / 1000)
+        yield f"data: {json.dumps({'type': 'run_started', 'thread_id': thread_id})}\n\n"
+        for i in range(0, len(text), self.chunk_chars):
+            if i:
+                await asyncio.sleep(self.chunk_ms / 1000)
+            chunk = text[i:i + self.chunk_chars]
+            yield f"data: {json.dumps({'type': 'content_streaming', 'content': chunk})}\n\n"
+        yield f"data: {json.dumps({'type': 'run_ended', 'status': 'completed'})}\n\n"
+
+
+def create_app(backboard):
+    app = FastAPI(title="Fake Backboard")
+
+    @app.get("/health")
+    async def health():
+        return {"status": "ok", "assistants": len(backboard.assistants), "threads": len(backboard.turns)}
+
+    @app.post("/assistants")
+    async def create_assistant(request: Request):
+        body = await request.json()
+        assistant = {"assistant_id": str(uuid.uuid4()), "name": body.get("name", ""),
+                     "description": body.get("description"), "created_at": now()}
+        backboard.assistants[assistant["assistant_id"]] = assistant
+        return assistant
+
+    @app.delete("/assistants/{assistant_id}")
+    async def delete_assistant(assistant_id: str):
+        if backboard.assistants.pop(assistant_id, None) is None:
+            raise HTTPException(status_code=404, detail="Assistant not found")
+        return {"message": "Assistant deleted"}
+
+    @app.post("/assistants/{assistant_id}/threads")
+    async def create_thread(assistant_id: str):
+        if assistant_id not in backboard.assistants:
+            raise HTTPException(status_code=404, detail="Assistant not found")
+        thread_id = str(uuid.uuid4())
+        backboard.turns[thread_id] = 0
+        return {"thread_id": thread_id, "created_at": now(), "messages": []}
+
+    @app.post("/threads/messages")
+    async def add_message(request: Request):
+        # backboard-sdk posts a URL-encoded form (JSON on some code paths); no file uploads from this API
+        if request.headers.get("content-type", "").startswith("application/json"):
+            body = await request.json()
+        else:
+            body = {k: v[0] for k, v in parse_qs((await request.body()).decode("utf-8")).items()}
+        thread_id = str(body.get("thread_id"))
+        if thread_id not in backboard.turns:
+            raise HTTPException(status_code=404, detail="Thread not found")
+        text = scoping_reply(backboard.turns[thread_id])
+        backboard.turns[thread_id] += 1
+
+        if str(body.get("stream")).lower() == "true":
+            return StreamingResponse(backboard.stream_reply(thread_id, text), media_type="text/event-stream")
+
+        await asyncio.sleep((backboard.first_token_ms + backboard.chunk_ms * len(text) / backboard.chunk_chars) / 1000)
+        return {"message": "Message added", "thread_id": thread_id, "content": text,
+                "message_id": str(uuid.uuid4()), "role": "assistant", "status": "COMPLETED",
+                "timestamp": now(), "created_at": now()}
+
+    return app
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Local stand-in for the Backboard API")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=9102)
+    parser.add_argument('--first-token-ms', type=int, default=300, help="delay before the first reply chunk")
+    parser.add_argument('--chunk-ms', type=int, default=20, help="delay between reply chunks")
+    parser.add_argument('--chunk-chars', type=int, default=8, help="characters per reply chunk")
+    args = parser.parse_args()
+
+    backboard = FakeBackboard(args.first_token_ms, args.chunk_ms, args.chunk_chars)
+    print(f"✓ Fake Backboard on http://{args.host}:{args.port}")
+    uvicorn.run(create_app(backboard), host=args.host, port=args.port, log_level="warning")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,228 @@
+#!/usr/bin/env python3
+"""
+Local stand-in for github.com and api.github.com.
+
+    python fake_github.py --port 9101 --latency-ms 50 --repos 3
+
+Serves the OAuth endpoints the API's login uses, the REST calls made by
+GithubFetchPythonValt2.py, and git smart-HTTP (through `git http-backend`) for
+synthetic repositories generated on first clone. Any OAuth code is accepted
+and logs in as the user of that name, so load tests can mint as many users as
+they like.
+"""
+import argparse
+import asyncio
+import hashlib
+import os
+import random
+import subprocess
+import tempfile
+import threading
+from pathlib import Path
+from urllib.parse import parse_qs
+
+import uvicorn
+from fastapi import FastAPI, Header, HTTPException, Request
+from fastapi.responses import RedirectResponse, Response
+from starlette.concurrency import run_in_threadpool
+
+LANGUAGES = {
+    "Python": ("py", "import json\n\n\ndef handler_{i}(event):\n    return json.dumps({{'id': {i}, 'ok': True}})\n"),
+    "JavaScript": ("js", "export function handler{i}(req, res) {{\n  res.json({{ id: {i}, ok: true }});\n}}\n"),
+    "TypeScript": ("ts", "export const handler{i} = (id: number): string => `item-${{id}}-{i}`;\n"),
+}
+MANIFESTS = {
+    "Python": ("requirements.txt", "fastapi==0.128.0\nrequests==2.32.3\nnumpy==2.1.0\n"),
+    "JavaScript": ("package.json", '{"dependencies": {"express": "^4.19.0", "react": "^18.3.0"}}\n'),
+    "TypeScript": ("package.json", '{"dependencies": {"next": "^14.2.0", "typescript": "^5.5.0"}}\n'),
+}
+# Fixed identity and dates so generated repositories are byte-identical across runs
+GIT_ENV = {"GIT_AUTHOR_NAME": "fake", "GIT_AUTHOR_EMAIL": "fake@example.com",
+           "GIT_COMMITTER_NAME": "fake", "GIT_COMMITTER_EMAIL": "fake@example.com",
+           "GIT_AUTHOR_DATE": "2024-01-01T00:00:00Z", "GIT_COMMITTER_DATE": "2024-01-01T00:00:00Z"}
+
+
+def github_id(login):
+    """Stable numeric id for a login"""
+    return int(hashlib.sha256(login.encode("utf-8")).hexdigest()[:12], 16)
+
+
+class FakeGitHub:
+    def __init__(self, base_url, repo_root, repos_per_user=3, files_per_repo=20, shared_repos=False):
+        self.base_url = base_url.rstrip("/")
+        self.repo_root = Path(repo_root)
+        self.repos_per_user = repos_per_user
+        self.files_per_repo = files_per_repo
+        self.shared_repos = shared_repos
+        self._locks = {}
+        self._locks_guard = threading.Lock()
+
+    def repo_owner(self, login):
+        # With --shared-repos every user lists the same repositories (repo_store cache hits)
+        return "shared" if self.shared_repos else login
+
+    def list_repos(self, login):
+        owner = self.repo_owner(login)
+        repos = []
+        for i in range(self.repos_per_user):
+            language = list(LANGUAGES)[i % len(LANGUAGES)]
+            name = f"{owner}-project-{i}"
+            repos.append({
+                "id": github_id(f"{owner}/{name}"),
+                "name": name,
+                "full_name": f"{owner}/{name}",
+                "owner": {"login": owner},
+                "description": f"Synthetic {language} project {i}",
+                "language": language,
+                "clone_url": f"{self.base_url}/{owner}/{name}.git",
+                "html_url": f"{self.base_url}/{owner}/{name}",
+                "fork": False,
+                "stargazers_count": i,
+                "updated_at": "2024-01-01T00:00:00Z",
+            })
+        return repos
+
+    def ensure_repo(self, owner, name):
+        """Bare repository for owner/name, generated the first time it is asked for"""
+        bare = self.repo_root / owner / f"{name}.git"
+        with self._locks_guard:
+            lock = self._locks.setdefault(bare, threading.Lock())
+        with lock:
+            if bare.exists():
+                return bare
+            index = int(name.rsplit("-", 1)[-1]) if name.rsplit("-", 1)[-1].isdigit() else 0
+            language = list(LANGUAGES)[index % len(LANGUAGES)]
+            extension, template = LANGUAGES[language]
+            manifest, manifest_body = MANIFESTS[language]
+            rng = random.Random(f"{owner}/{name}")
+
+            with tempfile.TemporaryDirectory() as work:
+                work = Path(work)
+                (work / "README.md").write_text(f"# {name}\n\nSynthetic {language} repository.\n")
+                (work / manifest).write_text(manifest_body)
+                for i in range(self.files_per_repo):
+                    path = work / "src" / f"module_{i}.{extension}"
+                    path.parent.mkdir(parents=True, exist_ok=True)
+                    path.write_text(template.format(i=i) * rng.randint(1, 20))
+                env = dict(os.environ, **GIT_ENV)
+                for cmd in (["git", "init", "-q", "-b", "main"], ["git", "add", "-A"],
+                            ["git", "commit", "-q", "-m", "Initial commit"]):
+                    subprocess.run(cmd, cwd=work, env=env, check=True, capture_output=True)
+                bare.parent.mkdir(parents=True, exist_ok=True)
+                subprocess.run(["git", "clone", "-q", "--bare", str(work), str(bare)],
+                               env=env, check=True, capture_output=True)
+            return bare
+
+
+def parse_cgi_output(output):
+    """(status, headers, body) from a CGI response"""
+    for separator in (b"\r\n\r\n", b"\n\n"):
+        head, found, body = output.partition(separator)
+        if found:
+            break
+    else:
+        head, body = b"", output
+    status, headers = 200, {}
+    for line in head.decode("latin-1").splitlines():
+        name, _, value = line.partition(":")
+        if name.lower() == "status":
+            status = int(value.strip().split()[0])
+        elif name:
+            headers[name.strip()] = value.strip()
+    return status, headers, body
+
+
+def create_app(github, latency_ms=0, git_latency_ms=0):
+    app = FastAPI(title="Fake GitHub")
+
+    @app.middleware("http")
+    async def add_latency(request: Request, call_next):
+        delay = git_latency_ms if ".git/" in request.url.path else latency_ms
+        if delay:
+            await asyncio.sleep(delay / 1000)
+        response = await call_next(request)
+        response.headers["X-RateLimit-Remaining"] = "5000"
+        return response
+
+    @app.get("/health")
+    async def health():
+        return {"status": "ok"}
+
+    @app.get("/login/oauth/authorize")
+    async def authorize(redirect_uri: str, state: str = "", login: str = "octocat"):
+        return RedirectResponse(url=f"{redirect_uri}?code={login}&state={state}")
+
+    @app.post("/login/oauth/access_token")
+    async def access_token(request: Request):
+        # Form-encoded like GitHub's; parsed by hand so python-multipart is not needed
+        code = parse_qs((await request.body()).decode("utf-8")).get("code", [""])[0]
+        if not code:
+            raise HTTPException(status_code=400, detail="Missing code")
+        return {"access_token": f"fake-{code}", "token_type": "bearer", "scope": "read:user,user:email"}
+
+    @app.get("/user")
+    async def user(authorization: str = Header(None)):
+        token = (authorization or "").split(" ", 1)[-1]
+        if not token.startswith("fake-"):
+            raise HTTPException(status_code=401, detail="Bad credentials")
+        login = token[len("fake-"):]
+        return {"id": github_id(login), "login": login, "email": f"{login}@example.com",
+                "avatar_url": f"{github.base_url}/avatars/{login}.png", "name": login}
+
+    @app.get("/users/{login}/repos")
+    async def user_repos(login: str, page: int = 1, per_page: int = 30):
+        repos = github.list_repos(login)
+        return repos[(page - 1) * per_page:page * per_page]
+
+    @app.api_route("/{owner}/{repo}.git/{path:path}", methods=["GET", "POST"])
+    async def git_smart_http(owner: str, repo: str, path: str, request: Request):
+        await run_in_threadpool(github.ensure_repo, owner, repo)
+        body = await request.body()
+        env = {
+            "PATH": os.environ.get("PATH", ""),
+            "GIT_PROJECT_ROOT": str(github.repo_root),
+            "GIT_HTTP_EXPORT_ALL": "1",
+            "PATH_INFO": f"/{owner}/{repo}.git/{path}",
+            "REQUEST_METHOD": request.method,
+            "QUERY_STRING": request.url.query,
+            "CONTENT_TYPE": request.headers.get("content-type", ""),
+            "CONTENT_LENGTH": str(len(body)),
+            "REMOTE_ADDR": request.client.host if request.client else "127.0.0.1",
+        }
+        # Request-body compression and protocol v2 are both negotiated through headers
+        for header in ("content-encoding", "git-protocol"):
+            if header in request.headers:
+                env["HTTP_" + header.upper().replace("-", "_")] = request.headers[header]
+        proc = await asyncio.create_subprocess_exec(
+            "git", "http-backend", env=env,
+            stdin=asyncio.subprocess.PIPE, stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.PIPE)
+        output, errors = await proc.communicate(body)
+        if proc.returncode != 0:
+            raise HTTPException(status_code=500, detail=errors.decode("utf-8", "replace"))
+        status, headers, payload = parse_cgi_output(output)
+        return Response(content=payload, status_code=status, headers=headers)
+
+    return app
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Local stand-in for GitHub")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=9101)
+    parser.add_argument('--latency-ms', type=int, default=0, help="added to every OAuth/REST response")
+    parser.add_argument('--git-latency-ms', type=int, default=0, help="added to every git smart-HTTP response")
+    parser.add_argument('--repos', type=int, default=3, help="repositories listed per user")
+    parser.add_argument('--files', type=int, default=20, help="source files per generated repository")
+    parser.add_argument('--shared-repos', action='store_true', help="every user lists the same repositories")
+    parser.add_argument('--repo-root', default=None, help="where bare repositories are generated (default: temp dir)")
+    args = parser.parse_args()
+
+    repo_root = args.repo_root or tempfile.mkdtemp(prefix="fake-github-")
+    github = FakeGitHub(f"http://{args.host}:{args.port}", repo_root, args.repos, args.files, args.shared_repos)
+    print(f"✓ Fake GitHub on http://{args.host}:{args.port} (repositories in {repo_root})")
+    uvicorn.run(create_app(github, args.latency_ms, args.git_latency_ms),
+                host=args.host, port=args.port, log_level="warning")
+
+
+if __name__ == '__main__':
+    main()
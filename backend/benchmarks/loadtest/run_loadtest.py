@@ -0,0 +1,472 @@
+#!/usr/bin/env python3
+"""
+Load test the API against local stand-ins for GitHub, MongoDB and Backboard.
+
+    python run_loadtest.py --users 50 --concurrency 20 --duration 30 --output load.json
+    python run_loadtest.py --scenarios login,profile --mongo-uri mongodb://localhost:27017 --compare load.json
+
+Starts mongod (from PATH, on a throwaway dbpath) unless --mongo-uri is given,
+fake_github.py, fake_backboard.py and the API itself under uvicorn, runs the
+scenarios, and reports per-endpoint throughput, p50/p90/p99 latency and error
+counts as a table and as JSON. Scenarios:
+
+  login    every virtual user completes the GitHub OAuth callback at once;
+           first logins run the whole fetch/filter/publish pipeline
+  profile  logged-in users browse profile, predictive data and projects,
+           revalidating with If-None-Match part of the time
+  scoping  users create a project and hold a streamed scoping chat; time to
+           the first question token gets its own row
+
+profile and scoping log the users in first if login is not selected.
+"""
+import argparse
+import asyncio
+import json
+import math
+import os
+import platform
+import random
+import shutil
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+from collections import Counter, defaultdict
+from datetime import datetime
+from pathlib import Path
+from urllib.parse import parse_qs, urlparse
+
+import httpx
+
+BENCH_DIR = Path(__file__).parent
+BACKEND_DIR = BENCH_DIR.parent.parent
+SCENARIOS = ('login', 'profile', 'scoping')
+
+# (row label, path for a session) requested in order by each profile-browsing iteration
+PROFILE_ROUTES = [
+    ('GET /auth/github/user', lambda s: '/auth/github/user'),
+    ('GET /get-filtered-data/{github_username}', lambda s: f"/get-filtered-data/{s['username']}"),
+    ('GET /get-translated-data/{github_username}', lambda s: f"/get-translated-data/{s['username']}"),
+    ('GET /get-predictive-data/{github_username}', lambda s: f"/get-predictive-data/{s['username']}"),
+    ('GET /api/projects', lambda s: '/api/projects?limit=20'),
+]
+SCOPING_ANSWERS = [
+    "Small teams of student developers who need to split up hackathon work.",
+    "Must-haves are GitHub login, project creation and task assignment; chat can wait.",
+    "Next.js on the frontend, FastAPI and MongoDB on the backend.",
+    "Four weeks, two developers, no budget for paid services.",
+    "Teams finish a hackathon project with every task assigned on day one.",
+]
+TTFT_LABEL = 'scoping: time to first question token'
+
+
+def free_port():
+    with socket.socket() as s:
+        s.bind(('127.0.0.1', 0))
+        return s.getsockname()[1]
+
+
+def percentile(sorted_values, p):
+    """Nearest-rank percentile of an already sorted list"""
+    if not sorted_values:
+        return None
+    return sorted_values[max(0, math.ceil(p / 100 * len(sorted_values)) - 1)]
+
+
+def git_commit():
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output=True,
+                              text=True, cwd=BENCH_DIR, check=True).stdout.strip()
+    except (subprocess.CalledProcessError, OSError):
+        return None
+
+
+class Recorder:
+    """Latency samples and outcomes per endpoint label"""
+
+    def __init__(self):
+        self.samples = defaultdict(list)
+        self.errors = Counter()
+        self.statuses = defaultdict(Counter)
+
+    def record(self, label, seconds, ok, status):
+        self.samples[label].append(seconds)
+        self.statuses[label][str(status)] += 1
+        if not ok:
+            self.errors[label] += 1
+
+    def summary(self, wall_seconds):
+        rows = {}
+        for label, samples in self.samples.items():
+            ordered = sorted(samples)
+            rows[label] = {
+                'count': len(ordered),
+                'errors': self.errors[label],
+                'rps': round(len(ordered) / wall_seconds, 2) if wall_seconds else None,
+                **{f'p{p}_ms': round(percentile(ordered, p) * 1000, 1) for p in (50, 90, 99)},
+                'max_ms': round(ordered[-1] * 1000, 1),
+                'statuses': dict(self.statuses[label]),
+            }
+        return rows
+
+
+class LoadClient:
+    def __init__(self, base_url, recorder, timeout):
+        self.http = httpx.AsyncClient(base_url=base_url, timeout=timeout, follow_redirects=False,
+                                      limits=httpx.Limits(max_connections=None, max_keepalive_connections=None))
+        self.recorder = recorder
+
+    async def request(self, label, method, url, ok=(200,), **kwargs):
+        """Response, or None on a transport error; either way the outcome is recorded under label"""
+        start = time.perf_counter()
+        try:
+            response = await self.http.request(method, url, **kwargs)
+        except httpx.HTTPError as e:
+            self.recorder.record(label, time.perf_counter() - start, False, type(e).__name__)
+            return None
+        self.recorder.record(label, time.perf_counter() - start, response.status_code in ok, response.status_code)
+        return response
+
+    async def aclose(self):
+        await self.http.aclose()
+
+
+class Services:
+    """Subprocesses started for one run, each logging to its own file, stopped in reverse order"""
+
+    def __init__(self, log_dir):
+        self.log_dir = Path(log_dir)
+        self.log_dir.mkdir(parents=True, exist_ok=True)
+        self.procs = []
+
+    def start(self, name, cmd, env=None, cwd=None):
+        log = open(self.log_dir / f"{name}.log", 'wb')
+        proc = subprocess.Popen(cmd, env=env, cwd=cwd, stdout=log, stderr=subprocess.STDOUT)
+        self.procs.append((name, proc, log))
+        return proc
+
+    def log_path(self, name):
+        return self.log_dir / f"{name}.log"
+
+    def stop(self):
+        for name, proc, log in reversed(self.procs):
+            if proc.poll() is None:
+                proc.terminate()
+                try:
+                    proc.wait(timeout=10)
+                except subprocess.TimeoutExpired:
+                    proc.kill()
+            log.close()
+        self.procs = []
+
+
+async def wait_until_ready(name, url, proc, services, timeout=60):
+    deadline = time.monotonic() + timeout
+    async with httpx.AsyncClient(timeout=2) as http:
+        while time.monotonic() < deadline:
+            if proc.poll() is not None:
+                raise RuntimeError(f"{name} exited with {proc.returncode}; see {services.log_path(name)}")
+            try:
+                if (await http.get(url)).status_code < 500:
+                    return
+            except httpx.HTTPError:
+                pass
+            await asyncio.sleep(0.25)
+    raise RuntimeError(f"{name} not ready after {timeout}s; see {services.log_path(name)}")
+
+
+async def wait_for_mongo(uri, proc, services, timeout=60):
+    from pymongo import MongoClient
+    from pymongo.errors import PyMongoError
+
+    deadline = time.monotonic() + timeout
+    client = MongoClient(uri, serverSelectionTimeoutMS=1000)
+    try:
+        while time.monotonic() < deadline:
+            if proc is not None and proc.poll() is not None:
+                raise RuntimeError(f"mongod exited with {proc.returncode}; see {services.log_path('mongod')}")
+            try:
+                client.admin.command('ping')
+                return
+            except PyMongoError:
+                await asyncio.sleep(0.25)
+    finally:
+        client.close()
+    raise RuntimeError(f"MongoDB at {uri} not reachable after {timeout}s")
+
+
+async def start_stack(args, services, workdir):
+    """Start MongoDB, the fakes and the API; returns the API base URL"""
+    mongo_uri, mongod = args.mongo_uri, None
+    if not mongo_uri:
+        binary = shutil.which('mongod')
+        if not binary:
+            raise SystemExit("mongod not found on PATH; install MongoDB or pass --mongo-uri")
+        port = free_port()
+        dbpath = workdir / 'db'
+        dbpath.mkdir()
+        mongod = services.start('mongod', [binary, '--dbpath', str(dbpath), '--port', str(port),
+                                           '--bind_ip', '127.0.0.1'])
+        mongo_uri = f"mongodb://127.0.0.1:{port}"
+    await wait_for_mongo(mongo_uri, mongod, services)
+    print(f"✓ MongoDB at {mongo_uri}")
+
+    github_port, backboard_port, api_port = free_port(), free_port(), free_port()
+    github = services.start('fake_github', [
+        sys.executable, str(BENCH_DIR / 'fake_github.py'), '--port', str(github_port),
+        '--latency-ms', str(args.github_latency_ms), '--git-latency-ms', str(args.git_latency_ms),
+        '--repos', str(args.repos), '--repo-root', str(workdir / 'github')
+    ] + (['--shared-repos'] if args.shared_repos else []))
+    backboard = services.start('fake_backboard', [
+        sys.executable, str(BENCH_DIR / 'fake_backboard.py'), '--port', str(backboard_port),
+        '--first-token-ms', str(args.backboard_first_token_ms), '--chunk-ms', str(args.backboard_chunk_ms)
+    ])
+    github_url = f"http://127.0.0.1:{github_port}"
+    backboard_url = f"http://127.0.0.1:{backboard_port}"
+    await wait_until_ready('fake_github', f"{github_url}/health", github, services)
+    await wait_until_ready('fake_backboard', f"{backboard_url}/health", backboard, services)
+
+    env = dict(
+        os.environ,
+        MONGO_URI=mongo_uri,
+        GITHUB_OAUTH_URL=github_url, GITHUB_API_URL=github_url, GITHUB_WEB_URL=github_url,
+        GITHUB_CLIENT_ID='loadtest', GITHUB_CLIENT_SECRET='loadtest', GITHUB_PERSACCESS_TOKEN='loadtest',
+        BACKBOARD_BASE_URL=backboard_url, BACKBOARD_KEY='loadtest',
+        SECRET_KEY='loadtest-secret',
+        PIPELINE_WORK_DIR=str(workdir / 'pipeline'),
+        ARTIFACT_STORAGE='local', ARTIFACT_STORAGE_DIR=str(workdir / 'artifacts'),
+        REPO_STORE_DIR=str(workdir / 'repo_store'),
+    )
+    api = services.start('api', [
+        sys.executable, '-m', 'uvicorn', 'main:app', '--host', '127.0.0.1', '--port', str(api_port),
+        '--workers', str(args.workers), '--log-level', 'warning'
+    ], env=env, cwd=str(BACKEND_DIR))
+    api_url = f"http://127.0.0.1:{api_port}"
+    await wait_until_ready('api', f"{api_url}/health", api, services, timeout=120)
+    print(f"✓ API at {api_url} ({args.workers} worker(s)); logs in {services.log_dir}")
+    return api_url
+
+
+async def login_scenario(client, logins, concurrency):
+    """Sessions ({token, username, user_id}) for every login that completed the OAuth callback"""
+    label = 'GET /auth/github/callback'
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def login(name):
+        async with semaphore:
+            start = time.perf_counter()
+            try:
+                response = await client.http.get('/auth/github/callback', params={'code': name, 'state': 'load'})
+            except httpx.HTTPError as e:
+                client.recorder.record(label, time.perf_counter() - start, False, type(e).__name__)
+                return None
+        query = parse_qs(urlparse(response.headers.get('location', '')).query)
+        ok = response.status_code in (302, 307) and 'token' in query
+        client.recorder.record(label, time.perf_counter() - start, ok, response.status_code)
+        if ok:
+            return {key: query[key][0] for key in ('token', 'username', 'user_id')}
+
+    sessions = await asyncio.gather(*(login(name) for name in logins))
+    return [s for s in sessions if s]
+
+
+async def profile_scenario(client, sessions, concurrency, deadline, revalidate_ratio, rng):
+    etags = {}
+
+    async def worker():
+        while time.monotonic() < deadline:
+            session = rng.choice(sessions)
+            for label, path in PROFILE_ROUTES:
+                url = path(session)
+                headers = {'Authorization': f"Bearer {session['token']}", 'Accept-Encoding': 'gzip, br'}
+                etag = etags.get((session['user_id'], url))
+                if etag and rng.random() < revalidate_ratio:
+                    headers['If-None-Match'] = etag
+                response = await client.request(label, 'GET', url, ok=(200, 304), headers=headers)
+                if response is not None and response.headers.get('etag'):
+                    etags[(session['user_id'], url)] = response.headers['etag']
+
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+
+
+async def scoping_turn(client, url, body, headers):
+    """(done event or None, thread id from the stream) for one streamed scoping reply, recording latency and TTFT"""
+    label = 'POST /api/projects/{project_id}/chat/stream'
+    start = time.perf_counter()
+    first_token, done, thread_id, status, event = None, None, None, None, None
+    try:
+        async with client.http.stream('POST', url, json=body, headers=headers) as response:
+            status = response.status_code
+            async for line in response.aiter_lines():
+                if line.startswith('event: '):
+                    event = line[len('event: '):]
+                elif line.startswith('data: '):
+                    if event == 'question_delta' and first_token is None:
+                        first_token = time.perf_counter() - start
+                    elif event == 'thread':
+                        thread_id = json.loads(line[len('data: '):])['thread_id']
+                    elif event == 'done':
+                        done = json.loads(line[len('data: '):])
+                    elif event == 'error':
+                        break
+    except httpx.HTTPError as e:
+        status = type(e).__name__
+    client.recorder.record(label, time.perf_counter() - start, status == 200 and done is not None, status)
+    if first_token is not None:
+        client.recorder.record(TTFT_LABEL, first_token, True, status)
+    return done, thread_id
+
+
+async def scoping_scenario(client, sessions, concurrency, deadline, max_turns, rng):
+    async def chat(session):
+        headers = {'Authorization': f"Bearer {session['token']}"}
+        response = await client.request('POST /api/projects', 'POST', '/api/projects', headers=headers, json={
+            'name': f"Load test {rng.randrange(10 ** 6)}",
+            'goal': "Help hackathon teams split up work by skill",
+            'dueDate': '2030-01-01', 'mode': 'solo', 'repoOption': 'new',
+        })
+        if response is None or response.status_code != 200:
+            return
+        url = f"/api/projects/{response.json()['projectId']}/chat/stream"
+        session_id = None
+        for turn in range(max_turns):
+            body = {'message': SCOPING_ANSWERS[turn % len(SCOPING_ANSWERS)], 'session_id': session_id}
+            done, thread_id = await scoping_turn(client, url, body, headers)
+            if done is None or done.get('complete') or time.monotonic() >= deadline:
+                return
+            session_id = thread_id or done.get('thread_id')
+
+    async def worker():
+        while time.monotonic() < deadline:
+            await chat(rng.choice(sessions))
+
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+
+
+async def run(args, services, workdir):
+    api_url = await start_stack(args, services, workdir)
+    rng = random.Random(args.seed)
+    scenarios = [s.strip() for s in args.scenarios.split(',') if s.strip()]
+    logins = [f"{args.user_prefix}{i}" for i in range(args.users)]
+    runs = []
+
+    client = LoadClient(api_url, Recorder(), args.timeout)
+    try:
+        if 'login' not in scenarios:
+            print("Logging users in (not measured)...")
+        start = time.monotonic()
+        sessions = await login_scenario(client, logins, args.concurrency)
+        wall = time.monotonic() - start
+        if 'login' in scenarios:
+            runs.append({'scenario': 'login', 'seconds': round(wall, 2), 'endpoints': client.recorder.summary(wall)})
+            print_table('login', runs[-1])
+        if not sessions:
+            raise RuntimeError(f"No user could log in; see {services.log_path('api')}")
+
+        for scenario in ('profile', 'scoping'):
+            if scenario not in scenarios:
+                continue
+            client.recorder = Recorder()
+            start = time.monotonic()
+            deadline = start + args.duration
+            if scenario == 'profile':
+                await profile_scenario(client, sessions, args.concurrency, deadline, args.revalidate_ratio, rng)
+            else:
+                await scoping_scenario(client, sessions, args.concurrency, deadline, args.scoping_turns, rng)
+            wall = time.monotonic() - start
+            runs.append({'scenario': scenario, 'seconds': round(wall, 2), 'endpoints': client.recorder.summary(wall)})
+            print_table(scenario, runs[-1])
+    finally:
+        await client.aclose()
+    return runs
+
+
+def print_table(scenario, result):
+    print(f"\n{scenario} ({result['seconds']}s):")
+    print(f"  {'endpoint':<48} {'count':>7} {'err':>5} {'req/s':>8} {'p50 ms':>8} {'p90 ms':>8} {'p99 ms':>8}")
+    for label, row in sorted(result['endpoints'].items()):
+        print(f"  {label:<48} {row['count']:>7} {row['errors']:>5} {row['rps']:>8} "
+              f"{row['p50_ms']:>8} {row['p90_ms']:>8} {row['p99_ms']:>8}")
+
+
+def compare(results, baseline_file):
+    """Print per-endpoint p99 and throughput ratios against an earlier results file"""
+    with open(baseline_file, 'r', encoding='utf-8') as f:
+        baseline = json.load(f)
+    old_runs = {run['scenario']: run for run in baseline['runs']}
+
+    print(f"\nComparison against {baseline_file} (commit {baseline.get('commit')}):")
+    for run in results['runs']:
+        old = old_runs.get(run['scenario'])
+        if not old:
+            continue
+        print(f"  {run['scenario']}:")
+        for label, row in sorted(run['endpoints'].items()):
+            old_row = old['endpoints'].get(label)
+            if not old_row or not old_row['p99_ms'] or not old_row['rps']:
+                continue
+            ratio = row['p99_ms'] / old_row['p99_ms']
+            flag = '  REGRESSION' if ratio > 1.1 else ''
+            print(f"    {label:.<48} p99 {old_row['p99_ms']:8.1f} -> {row['p99_ms']:8.1f} ms  x{ratio:.2f}  "
+                  f"req/s {old_row['rps']} -> {row['rps']}{flag}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Load test the API against local stand-ins")
+    parser.add_argument('--scenarios', default=','.join(SCENARIOS), help="comma-separated: %s" % ','.join(SCENARIOS))
+    parser.add_argument('--users', type=int, default=20, help="virtual users (distinct GitHub logins)")
+    parser.add_argument('--user-prefix', default='loaduser')
+    parser.add_argument('--concurrency', type=int, default=10, help="concurrent virtual users per scenario")
+    parser.add_argument('--duration', type=float, default=30, help="seconds each of profile/scoping runs")
+    parser.add_argument('--revalidate-ratio', type=float, default=0.5, help="share of profile reads sent with If-None-Match")
+    parser.add_argument('--scoping-turns', type=int, default=4, help="messages per scoping chat at most")
+    parser.add_argument('--workers', type=int, default=1, help="uvicorn worker processes for the API")
+    parser.add_argument('--mongo-uri', default=None, help="use this MongoDB instead of starting mongod")
+    parser.add_argument('--repos', type=int, default=3, help="repositories per fake GitHub user")
+    parser.add_argument('--shared-repos', action='store_true', help="all fake users list the same repositories")
+    parser.add_argument('--github-latency-ms', type=int, default=50)
+    parser.add_argument('--git-latency-ms', type=int, default=0)
+    parser.add_argument('--backboard-first-token-ms', type=int, default=300)
+    parser.add_argument('--backboard-chunk-ms', type=int, default=20)
+    parser.add_argument('--timeout', type=float, default=180, help="per-request client timeout in seconds")
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--keep', action='store_true', help="keep the work directory (logs, dbpath, artifacts)")
+    parser.add_argument('--output', default='loadtest_results.json')
+    parser.add_argument('--compare', default=None, help="earlier results file to diff against")
+    args = parser.parse_args()
+
+    unknown = set(s.strip() for s in args.scenarios.split(',')) - set(SCENARIOS)
+    if unknown:
+        parser.error(f"unknown scenarios {sorted(unknown)}")
+
+    workdir = Path(tempfile.mkdtemp(prefix='divergence-loadtest-'))
+    services = Services(workdir / 'logs')
+    try:
+        runs = asyncio.run(run(args, services, workdir))
+    finally:
+        services.stop()
+        if args.keep:
+            print(f"\nKept work directory {workdir}")
+        else:
+            shutil.rmtree(workdir, ignore_errors=True)
+
+    results = {
+        'commit': git_commit(),
+        'timestamp': datetime.now().isoformat(),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'cpu_count': os.cpu_count(),
+        'params': {key: value for key, value in vars(args).items() if key not in ('output', 'compare', 'keep')},
+        'runs': runs
+    }
+    with open(args.output, 'w', encoding='utf-8') as f:
+        json.dump(results, f, indent=2)
+    print(f"\nSaved results to {args.output}")
+
+    if args.compare:
+        compare(results, args.compare)
+
+
+if __name__ == '__main__':
+    main()
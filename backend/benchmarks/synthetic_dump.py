@@ -0,0 +1,165 @@
+#!/usr/bin/env python3
+"""Generate synthetic GitHub dumps in the GithubFetchPythonValt2.py output format"""
+import json
+import random
+import sys
+from datetime import datetime, timedelta
+
+SEPARATOR = '=' * 80
+
+DEFAULT_MIX = {
+    'python': 35, 'javascript': 20, 'typescript': 15, 'go': 5,
+    'rust': 5, 'java': 5, 'markdown': 10, 'json': 5
+}
+
+EXTENSIONS = {
+    'python': '.py', 'javascript': '.js', 'typescript': '.ts', 'go': '.go',
+    'rust': '.rs', 'java': '.java', 'markdown': '.md', 'json': '.json'
+}
+
+PY_PACKAGES = ['numpy', 'pandas', 'requests', 'flask', 'fastapi', 'click', 'rich', 'pytest',
+               'torch', 'sklearn', 'argparse', 'collections', 'functools', 'itertools', 'json']
+JS_PACKAGES = ['react', 'next', 'express', 'lodash', 'axios', '@nestjs/core', 'vue', 'zod',
+               'jest', '@tanstack/react-query', 'node:fs', 'path']
+GO_PACKAGES = ['fmt', 'net/http', 'github.com/gin-gonic/gin', 'github.com/stretchr/testify/assert']
+RUST_CRATES = ['serde', 'tokio', 'clap', 'anyhow', 'std']
+JAVA_PACKAGES = ['java.util.List', 'org.springframework.boot.SpringApplication', 'com.google.gson.Gson']
+PROSE = ('Import the data from the source and then you can run the tool. '
+         'This module was written to test the pipeline, and you should use the CLI from the repo root. ')
+
+
+def parse_size(text):
+    """'1MB' / '100MB' / '1GB' -> bytes"""
+    text = text.strip().upper()
+    for suffix, factor in (('GB', 1024 ** 3), ('MB', 1024 ** 2), ('KB', 1024), ('B', 1)):
+        if text.endswith(suffix):
+            return int(float(text[:-len(suffix)]) * factor)
+    return int(text)
+
+
+def parse_mix(text):
+    """'python=40,javascript=30' -> {'python': 40, 'javascript': 30}"""
+    mix = {}
+    for part in text.split(','):
+        language, weight = part.split('=')
+        if language not in EXTENSIONS:
+            raise ValueError(f"Unknown language {language!r} (choose from {', '.join(EXTENSIONS)})")
+        mix[language] = float(weight)
+    return mix
+
+
+def _python_file(rng):
+    imports = '\n'.join(f"import {pkg}" if rng.random() < 0.5 else f"from {pkg} import thing"
+                        for pkg in rng.sample(PY_PACKAGES, 4))
+    body = '\n\n'.join(
+        f'def func_{i}(x):\n    """{PROSE}"""\n    assert x is not None\n    return x * {i}'
+        for i in range(rng.randint(5, 30))
+    )
+    return f"{imports}\n\n{body}\n"
+
+
+def _javascript_file(rng):
+    lines = [f"import {{ thing{i} }} from '{pkg}';" for i, pkg in enumerate(rng.sample(JS_PACKAGES, 4))]
+    lines.append(f"const util = require('{rng.choice(JS_PACKAGES)}');")
+    lines.extend(f"export function handler{i}(req, res) {{ return res.json({{ ok: {i} }}); }}"
+                 for i in range(rng.randint(5, 30)))
+    return '\n'.join(lines) + '\n'
+
+
+def _go_file(rng):
+    imports = '\n'.join(f'\t"{pkg}"' for pkg in rng.sample(GO_PACKAGES, 3))
+    body = '\n'.join(f"func Handler{i}() int {{ return {i} }}" for i in range(rng.randint(5, 30)))
+    return f"package main\n\nimport (\n{imports}\n)\n\n{body}\n"
+
+
+def _rust_file(rng):
+    uses = '\n'.join(f"use {crate}::prelude::*;" for crate in rng.sample(RUST_CRATES, 3))
+    body = '\n'.join(f"fn step_{i}() -> u32 {{ {i} }}" for i in range(rng.randint(5, 30)))
+    return f"{uses}\n\n{body}\n"
+
+
+def _java_file(rng):
+    imports = '\n'.join(f"import {pkg};" for pkg in JAVA_PACKAGES)
+    body = '\n'.join(f"    public int method{i}() {{ return {i}; }}" for i in range(rng.randint(5, 30)))
+    return f"{imports}\n\npublic class Main {{\n{body}\n}}\n"
+
+
+def _markdown_file(rng):
+    return '# Project\n\n' + PROSE * rng.randint(5, 40) + '\n'
+
+
+def _json_file(rng):
+    deps = {pkg: f"^{rng.randint(1, 9)}.{rng.randint(0, 20)}.0" for pkg in rng.sample(JS_PACKAGES[:8], 5)}
+    return json.dumps({'name': 'app', 'dependencies': deps, 'devDependencies': {'jest': '^29.0.0'}}, indent=2)
+
+
+GENERATORS = {
+    'python': _python_file, 'javascript': _javascript_file, 'typescript': _javascript_file,
+    'go': _go_file, 'rust': _rust_file, 'java': _java_file,
+    'markdown': _markdown_file, 'json': _json_file
+}
+
+
+def _minified_file(rng):
+    """One enormous line, like a committed bundle"""
+    return ';'.join(f"var a{i}=require('{rng.choice(JS_PACKAGES)}')" for i in range(5000)) + '\n'
+
+
+def _pathological_file(rng):
+    """Lines built to stress the regex detectors (long dotted chains, repeated keywords, dates)"""
+    start = datetime(2024, 1, 1)
+    dates = ' '.join((start + timedelta(hours=i)).strftime('%Y-%m-%dT%H:%M:%S') for i in range(200))
+    return '\n'.join([
+        'x = ' + '.a' * 50000,
+        'import ' + ' import' * 20000,
+        'from ' * 20000 + 'x',
+        '# ' + dates,
+    ]) + '\n'
+
+
+def generate_dump(output_file, target_bytes, mix=None, repos=5, minified_ratio=0.02,
+                  pathological_ratio=0.005, seed=0):
+    """Stream a dump of roughly target_bytes to output_file; returns bytes written"""
+    rng = random.Random(seed)
+    mix = mix or DEFAULT_MIX
+    languages = list(mix)
+    weights = [mix[language] for language in languages]
+    per_repo = max(target_bytes // repos, 1)
+    written = 0
+
+    with open(output_file, 'w', encoding='utf-8') as f:
+        written += f.write(f"GitHub Repositories Dump\nUser: synthetic\n{SEPARATOR}\n\n")
+
+        for r in range(repos):
+            written += f.write(f"\n{SEPARATOR}\nREPOSITORY: synthetic-repo-{r}\n{SEPARATOR}\n\n")
+            repo_end = written + per_repo
+            n = 0
+
+            while written < repo_end:
+                roll = rng.random()
+                if roll < pathological_ratio:
+                    path, content = f"gen/pathological_{n}.py", _pathological_file(rng)
+                elif roll < pathological_ratio + minified_ratio:
+                    path, content = f"static/bundle_{n}.js", _minified_file(rng)
+                else:
+                    language = rng.choices(languages, weights)[0]
+                    folder = 'tests' if rng.random() < 0.2 else 'src'
+                    path = f"{folder}/module_{n}{EXTENSIONS[language]}"
+                    content = GENERATORS[language](rng)
+                n += 1
+
+                written += f.write(f"\n{SEPARATOR}\nFILE: {path}\n{SEPARATOR}\n\n")
+                written += f.write(content)
+                written += f.write("\n\n")
+
+    return written
+
+
+if __name__ == '__main__':
+    if len(sys.argv) < 3:
+        print("Usage: python synthetic_dump.py <output_file> <size e.g. 100MB> [language=weight,...]")
+        sys.exit(1)
+
+    mix = parse_mix(sys.argv[3]) if len(sys.argv) > 3 else None
+    size = generate_dump(sys.argv[1], parse_size(sys.argv[2]), mix)
+    print(f"Wrote {size / 1024 / 1024:.1f} MB to {sys.argv[1]}")
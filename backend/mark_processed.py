@@ -15,7 +15,7 @@ db = client.divergence
 # Mark GitShard1 as processed
 result = db.users.update_one(
     {'username': 'GitShard1'},
-    {'$set': {'github_processed': True, 'processed_at': datetime.utcnow()}}
+    {'$set': {'github_processed': True, 'processed_at': datetime.utcnow()}, '$inc': {'doc_version': 1}}
 )
 
 print(f"Marked GitShard1 as processed")
@@ -0,0 +1,17 @@
+from pydantic import BaseModel
+
+class Principal(BaseModel):
+    """Authenticated caller, resolved from the access token"""
+    user_id: str
+    username: str
+    avatar_url: str = ""
+    doc_version: int = 0  # users document version; every users write (login, processed flag) bumps it
+
+    @classmethod
+    def from_user(cls, user: dict):
+        return cls(
+            user_id=str(user["_id"]),
+            username=user["username"],
+            avatar_url=user.get("avatar_url") or "",
+            doc_version=user.get("doc_version", 0)
+        )
@@ -0,0 +1,9 @@
+from pydantic import BaseModel, Field
+from typing import Dict, Literal
+
+class TeammateSearch(BaseModel):
+    """Target profile for a teammate search"""
+    vector: Dict[str, float] = Field(..., description="SkillVector or CapabilityAssessment scores by name")
+    space: Literal["skill", "capability"] = "skill"
+    mode: Literal["similar", "complementary"] = "similar"
+    k: int = Field(default=5, ge=1, le=100)
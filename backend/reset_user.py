@@ -14,7 +14,7 @@ db = client.divergence
 # Reset the processed flag for GitShard1
 result = db.users.update_one(
     {'username': 'GitShard1'},
-    {'$set': {'github_processed': False}}
+    {'$set': {'github_processed': False}, '$inc': {'doc_version': 1}}
 )
 
 print(f"Reset github_processed flag for GitShard1")
@@ -0,0 +1,205 @@
+import os
+import shutil
+import tempfile
+from functools import lru_cache
+from pathlib import Path
+
+import certifi
+import gridfs
+from pymongo import MongoClient
+
+try:
+    import boto3
+    from botocore.exceptions import ClientError
+except ImportError:  # only needed for ARTIFACT_STORAGE=s3
+    boto3 = None
+
+# Where per-user pipeline artifacts (RESULTS.txt, filtered.json, translated.json, ...) live
+ARTIFACT_STORAGE = os.getenv("ARTIFACT_STORAGE", "local")  # local | gridfs | s3
+ARTIFACT_STORAGE_DIR = Path(os.getenv("ARTIFACT_STORAGE_DIR", Path(__file__).parent.parent / "translation"))
+ARTIFACT_GRIDFS_BUCKET = os.getenv("ARTIFACT_GRIDFS_BUCKET", "artifacts")
+ARTIFACT_S3_BUCKET = os.getenv("ARTIFACT_S3_BUCKET", "divergence-artifacts")
+ARTIFACT_S3_ENDPOINT_URL = os.getenv("ARTIFACT_S3_ENDPOINT_URL")  # e.g. http://localhost:9000 for MinIO
+
+# Files the pipeline produces per user, in upload order
+PIPELINE_ARTIFACTS = ["RESULTS.txt", "repos.json", "filtered.json", "translated.json"]
+
+CHUNK_SIZE = 1 << 20
+
+
+def artifact_key(user_id, name):
+    return f"{user_id}/{name}"
+
+
+class ArtifactNotFound(KeyError):
+    """No artifact stored under this key"""
+
+
+class LocalArtifactStorage:
+    """Artifacts as files under one root directory (the default; the pipeline's own output dir)"""
+
+    def __init__(self, root=ARTIFACT_STORAGE_DIR):
+        self.root = Path(root).resolve()
+
+    def _path(self, key):
+        path = (self.root / key).resolve()
+        if self.root not in path.parents:
+            raise ValueError(f"Artifact key escapes the storage root: {key!r}")
+        return path
+
+    def open(self, key):
+        """Binary stream over the artifact (close it, or use it as a context manager)"""
+        try:
+            return open(self._path(key), "rb")
+        except FileNotFoundError:
+            raise ArtifactNotFound(key)
+
+    def read_bytes(self, key):
+        with self.open(key) as f:
+            return f.read()
+
+    def write(self, key, stream):
+        """Store everything read from a binary stream (atomic replace)"""
+        path = self._path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                shutil.copyfileobj(stream, f, CHUNK_SIZE)
+            os.replace(tmp, path)
+        except BaseException:
+            os.unlink(tmp)
+            raise
+
+    def holds(self, key, source):
+        """True when source already is the stored file (the pipeline wrote straight into storage)"""
+        return Path(source).resolve() == self._path(key)
+
+    def upload_file(self, key, source):
+        if self.holds(key, source):
+            return
+        with open(source, "rb") as f:
+            self.write(key, f)
+
+    def modified_at(self, key):
+        """Last write time (epoch seconds), None if missing"""
+        try:
+            return self._path(key).stat().st_mtime
+        except FileNotFoundError:
+            return None
+
+    def delete(self, key):
+        self._path(key).unlink(missing_ok=True)
+
+
+class GridFSArtifactStorage:
+    """Artifacts in a MongoDB GridFS bucket; the newest revision of a filename wins"""
+
+    def __init__(self, database, bucket_name=ARTIFACT_GRIDFS_BUCKET):
+        self.bucket = gridfs.GridFSBucket(database, bucket_name=bucket_name)
+        self.files = database[f"{bucket_name}.files"]
+
+    def open(self, key):
+        try:
+            return self.bucket.open_download_stream_by_name(key)
+        except gridfs.errors.NoFile:
+            raise ArtifactNotFound(key)
+
+    def read_bytes(self, key):
+        with self.open(key) as f:
+            return f.read()
+
+    def write(self, key, stream):
+        new_id = self.bucket.upload_from_stream(key, stream, chunk_size_bytes=CHUNK_SIZE)
+        # Readers always pick the newest revision; drop the older ones once it is complete
+        for old in self.files.find({"filename": key, "_id": {"$ne": new_id}}, {"_id": 1}):
+            self.bucket.delete(old["_id"])
+
+    def holds(self, key, source):
+        return False
+
+    def upload_file(self, key, source):
+        with open(source, "rb") as f:
+            self.write(key, f)
+
+    def modified_at(self, key):
+        doc = self.files.find_one({"filename": key}, {"uploadDate": 1}, sort=[("uploadDate", -1)])
+        return doc["uploadDate"].timestamp() if doc else None
+
+    def delete(self, key):
+        for old in self.files.find({"filename": key}, {"_id": 1}):
+            self.bucket.delete(old["_id"])
+
+
+class S3ArtifactStorage:
+    """Artifacts in an S3-compatible bucket (AWS S3, MinIO, ...); credentials come from the usual AWS env vars"""
+
+    def __init__(self, bucket=ARTIFACT_S3_BUCKET, endpoint_url=ARTIFACT_S3_ENDPOINT_URL):
+        if boto3 is None:
+            raise RuntimeError("ARTIFACT_STORAGE=s3 requires boto3 (pip install boto3)")
+        self.bucket = bucket
+        self.client = boto3.client("s3", endpoint_url=endpoint_url)
+
+    def _missing(self, error):
+        return error.response.get("Error", {}).get("Code") in ("404", "NoSuchKey", "NotFound")
+
+    def open(self, key):
+        try:
+            return self.client.get_object(Bucket=self.bucket, Key=key)["Body"]
+        except ClientError as e:
+            if self._missing(e):
+                raise ArtifactNotFound(key)
+            raise
+
+    def read_bytes(self, key):
+        body = self.open(key)
+        try:
+            return body.read()
+        finally:
+            body.close()
+
+    def write(self, key, stream):
+        # Multipart upload in CHUNK_SIZE parts, so large dumps are never held in memory
+        self.client.upload_fileobj(stream, self.bucket, key)
+
+    def holds(self, key, source):
+        return False
+
+    def upload_file(self, key, source):
+        self.client.upload_file(str(source), self.bucket, key)
+
+    def modified_at(self, key):
+        try:
+            return self.client.head_object(Bucket=self.bucket, Key=key)["LastModified"].timestamp()
+        except ClientError as e:
+            if self._missing(e):
+                return None
+            raise
+
+    def delete(self, key):
+        self.client.delete_object(Bucket=self.bucket, Key=key)
+
+
+@lru_cache(maxsize=1)
+def get_artifact_storage(mongo_uri=None):
+    """The configured storage backend (one per process); mongo_uri is the app's database for gridfs"""
+    if ARTIFACT_STORAGE == "local":
+        return LocalArtifactStorage()
+    if ARTIFACT_STORAGE == "gridfs":
+        uri = os.getenv("ARTIFACT_MONGO_URI") or mongo_uri
+        client = MongoClient(uri, tlsCAFile=certifi.where()) if uri.startswith("mongodb+srv") else MongoClient(uri)
+        return GridFSArtifactStorage(client.divergence)
+    if ARTIFACT_STORAGE == "s3":
+        return S3ArtifactStorage()
+    raise ValueError(f"Unknown ARTIFACT_STORAGE {ARTIFACT_STORAGE!r} (local, gridfs or s3)")
+
+
+def publish_pipeline_artifacts(storage, user_id, user_dir):
+    """Stream the pipeline's output files from its scratch directory into storage"""
+    published = []
+    for name in PIPELINE_ARTIFACTS:
+        source = Path(user_dir) / name
+        if source.exists():
+            storage.upload_file(artifact_key(user_id, name), source)
+            published.append(name)
+    return published
@@ -0,0 +1,63 @@
+import asyncio
+import hashlib
+from datetime import datetime
+
+from services.tracing import span
+
+
+def prompt_hash(name, description):
+    """Version key for an assistant definition"""
+    return hashlib.sha256(f"{name}\x1f{description}".encode("utf-8")).hexdigest()
+
+
+class AssistantRegistry:
+    """Backboard assistants created once per (name, prompt) version and reused, ids kept in MongoDB"""
+
+    def __init__(self, client, collection):
+        self.client = client
+        self.collection = collection
+        self._ids = {}
+        self._locks = {}
+
+    async def get(self, name, description):
+        """Assistant id for this definition, creating the assistant only if no worker has yet"""
+        key = prompt_hash(name, description)
+        if key in self._ids:
+            return self._ids[key]
+        lock = self._locks.setdefault(key, asyncio.Lock())
+        async with lock:
+            if key not in self._ids:
+                self._ids[key] = await self._load_or_create(key, name, description)
+        return self._ids[key]
+
+    async def _load_or_create(self, key, name, description):
+        stored = await self.collection.find_one({"prompt_hash": key}, {"assistant_id": 1})
+        if stored:
+            return stored["assistant_id"]
+
+        with span("backboard", "create_assistant"):
+            assistant = await self.client.create_assistant(name=name, description=description)
+        created_id = str(assistant.assistant_id)
+        await self.collection.update_one(
+            {"prompt_hash": key},
+            {"$setOnInsert": {"prompt_hash": key, "name": name, "assistant_id": created_id,
+                              "created_at": datetime.utcnow()}},
+            upsert=True
+        )
+        # Another worker may have stored its assistant first; keep that one and drop ours
+        stored = await self.collection.find_one({"prompt_hash": key}, {"assistant_id": 1})
+        if stored["assistant_id"] != created_id:
+            try:
+                with span("backboard", "delete_assistant"):
+                    await self.client.delete_assistant(created_id)
+            except Exception as e:
+                print(f"⚠ Could not delete duplicate assistant {created_id}: {e}")
+        else:
+            print(f"✓ Created Backboard assistant {name!r} ({created_id}) for prompt {key[:12]}")
+        return stored["assistant_id"]
+
+    async def forget(self, name, description):
+        """Drop a stored assistant that no longer exists on Backboard (the next get creates a new one)"""
+        key = prompt_hash(name, description)
+        self._ids.pop(key, None)
+        await self.collection.delete_one({"prompt_hash": key})
@@ -0,0 +1,29 @@
+import hashlib
+
+from fastapi.responses import Response
+
+
+def strong_etag(*parts):
+    """Quoted strong ETag from version parts (artifact hashes, document versions, ...)"""
+    digest = hashlib.sha256("\x1f".join(str(part) for part in parts).encode("utf-8")).hexdigest()
+    return f'"{digest[:32]}"'
+
+
+def etag_matches(if_none_match, etag):
+    """If-None-Match comparison (weak, as RFC 9110 requires for this header)"""
+    if not if_none_match or not etag:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    candidates = (tag.strip() for tag in if_none_match.split(","))
+    return etag in (tag[2:] if tag.startswith("W/") else tag for tag in candidates)
+
+
+def not_modified(etag):
+    return Response(status_code=304, headers={"ETag": etag})
+
+
+def with_etag(response, etag):
+    if etag:
+        response.headers["ETag"] = etag
+    return response
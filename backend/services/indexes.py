@@ -0,0 +1,167 @@
+"""
+Index bootstrap for the divergence database.
+
+    python -m services.indexes [mongodb://localhost:27017]
+
+Backfills fields that older documents lack (projects.participants), creates
+every declared index, then explains each hot query and exits non-zero if any
+of them plans a collection scan.
+"""
+import asyncio
+import os
+import sys
+from datetime import datetime
+
+from motor.motor_asyncio import AsyncIOMotorClient
+from pymongo import ASCENDING, DESCENDING, IndexModel, UpdateOne
+from pymongo.errors import OperationFailure, PyMongoError
+
+from services.project_listing import project_members
+
+# Set to run the query-plan check at API startup as well (fails startup on a COLLSCAN)
+MONGO_VERIFY_INDEXES = os.getenv("MONGO_VERIFY_INDEXES", "") not in ("", "0", "false")
+
+# Indexes each collection needs, by collection name
+INDEXES = {
+    "users": [
+        IndexModel([("username", ASCENDING)], name="username_unique", unique=True),
+        IndexModel([("github_id", ASCENDING)], name="github_id_unique", unique=True),
+    ],
+    "github_data": [
+        IndexModel([("user_id", ASCENDING)], name="user_id_unique", unique=True),
+        # Team compatibility loads member profiles by username
+        IndexModel([("username", ASCENDING)], name="username"),
+    ],
+    "projects": [
+        IndexModel([("project_id", ASCENDING)], name="project_id_unique", unique=True),
+        # Keyset pagination for list_projects: equality on participants, then the sort keys
+        IndexModel([("participants", ASCENDING), ("createdAt", DESCENDING), ("project_id", DESCENDING)],
+                   name="participants_created"),
+        # continue-scoping finds the project that opened a thread
+        IndexModel([("scopingThreadId", ASCENDING)], name="scoping_thread_id", sparse=True),
+    ],
+    "project_compatibility": [
+        IndexModel([("project_id", ASCENDING)], name="project_id_unique", unique=True),
+        IndexModel([("members", ASCENDING)], name="members"),
+    ],
+    "predictive_data": [
+        IndexModel([("user_id", ASCENDING)], name="user_id_unique", unique=True),
+    ],
+    "pipeline_runs": [
+        IndexModel([("started_at", DESCENDING)], name="started_at"),
+    ],
+    "backboard_assistants": [
+        IndexModel([("prompt_hash", ASCENDING)], name="prompt_hash_unique", unique=True),
+    ],
+}
+
+# (collection, filter, sort) shapes the API issues on request paths
+HOT_QUERIES = [
+    ("users", {"username": "octocat"}, None),
+    ("users", {"github_id": 1}, None),
+    ("github_data", {"user_id": "0"}, None),
+    ("github_data", {"username": {"$in": ["octocat", "hubot"]}}, None),
+    ("projects", {"project_id": "0"}, None),
+    ("projects", {"participants": "octocat"}, [("createdAt", DESCENDING), ("project_id", DESCENDING)]),
+    ("projects", {"participants": "octocat", "$or": [{"createdAt": {"$lt": datetime(2030, 1, 1)}},
+                                                     {"createdAt": datetime(2030, 1, 1), "project_id": {"$lt": "0"}}]},
+     [("createdAt", DESCENDING), ("project_id", DESCENDING)]),
+    ("projects", {"scopingThreadId": "0"}, None),
+    ("project_compatibility", {"project_id": "0"}, None),
+    ("project_compatibility", {"members": "octocat"}, None),
+    ("predictive_data", {"user_id": "0", "translated_hash": "0", "model_version": "0"}, None),
+    ("pipeline_runs", {"started_at": {"$gte": datetime(2030, 1, 1)}}, None),
+]
+
+
+async def backfill_participants(db):
+    """Set participants on projects created before list_projects queried it (they were missing from every listing)"""
+    updates = [
+        UpdateOne({"_id": project["_id"]}, {"$set": {"participants": project_members(project)}})
+        async for project in db.projects.find({"participants": {"$exists": False}},
+                                              {"ownerUsername": 1, "teamMembers": 1})
+    ]
+    if not updates:
+        return 0
+    result = await db.projects.bulk_write(updates, ordered=False)
+    print(f"✓ Backfilled participants on {result.modified_count} projects")
+    return result.modified_count
+
+
+async def ensure_indexes(db):
+    """Create the declared indexes (a no-op for ones that already exist); returns the names that failed"""
+    failed = []
+    for collection, indexes in INDEXES.items():
+        try:
+            await db[collection].create_indexes(indexes)
+        except OperationFailure as e:
+            # Duplicate keys under a new unique index, or an existing index with other options
+            print(f"⚠ Could not create indexes on {collection}: {e}")
+            failed.append(collection)
+    if not failed:
+        print(f"✓ Indexes ensured on {len(INDEXES)} collections")
+    return failed
+
+
+def _stages(plan):
+    yield plan.get("stage")
+    for child in plan.get("inputStages", []) + [plan[key] for key in ("inputStage", "queryPlan") if key in plan]:
+        yield from _stages(child)
+
+
+async def explain_query(db, collection, query, sort=None):
+    """Stage names in the winning plan for one query shape"""
+    cursor = db[collection].find(query)
+    if sort:
+        cursor = cursor.sort(sort)
+    explained = await cursor.explain()
+    return list(_stages(explained["queryPlanner"]["winningPlan"]))
+
+
+async def verify_query_plans(db, queries=HOT_QUERIES):
+    """[(collection, query, stages)] for every hot query whose plan includes a COLLSCAN"""
+    scans = []
+    for collection, query, sort in queries:
+        stages = await explain_query(db, collection, query, sort)
+        if "COLLSCAN" in stages:
+            print(f"⚠ {collection}.find({query}) plans {' <- '.join(stages)}")
+            scans.append((collection, query, stages))
+    if not scans:
+        print(f"✓ {len(queries)} hot queries are index-backed")
+    return scans
+
+
+async def bootstrap(db, verify=MONGO_VERIFY_INDEXES):
+    """Startup hook: ensure indexes, optionally fail on collection scans and indexes that could not be built"""
+    try:
+        await backfill_participants(db)
+        failed = await ensure_indexes(db)
+    except PyMongoError as e:
+        if verify:
+            raise
+        # Unreachable server etc.; requests will surface that themselves
+        print(f"⚠ Index bootstrap skipped: {e}")
+        return
+    if verify and failed:
+        # e.g. duplicate usernames in existing data block a unique index
+        raise RuntimeError(f"Could not build indexes on {failed}")
+    if verify:
+        scans = await verify_query_plans(db)
+        if scans:
+            raise RuntimeError(f"{len(scans)} hot queries plan a COLLSCAN: {[s[:2] for s in scans]}")
+
+
+async def _main(mongo_uri):
+    client = AsyncIOMotorClient(mongo_uri)
+    try:
+        db = client[os.getenv("MONGO_DB", "divergence")]
+        await backfill_participants(db)
+        failed = await ensure_indexes(db)
+        scans = await verify_query_plans(db)
+        return 1 if failed or scans else 0
+    finally:
+        client.close()
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(_main(sys.argv[1] if len(sys.argv) > 1 else "mongodb://localhost:27017")))
@@ -0,0 +1,146 @@
+import json
+import os
+import time
+from collections import defaultdict
+from datetime import datetime, timedelta
+from pathlib import Path
+
+from services.tracing import current_trace_id, record_span
+
+# Histogram bucket boundaries (seconds) for stage and total wall time
+WALL_TIME_BUCKETS = [0, 1, 2, 5, 10, 20, 30, 60, 120, 300]
+
+PIPELINE_STAGES = ['fetch', 'filter', 'publish']
+
+# Runs covered by /pipeline-runs/stats when no start time is given (keeps the query on the started_at index)
+PIPELINE_STATS_WINDOW_DAYS = float(os.getenv('PIPELINE_STATS_WINDOW_DAYS', '30'))
+
+
+def new_pipeline_run(username, user_id):
+    """Per-job resource record, filled in by process_github_user_main"""
+    return {
+        'username': username,
+        'user_id': user_id,
+        'status': 'running',
+        # Ties the stored run to the log lines of the request that started it
+        'trace_id': current_trace_id(),
+        'started_at': datetime.utcnow(),
+        'stages': {},
+        'counters': {}
+    }
+
+
+class StageTimer:
+    """Times one pipeline stage and merges the metrics the stage script wrote"""
+
+    def __init__(self, run, stage, metrics_dir):
+        self.run = run
+        self.stage = stage
+        self.metrics_dir = Path(metrics_dir)
+
+    def __enter__(self):
+        self._wall_start = time.perf_counter()
+        # CPU spent in this thread (in-process stages); RUSAGE_CHILDREN would mix in every
+        # concurrent run's subprocesses, so subprocess stages report their own usage instead
+        self._cpu_start = time.thread_time()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        record = {
+            'status': 'failed' if exc_type else 'ok',
+            'wall_seconds': round(time.perf_counter() - self._wall_start, 3),
+            'cpu_seconds': round(time.thread_time() - self._cpu_start, 3),
+            'peak_rss_mb': None,
+            'counters': {}
+        }
+
+        # Scripts that use pipeline_metrics.StageMetrics report their own CPU, peak RSS and counters
+        script_metrics = self.metrics_dir / f"{self.stage}.json"
+        if script_metrics.exists():
+            try:
+                with open(script_metrics, 'r', encoding='utf-8') as f:
+                    reported = json.load(f)
+                record['cpu_seconds'] = reported.get('cpu_seconds')
+                record['peak_rss_mb'] = reported.get('peak_rss_mb')
+                record['children_peak_rss_mb'] = reported.get('children_peak_rss_mb')
+                record['counters'] = reported.get('counters', {})
+            except (OSError, ValueError) as e:
+                print(f"⚠ Could not read {script_metrics}: {e}")
+
+        self.run['stages'][self.stage] = record
+        record_span('pipeline', self.stage, record['wall_seconds'], 'error' if exc_type else 'ok')
+        return False
+
+
+def finish_pipeline_run(run):
+    """Close out a run: final status, totals and summed counters across stages"""
+    if run['status'] == 'running':
+        run['status'] = 'failed'
+    run['finished_at'] = datetime.utcnow()
+    run['wall_seconds'] = round((run['finished_at'] - run['started_at']).total_seconds(), 3)
+
+    counters = defaultdict(int)
+    cpu_seconds = 0.0
+    for stage in run['stages'].values():
+        for name, value in stage['counters'].items():
+            counters[name] += value
+        cpu_seconds += stage.get('cpu_seconds') or 0.0
+    run['counters'] = dict(counters)
+    run['cpu_seconds'] = round(cpu_seconds, 3)
+    run['peak_rss_mb'] = max((s['peak_rss_mb'] for s in run['stages'].values() if s.get('peak_rss_mb')), default=None)
+    return run
+
+
+async def save_pipeline_run(collection, run):
+    """Store the finished run as one document in pipeline_runs"""
+    finish_pipeline_run(run)
+    try:
+        await collection.insert_one(dict(run))
+    except Exception as e:
+        # Accounting must never fail the pipeline itself
+        print(f"⚠ Could not store pipeline run for {run['username']}: {e}")
+
+
+async def pipeline_run_histograms(collection, since=None):
+    """Wall-time histograms (total and per stage) plus counter totals over runs started since then"""
+    if since is None:
+        since = datetime.utcnow() - timedelta(days=PIPELINE_STATS_WINDOW_DAYS)
+    match = {'started_at': {'$gte': since}}
+
+    def bucket(field):
+        return [{'$bucket': {
+            'groupBy': f'${field}',
+            'boundaries': WALL_TIME_BUCKETS,
+            'default': f'>={WALL_TIME_BUCKETS[-1]}',
+            'output': {'count': {'$sum': 1}}
+        }}]
+
+    facets = {'total': bucket('wall_seconds')}
+    for stage in PIPELINE_STAGES:
+        facets[stage] = [{'$match': {f'stages.{stage}.wall_seconds': {'$exists': True}}}] + \
+            bucket(f'stages.{stage}.wall_seconds')
+    facets['summary'] = [{'$group': {
+        '_id': None,
+        'runs': {'$sum': 1},
+        'failed': {'$sum': {'$cond': [{'$eq': ['$status', 'failed']}, 1, 0]}},
+        'github_api_calls': {'$sum': '$counters.github_api_calls'},
+        'bytes_cloned': {'$sum': '$counters.bytes_cloned'},
+        'files_scanned': {'$sum': '$counters.files_scanned'},
+        'repo_cache_hits': {'$sum': '$counters.repo_cache_hits'},
+        'repos_analyzed': {'$sum': '$counters.repos_analyzed'},
+        'files_analyzed': {'$sum': '$counters.files_analyzed'},
+        'max_peak_rss_mb': {'$max': '$peak_rss_mb'}
+    }}]
+
+    result = await collection.aggregate([{'$match': match}, {'$facet': facets}]).to_list(length=1)
+    histograms = result[0] if result else {}
+    summary = (histograms.pop('summary', None) or [{}])[0]
+    summary.pop('_id', None)
+    return {
+        'buckets_seconds': WALL_TIME_BUCKETS,
+        'histograms': {
+            name: {str(b['_id']): b['count'] for b in buckets}
+            for name, buckets in histograms.items()
+        },
+        'summary': summary
+    }
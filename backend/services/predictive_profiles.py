@@ -0,0 +1,39 @@
+import hashlib
+import json
+from datetime import datetime
+
+from modelling import MODEL_VERSION, DivergencePredictiveModel
+
+
+def profile_hash(translated_data):
+    """Content hash of a translated profile (key order independent)"""
+    canonical = json.dumps(translated_data, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+async def get_predictive_profile(collection, user_id, translated_data):
+    """Stored predictive profile for this exact translated profile and model, computed on first read"""
+    translated_hash = profile_hash(translated_data)
+    cached = await collection.find_one(
+        {"user_id": user_id, "translated_hash": translated_hash, "model_version": MODEL_VERSION},
+        {"_id": 0, "predictive_data": 1}
+    )
+    if cached:
+        return cached["predictive_data"]
+
+    predictive_data = DivergencePredictiveModel.from_profile(translated_data).generate_predictive_profile()
+
+    # One document per user: a new translated profile or model version replaces the old entry
+    await collection.replace_one(
+        {"user_id": user_id},
+        {
+            "user_id": user_id,
+            "translated_hash": translated_hash,
+            "model_version": MODEL_VERSION,
+            "predictive_data": predictive_data,
+            "computed_at": datetime.utcnow()
+        },
+        upsert=True
+    )
+    print(f"✓ Computed predictive profile for {user_id} (model {MODEL_VERSION})")
+    return predictive_data
@@ -0,0 +1,148 @@
+import gzip
+import hashlib
+import io
+import json
+
+from services.artifact_storage import ArtifactNotFound, artifact_key
+from services.etags import strong_etag
+
+try:
+    import brotli
+except ImportError:  # gzip and identity variants only
+    brotli = None
+
+# Profile endpoints whose final bodies are prepared when the pipeline publishes, by artifact
+PREPARED_ARTIFACTS = {"filtered": "filtered.json", "translated": "translated.json"}
+RESPONSES_INDEX = "responses/index.json"
+
+ENCODING_SUFFIXES = {"identity": "", "gzip": ".gz", "br": ".br"}
+# Server preference when the client accepts several encodings equally
+ENCODING_PREFERENCE = ("br", "gzip", "identity")
+
+
+def normalize_filtered(data, username, avatar_url):
+    """filtered.json in the shape the frontend expects, with the user's fields filled in"""
+    # Ensure the data has the expected structure for the frontend
+    if not data.get("profile"):
+        data["profile"] = {}
+
+    # Fill in profile data from the user's users document
+    data["profile"]["avatar"] = data["profile"].get("avatar") or avatar_url
+    data["profile"]["nameUser"] = data["profile"].get("nameUser") or username
+    data["profile"]["username"] = username
+
+    # Ensure other required fields exist
+    data.setdefault("statsHome", {"totalProjects": 0, "totalRating": 0.0, "totalLanguages": 0})
+    data.setdefault("projects", {"top": [], "new": []})
+    data.setdefault("recentWorks", [])
+    return data
+
+
+def normalize_translated(data, username, avatar_url):
+    """translated.json in the shape the frontend expects, with the user's fields filled in"""
+    if not data.get("profile"):
+        data["profile"] = {}
+
+    data["profile"]["name"] = data["profile"].get("name") or username
+    data["profile"]["username"] = username
+    data["profile"]["avatarUrl"] = data["profile"].get("avatarUrl") or avatar_url
+    data["profile"]["bio"] = data["profile"].get("bio") or "No bio available"
+
+    data.setdefault("skills", {"radar": []})
+    data.setdefault("languages", [])
+    data.setdefault("frameworks", [])
+    data.setdefault("libraries", [])
+    return data
+
+
+NORMALIZERS = {"filtered": normalize_filtered, "translated": normalize_translated}
+
+
+def encode_variants(payload):
+    """{encoding: bytes} for a JSON payload, serialized exactly as JSONResponse would"""
+    body = json.dumps(payload, ensure_ascii=False, allow_nan=False, indent=None, separators=(",", ":")).encode("utf-8")
+    variants = {"identity": body, "gzip": gzip.compress(body, compresslevel=9, mtime=0)}
+    if brotli is not None:
+        variants["br"] = brotli.compress(body, quality=11)
+    return variants
+
+
+def prepare_response(kind, data, username, avatar_url):
+    """(etag, variants) for the final response body of one profile endpoint"""
+    variants = encode_variants(NORMALIZERS[kind](data, username, avatar_url))
+    return strong_etag(kind, hashlib.sha256(variants["identity"]).hexdigest()), variants
+
+
+def variant_name(kind, encoding):
+    return f"responses/{kind}.json{ENCODING_SUFFIXES[encoding]}"
+
+
+def variant_etag(etag, encoding):
+    """Each content coding is its own representation, so it gets its own strong ETag"""
+    return etag if encoding == "identity" else f'{etag[:-1]}-{encoding}"'
+
+
+def negotiate_encoding(accept_encoding, available):
+    """Best available content coding for an Accept-Encoding header (identity unless refused)"""
+    weights = {}
+    for item in (accept_encoding or "").split(","):
+        coding, _, params = item.strip().partition(";")
+        if not coding:
+            continue
+        q = 1.0
+        for param in params.split(";"):
+            name, _, value = param.strip().partition("=")
+            if name == "q":
+                try:
+                    q = float(value)
+                except ValueError:
+                    q = 0.0
+        weights[coding.strip().lower()] = q
+
+    def weight(encoding):
+        if encoding in weights:
+            return weights[encoding]
+        if "*" in weights:
+            return weights["*"]
+        # identity stays acceptable when unlisted, but below any coding the client asked for
+        return 0.001 if encoding == "identity" else 0.0
+
+    candidates = [e for e in ENCODING_PREFERENCE if e in available and weight(e) > 0]
+    if not candidates:
+        return "identity"
+    return max(candidates, key=weight)  # max keeps the first (preferred) coding on ties
+
+
+def publish_prepared_responses(storage, user_id, user_dir, username, avatar_url=""):
+    """Normalize, serialize and compress the profile responses once, at pipeline-write time"""
+    index_key = artifact_key(user_id, RESPONSES_INDEX)
+    # Readers fall back to building from the raw artifacts while the new bodies are written
+    storage.delete(index_key)
+    index = {}
+    for kind, name in PREPARED_ARTIFACTS.items():
+        source = user_dir / name
+        if not source.exists():
+            continue
+        with open(source, "r", encoding="utf-8") as f:
+            etag, variants = prepare_response(kind, json.load(f), username, avatar_url)
+        for encoding, body in variants.items():
+            storage.write(artifact_key(user_id, variant_name(kind, encoding)), io.BytesIO(body))
+        index[kind] = {"etag": etag, "encodings": list(variants)}
+    storage.write(index_key, io.BytesIO(json.dumps(index).encode("utf-8")))
+    return index
+
+
+def read_prepared_index(storage, user_id):
+    """{kind: {"etag", "encodings"}} for the user's prepared responses, {} if none were published"""
+    try:
+        return json.loads(storage.read_bytes(artifact_key(user_id, RESPONSES_INDEX)))
+    except (ArtifactNotFound, ValueError):
+        return {}
+
+
+def read_prepared_variants(storage, user_id, kind, encodings):
+    """{encoding: bytes} for one prepared response, None if any variant is missing"""
+    try:
+        return {e: storage.read_bytes(artifact_key(user_id, variant_name(kind, e))) for e in encodings}
+    except ArtifactNotFound:
+        return None
@@ -0,0 +1,45 @@
+import os
+import threading
+import time
+
+# Principals are re-read from users after this long, to pick up writes made outside this process
+PRINCIPAL_CACHE_TTL_SECONDS = float(os.getenv("PRINCIPAL_CACHE_TTL_SECONDS", "60"))
+PRINCIPAL_CACHE_MAX_ENTRIES = int(os.getenv("PRINCIPAL_CACHE_MAX_ENTRIES", "4096"))
+
+
+class PrincipalCache:
+    """Short-lived per-process cache of resolved principals by username"""
+
+    def __init__(self, ttl_seconds=PRINCIPAL_CACHE_TTL_SECONDS, max_entries=PRINCIPAL_CACHE_MAX_ENTRIES):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._entries = {}
+        self._lock = threading.Lock()
+
+    def get(self, username):
+        with self._lock:
+            entry = self._entries.get(username)
+            if entry is None:
+                return None
+            principal, expires_at = entry
+            if expires_at <= time.monotonic():
+                del self._entries[username]
+                return None
+            return principal
+
+    def set(self, principal):
+        with self._lock:
+            if len(self._entries) >= self.max_entries:
+                # Expired entries first; failing that, the oldest insertion
+                now = time.monotonic()
+                for username in [u for u, (_, expires_at) in self._entries.items() if expires_at <= now]:
+                    del self._entries[username]
+                if len(self._entries) >= self.max_entries:
+                    del self._entries[next(iter(self._entries))]
+            self._entries[principal.username] = (principal, time.monotonic() + self.ttl_seconds)
+        return principal
+
+    def invalidate(self, username):
+        """Forget a user's principal after a write to their users document"""
+        with self._lock:
+            self._entries.pop(username, None)
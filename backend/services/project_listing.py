@@ -0,0 +1,77 @@
+import base64
+import json
+from datetime import datetime
+
+from pymongo import DESCENDING
+
+# Newest first; project_id breaks ties between projects created in the same millisecond
+PROJECT_SORT = [("createdAt", DESCENDING), ("project_id", DESCENDING)]
+
+# Fields a caller may ask for; the keyset and version fields always come back
+PROJECT_FIELDS = ("name", "goal", "dueDate", "mode", "teamMembers", "repoOption", "existingRepoUrl", "ownerUsername")
+ALWAYS_RETURNED = ("project_id", "createdAt", "updatedAt")
+
+MAX_PAGE_SIZE = 100
+
+
+def project_members(project):
+    """A project's participants, or owner plus team on documents written before participants existed"""
+    if project.get("participants"):
+        return list(project["participants"])
+    return list(dict.fromkeys(filter(None, [project.get("ownerUsername"), *(project.get("teamMembers") or [])])))
+
+
+class InvalidCursor(ValueError):
+    """Continuation token that was not issued by list_projects_page"""
+
+
+def encode_cursor(project):
+    """Opaque continuation token positioned after this project"""
+    key = [project["createdAt"].isoformat(), project["project_id"]]
+    return base64.urlsafe_b64encode(json.dumps(key, separators=(",", ":")).encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor):
+    try:
+        created_at, project_id = json.loads(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+        return datetime.fromisoformat(created_at), str(project_id)
+    except (ValueError, TypeError) as e:
+        raise InvalidCursor(f"Invalid cursor: {e}")
+
+
+def projection(fields=None):
+    """Mongo projection for a comma-separated field list (all listable fields when empty)"""
+    requested = [f.strip() for f in fields.split(",") if f.strip()] if fields else list(PROJECT_FIELDS)
+    unknown = [f for f in requested if f not in PROJECT_FIELDS + ALWAYS_RETURNED]
+    if unknown:
+        raise ValueError(f"Unknown fields {unknown}; choose from {list(PROJECT_FIELDS)}")
+    return {"_id": 0, **{f: 1 for f in ALWAYS_RETURNED + tuple(requested)}}
+
+
+def page_query(username, cursor=None):
+    """Filter for the caller's projects strictly after the cursor position"""
+    query = {"participants": username}
+    if cursor:
+        created_at, project_id = decode_cursor(cursor)
+        query["$or"] = [
+            {"createdAt": {"$lt": created_at}},
+            {"createdAt": created_at, "project_id": {"$lt": project_id}}
+        ]
+    return query
+
+
+async def _page(collection, username, limit, cursor, fields_projection):
+    docs = await collection.find(page_query(username, cursor), fields_projection) \
+        .sort(PROJECT_SORT).limit(limit + 1).to_list(length=limit + 1)
+    next_cursor = encode_cursor(docs[limit - 1]) if len(docs) > limit else None
+    return docs[:limit], next_cursor
+
+
+async def list_projects_page(collection, username, limit=20, cursor=None, fields=None):
+    """(projects, next_cursor) for one page of the projects this user owns or is a member of"""
+    return await _page(collection, username, limit, cursor, projection(fields))
+
+
+async def list_project_versions(collection, username, limit=20, cursor=None):
+    """The same page as list_projects_page with only keys and versions, enough to revalidate its ETag"""
+    return await _page(collection, username, limit, cursor, {"_id": 0, **{f: 1 for f in ALWAYS_RETURNED}})
@@ -0,0 +1,97 @@
+import os
+import threading
+import time
+from collections import OrderedDict, defaultdict
+
+# Bounded in-process cache of prepared profile responses (per API worker)
+RESPONSE_CACHE_MAX_ENTRIES = int(os.getenv("RESPONSE_CACHE_MAX_ENTRIES", "1024"))
+# Safety net for artifacts changed outside the API (manual_process.py etc.); pipeline runs invalidate explicitly
+RESPONSE_CACHE_TTL_SECONDS = float(os.getenv("RESPONSE_CACHE_TTL_SECONDS", "300"))
+
+
+class CachedResponse:
+    """Serialized response body (or its {encoding: bytes} variants) plus the version it was built from"""
+
+    __slots__ = ("body", "version", "expires_at")
+
+    def __init__(self, body, version, expires_at):
+        self.body = body
+        self.version = version
+        self.expires_at = expires_at
+
+
+class ResponseCache:
+    """TTL + LRU cache of response bodies keyed by (endpoint, username, variant)"""
+
+    def __init__(self, max_entries=RESPONSE_CACHE_MAX_ENTRIES, ttl_seconds=RESPONSE_CACHE_TTL_SECONDS):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries = OrderedDict()
+        self._keys_by_user = defaultdict(set)
+        self._lock = threading.Lock()
+        self.counters = defaultdict(int)
+
+    def get(self, key):
+        """Cached entry for key, or None on a miss / expiry"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.counters["misses"] += 1
+                return None
+            if entry.expires_at <= time.monotonic():
+                self._drop(key)
+                self.counters["expired"] += 1
+                self.counters["misses"] += 1
+                return None
+            self._entries.move_to_end(key)
+            self.counters["hits"] += 1
+            return entry
+
+    def set(self, key, body, version=None):
+        entry = CachedResponse(body, version, time.monotonic() + self.ttl_seconds)
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            self._keys_by_user[key[1]].add(key)
+            while len(self._entries) > self.max_entries:
+                oldest = next(iter(self._entries))
+                self._drop(oldest)
+                self.counters["evictions"] += 1
+        return entry
+
+    def _drop(self, key):
+        self._entries.pop(key, None)
+        user_keys = self._keys_by_user.get(key[1])
+        if user_keys is not None:
+            user_keys.discard(key)
+            if not user_keys:
+                del self._keys_by_user[key[1]]
+
+    def invalidate_user(self, username):
+        """Drop every cached response for a user (their pipeline artifacts changed)"""
+        with self._lock:
+            keys = list(self._keys_by_user.get(username, ()))
+            for key in keys:
+                self._drop(key)
+            self.counters["invalidations"] += len(keys)
+        return len(keys)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._keys_by_user.clear()
+
+    def stats(self):
+        with self._lock:
+            lookups = self.counters["hits"] + self.counters["misses"]
+            return {
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "ttl_seconds": self.ttl_seconds,
+                "hits": self.counters["hits"],
+                "misses": self.counters["misses"],
+                "expired": self.counters["expired"],
+                "evictions": self.counters["evictions"],
+                "invalidations": self.counters["invalidations"],
+                "hit_ratio": round(self.counters["hits"] / lookups, 3) if lookups else None
+            }
@@ -0,0 +1,173 @@
+import json
+import re
+
+ESCAPES = {"n": "\n", "t": "\t", "r": "\r", "b": "\b", "f": "\f"}
+
+
+def parse_scoping_reply(content, default_confidence):
+    """The assistant's whole reply as a dict, falling back to the raw text as the question"""
+    try:
+        reply = json.loads(re.sub(r'```json?\n?|\n?```', '', content).strip())
+    except (ValueError, TypeError):
+        reply = None
+    return reply if isinstance(reply, dict) else {"question": content, "confidence": default_confidence}
+
+
+def reply_confidence(ai_data, default_confidence):
+    """The reply's confidence as a float; models sometimes quote it ('0.8') or omit it"""
+    try:
+        return float(ai_data.get("confidence", default_confidence))
+    except (TypeError, ValueError):
+        return default_confidence
+
+
+def sse(event, data):
+    """One Server-Sent Events frame"""
+    return f"event: {event}\ndata: {json.dumps(data)}\n\n"
+
+
+class ScopingReplyParser:
+    """Incremental parser for the top-level fields of the scoping assistant's JSON reply
+
+    feed() takes content chunks as they stream in and returns events:
+    ("delta", name, text) while a watched string value is still arriving, and
+    ("field", name, value) once any top-level value is complete. Anything
+    before the opening brace (code fences, prose) is skipped.
+    """
+
+    def __init__(self, stream_fields=("question",)):
+        self.stream_fields = set(stream_fields)
+        self.fields = {}
+        self.state = "seek"
+        self.key = None
+        self._buf = []
+        self._pending = []
+        self._quote = None
+        self._escape = None  # None, "" right after a backslash, or "u" + hex digits so far
+        self._high_surrogate = None
+        self._depth = 0
+
+    def feed(self, chunk):
+        events = []
+        for ch in chunk:
+            self._step(ch, events)
+        if self._pending:
+            events.append(("delta", self.key, "".join(self._pending)))
+            self._pending = []
+        return events
+
+    def _start_string(self, quote, state):
+        self._quote = quote
+        self._buf = []
+        self.state = state
+
+    def _complete(self, value, events):
+        if self._pending:
+            events.append(("delta", self.key, "".join(self._pending)))
+            self._pending = []
+        self.fields[self.key] = value
+        events.append(("field", self.key, value))
+
+    def _string_char(self, ch):
+        """Decoded text for one character of a string body ("" mid-escape), None at the closing quote"""
+        if self._escape is not None:
+            if self._escape == "":
+                if ch == "u":
+                    self._escape = "u"
+                    return ""
+                self._escape = None
+                return ESCAPES.get(ch, ch)
+            self._escape += ch
+            if len(self._escape) < 5:
+                return ""
+            try:
+                code = int(self._escape[1:], 16)
+            except ValueError:
+                code = 0xFFFD
+            self._escape = None
+            if 0xD800 <= code < 0xDC00:
+                self._high_surrogate = code
+                return ""
+            if 0xDC00 <= code < 0xE000 and self._high_surrogate is not None:
+                code = 0x10000 + ((self._high_surrogate - 0xD800) << 10) + (code - 0xDC00)
+            self._high_surrogate = None
+            return chr(code)
+        if ch == "\\":
+            self._escape = ""
+            return ""
+        if ch == self._quote:
+            return None
+        return ch
+
+    def _step(self, ch, events):
+        state = self.state
+        if state == "seek":
+            if ch == "{":
+                self.state = "key_or_end"
+        elif state == "key_or_end":
+            if ch in "\"'":
+                self._start_string(ch, "key")
+            elif ch == "}":
+                self.state = "done"
+        elif state in ("key", "string"):
+            text = self._string_char(ch)
+            if text is None:
+                value = "".join(self._buf)
+                if state == "key":
+                    self.key = value
+                    self.state = "colon"
+                else:
+                    self._complete(value, events)
+                    self.state = "key_or_end"
+            else:
+                self._buf.append(text)
+                if state == "string" and self.key in self.stream_fields:
+                    self._pending.append(text)
+        elif state == "colon":
+            if ch == ":":
+                self.state = "value_start"
+        elif state == "value_start":
+            if ch in "\"'":
+                self._start_string(ch, "string")
+            elif ch in "{[":
+                self._buf = [ch]
+                self._depth = 1
+                self._quote = None
+                self.state = "nested"
+            elif not ch.isspace():
+                self._buf = [ch]
+                self.state = "scalar"
+        elif state == "scalar":
+            if ch in ",}" or ch.isspace():
+                token = "".join(self._buf)
+                try:
+                    value = json.loads(token)
+                except ValueError:
+                    value = token
+                self._complete(value, events)
+                self.state = "done" if ch == "}" else "key_or_end"
+            else:
+                self._buf.append(ch)
+        elif state == "nested":
+            self._buf.append(ch)
+            if self._quote:
+                if self._escape is not None:
+                    self._escape = None
+                elif ch == "\\":
+                    self._escape = ""
+                elif ch == self._quote:
+                    self._quote = None
+            elif ch in "\"'":
+                self._quote = ch
+            elif ch in "{[":
+                self._depth += 1
+            elif ch in "}]":
+                self._depth -= 1
+                if self._depth == 0:
+                    raw = "".join(self._buf)
+                    try:
+                        value = json.loads(raw)
+                    except ValueError:
+                        value = raw
+                    self._complete(value, events)
+                    self.state = "key_or_end"
@@ -0,0 +1,154 @@
+from datetime import datetime
+
+import numpy as np
+
+from batch_scoring import CAPABILITIES, FRICTIONS, profile_features, score_features
+from modelling import MODEL_VERSION
+
+
+def member_scores(profiles):
+    """{username: {'friction': {...}, 'capability': {...}}} for {username: translated_data}, None if unscorable"""
+    scores = {username: None for username in profiles}
+    rows, names = [], []
+    for username, translated in profiles.items():
+        if not translated:
+            continue
+        try:
+            rows.append(profile_features(translated))
+        except (KeyError, TypeError) as e:
+            print(f"⚠ Cannot score {username} for team compatibility: missing {e}")
+            continue
+        names.append(username)
+
+    if rows:
+        matrices = score_features(np.array(rows, dtype=np.float64))
+        for i, username in enumerate(names):
+            scores[username] = {
+                'friction': dict(zip(FRICTIONS, matrices['friction_profile'][i].tolist())),
+                'capability': dict(zip(CAPABILITIES, matrices['capability_assessment'][i].tolist()))
+            }
+    return scores
+
+
+def _vectors(member):
+    return (np.array([member['capability'][name] for name in CAPABILITIES]),
+            np.array([member['friction'][name] for name in FRICTIONS]))
+
+
+def pair_scores(a, b):
+    """(capability, friction) for two members working together
+
+    The pair covers each project type as well as its stronger member, and meets
+    each technology with the friction of whoever finds it easier.
+    """
+    if a is None or b is None:
+        return None, None
+    cap_a, fric_a = _vectors(a)
+    cap_b, fric_b = _vectors(b)
+    return (round(float(np.maximum(cap_a, cap_b).mean()), 3),
+            round(float(np.minimum(fric_a, fric_b).mean()), 3))
+
+
+def team_scores(per_member):
+    """Best capability and lowest friction per project type / technology across scored members"""
+    scored = [m for m in per_member.values() if m]
+    if not scored:
+        return None
+    return {
+        'capability': {name: max(m['capability'][name] for m in scored) for name in CAPABILITIES},
+        'friction': {name: min(m['friction'][name] for m in scored) for name in FRICTIONS}
+    }
+
+
+def member_entry(username, scores):
+    """Stored per_member entry; usernames are values, never field names, so any string is safe"""
+    return {'username': username,
+            'friction': scores['friction'] if scores else None,
+            'capability': scores['capability'] if scores else None}
+
+
+def entry_scores(entry):
+    """Scores from a stored per_member entry, None if the member was unscorable"""
+    if entry.get('friction') is None:
+        return None
+    return {'friction': entry['friction'], 'capability': entry['capability']}
+
+
+def build_compatibility(project_id, members, profiles):
+    """Full compatibility document for a project's members"""
+    per_member = member_scores({username: profiles.get(username) for username in members})
+    n = len(members)
+    capability = [[None] * n for _ in range(n)]
+    friction = [[None] * n for _ in range(n)]
+    for i in range(n):
+        for j in range(i, n):
+            cap, fric = pair_scores(per_member[members[i]], per_member[members[j]])
+            capability[i][j] = capability[j][i] = cap
+            friction[i][j] = friction[j][i] = fric
+
+    return {
+        'project_id': project_id,
+        'members': list(members),
+        'per_member': [member_entry(username, per_member[username]) for username in members],
+        'pairwise': {'capability': capability, 'friction': friction},
+        'team': team_scores(per_member),
+        'model_version': MODEL_VERSION,
+        'updated_at': datetime.utcnow()
+    }
+
+
+def member_update(doc, username, translated):
+    """$set fields that refresh one member's entry plus their matrix row and column"""
+    members = doc['members']
+    i = members.index(username)
+    per_member = {entry['username']: entry_scores(entry) for entry in doc['per_member']}
+    per_member[username] = member_scores({username: translated})[username]
+
+    updates = {
+        f'per_member.{i}': member_entry(username, per_member[username]),
+        'team': team_scores(per_member),
+        'updated_at': datetime.utcnow()
+    }
+    for j, other in enumerate(members):
+        cap, fric = pair_scores(per_member[username], per_member[other])
+        for a, b in {(i, j), (j, i)}:
+            updates[f'pairwise.capability.{a}.{b}'] = cap
+            updates[f'pairwise.friction.{a}.{b}'] = fric
+    return updates
+
+
+def is_current(doc, members):
+    """Whether a stored matrix was built by this model, in this layout, for exactly these members"""
+    return (doc.get('model_version') == MODEL_VERSION and doc.get('members') == members
+            and isinstance(doc.get('per_member'), list))
+
+
+async def load_member_profiles(github_data_collection, members):
+    """{username: translated_data} for the members that have processed GitHub data"""
+    cursor = github_data_collection.find(
+        {'username': {'$in': list(members)}},
+        {'_id': 0, 'username': 1, 'translated_data': 1}
+    )
+    return {doc['username']: doc.get('translated_data') async for doc in cursor}
+
+
+async def save_project_compatibility(collection, github_data_collection, project_id, members):
+    """(Re)build and store the whole matrix for one project"""
+    profiles = await load_member_profiles(github_data_collection, members)
+    doc = build_compatibility(project_id, members, profiles)
+    await collection.replace_one({'project_id': project_id}, doc, upsert=True)
+    return doc
+
+
+async def refresh_member_compatibility(collection, username, translated):
+    """Recompute only this member's row and column in every project matrix they belong to"""
+    updated = 0
+    async for doc in collection.find({'members': username}):
+        if not is_current(doc, doc.get('members')):
+            # Weights or layout changed since this matrix was stored; the next read rebuilds it whole
+            continue
+        # Entries are addressed by position, so the update only applies if the member list is unchanged
+        await collection.update_one({'_id': doc['_id'], 'members': doc['members']},
+                                    {'$set': member_update(doc, username, translated)})
+        updated += 1
+    return updated
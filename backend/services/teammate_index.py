@@ -0,0 +1,204 @@
+import asyncio
+import os
+import threading
+
+import numpy as np
+
+from batch_scoring import CAPABILITIES, SKILLS, profile_features, score_features
+
+try:
+    from scipy.spatial import cKDTree
+except ImportError:  # brute-force scans only
+    cKDTree = None
+
+# Below this many vectors a NumPy scan is faster than building and querying a tree
+MIN_TREE_SIZE = int(os.getenv("TEAMMATE_MIN_TREE_SIZE", "4096"))
+# Rebuild the tree once this fraction of rows changed or was added since the last build
+REBUILD_FRACTION = float(os.getenv("TEAMMATE_REBUILD_FRACTION", "0.05"))
+
+SPACES = {"skill": SKILLS, "capability": CAPABILITIES}
+MODES = ("similar", "complementary")
+
+
+def matched_on(names, target, vector, n=3):
+    """Names of the n dimensions where vector best covers what target asks for"""
+    fit = target - np.abs(vector - target)
+    return [names[i] for i in np.argsort(-fit, kind="stable")[:n]]
+
+
+class VectorIndex:
+    """Euclidean k-nearest-neighbour index over fixed-length vectors keyed by user id"""
+
+    def __init__(self, dim):
+        self.dim = dim
+        self._vectors = np.zeros((1024, dim))
+        self._alive = np.zeros(1024, dtype=bool)
+        self._keys = []
+        self._rows = {}
+        self._tree = None
+        self._tree_rows = None
+        self._tree_size = 0  # rows below this existed when the tree was built
+        self._dirty = set()  # tree rows changed or removed since the build
+        self._lock = threading.RLock()
+
+    def __len__(self):
+        return len(self._rows)
+
+    def vector(self, key):
+        row = self._rows.get(key)
+        return None if row is None else self._vectors[row].copy()
+
+    def upsert(self, key, vector):
+        with self._lock:
+            row = self._rows.get(key)
+            if row is None:
+                row = len(self._keys)
+                if row == len(self._vectors):
+                    self._vectors = np.concatenate([self._vectors, np.zeros_like(self._vectors)])
+                    self._alive = np.concatenate([self._alive, np.zeros_like(self._alive)])
+                self._keys.append(key)
+                self._rows[key] = row
+            elif row < self._tree_size:
+                self._dirty.add(row)
+            self._vectors[row] = vector
+            self._alive[row] = True
+            self._maybe_rebuild()
+
+    def remove(self, key):
+        with self._lock:
+            row = self._rows.pop(key, None)
+            if row is None:
+                return
+            self._alive[row] = False
+            if row < self._tree_size:
+                self._dirty.add(row)
+            self._maybe_rebuild()
+
+    def _maybe_rebuild(self):
+        if cKDTree is None or len(self._rows) < MIN_TREE_SIZE:
+            self._tree = None
+            return
+        changed = len(self._dirty) + len(self._keys) - self._tree_size
+        if self._tree is None or changed > REBUILD_FRACTION * len(self._rows):
+            self.rebuild()
+
+    def rebuild(self):
+        with self._lock:
+            self._tree_size = len(self._keys)
+            self._tree_rows = np.flatnonzero(self._alive[:self._tree_size])
+            self._tree = cKDTree(self._vectors[self._tree_rows])
+            self._dirty = set()
+
+    def _scan(self, rows, target):
+        diff = self._vectors[rows] - target
+        return np.sqrt(np.einsum("ij,ij->i", diff, diff))
+
+    def query(self, target, k, exclude=()):
+        """[(key, distance)] for the k nearest vectors, skipping keys in exclude"""
+        target = np.asarray(target, dtype=np.float64)
+        with self._lock:
+            skip = np.array([self._rows[key] for key in exclude if key in self._rows], dtype=np.int64)
+            n = len(self._keys)
+
+            if self._tree is None:
+                rows = np.arange(n)
+                distances = self._scan(slice(0, n), target)
+                distances[~self._alive[:n]] = np.inf
+            else:
+                # Over-fetch from the tree to cover stale and excluded rows, then add
+                # the rows changed or appended since the build with a NumPy scan
+                dirty = np.fromiter(self._dirty, dtype=np.int64, count=len(self._dirty))
+                fetch = min(k + len(dirty) + len(skip), len(self._tree_rows))
+                tree_distances, positions = self._tree.query(target, k=fetch)
+                tree_rows = self._tree_rows[np.atleast_1d(positions)]
+                tree_distances = np.where(np.isin(tree_rows, dirty), np.inf, np.atleast_1d(tree_distances))
+                changed = np.concatenate([dirty, np.arange(self._tree_size, n)])
+                changed = changed[self._alive[changed]]
+                rows = np.concatenate([tree_rows, changed])
+                distances = np.concatenate([tree_distances, self._scan(changed, target)])
+
+            distances[np.isin(rows, skip)] = np.inf
+            if len(rows) > k:
+                nearest = np.argpartition(distances, k)[:k]
+                rows, distances = rows[nearest], distances[nearest]
+            order = np.argsort(distances, kind="stable")
+            return [(self._keys[rows[i]], float(distances[i])) for i in order if np.isfinite(distances[i])]
+
+
+class TeammateIndex:
+    """Skill and capability indexes over every stored translated profile"""
+
+    def __init__(self):
+        self.indexes = {space: VectorIndex(len(names)) for space, names in SPACES.items()}
+        self.usernames = {}
+        self.loaded = False
+        self._load_lock = None
+
+    def upsert_profiles(self, users):
+        """Score [(user_id, username, translated_data)] in one batch and index the results"""
+        rows, keys = [], []
+        for user_id, username, translated in users:
+            try:
+                rows.append(profile_features(translated))
+            except (KeyError, TypeError) as e:
+                print(f"⚠ Skipping teammate index entry for {username}: missing {e}")
+                continue
+            keys.append((user_id, username))
+        if not rows:
+            return 0
+
+        scores = score_features(np.array(rows, dtype=np.float64))
+        for i, (user_id, username) in enumerate(keys):
+            self.usernames[user_id] = username
+            self.indexes["skill"].upsert(user_id, scores["skill_vector"][i])
+            self.indexes["capability"].upsert(user_id, scores["capability_assessment"][i])
+        return len(keys)
+
+    def upsert(self, user_id, username, translated):
+        return self.upsert_profiles([(user_id, username, translated)])
+
+    def remove(self, user_id):
+        for index in self.indexes.values():
+            index.remove(user_id)
+        self.usernames.pop(user_id, None)
+
+    async def ensure_loaded(self, github_data_collection, batch_size=1000):
+        """Build the indexes from github_data on first use"""
+        if self.loaded:
+            return
+        if self._load_lock is None:
+            self._load_lock = asyncio.Lock()
+        async with self._load_lock:
+            if self.loaded:
+                return
+            batch, total = [], 0
+            cursor = github_data_collection.find(
+                {"translated_data": {"$exists": True}},
+                {"_id": 0, "user_id": 1, "username": 1, "translated_data": 1}
+            )
+            async for doc in cursor:
+                batch.append((doc["user_id"], doc.get("username"), doc["translated_data"]))
+                if len(batch) >= batch_size:
+                    total += self.upsert_profiles(batch)
+                    batch = []
+            total += self.upsert_profiles(batch)
+            self.loaded = True
+            print(f"✓ Teammate index built from {total} profiles")
+
+    def find(self, space, mode, k, user_id=None, vector=None):
+        """k most similar or complementary users to a stored user or to an explicit vector, by username"""
+        index = self.indexes[space]
+        if vector is None:
+            vector = index.vector(user_id)
+            if vector is None:
+                return None
+        target = 1.0 - np.asarray(vector) if mode == "complementary" else np.asarray(vector)
+
+        results = []
+        for key, distance in index.query(target, k, exclude=(user_id,) if user_id else ()):
+            results.append({
+                "username": self.usernames.get(key),
+                "distance": round(distance, 4),
+                "matched_on": matched_on(SPACES[space], target, index.vector(key))
+            })
+        return results
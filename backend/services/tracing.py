@@ -0,0 +1,209 @@
+import asyncio
+import contextvars
+import os
+import re
+import sys
+import threading
+import time
+import uuid
+from collections import defaultdict
+from contextlib import contextmanager
+
+from pymongo import monitoring
+from starlette.datastructures import MutableHeaders
+from starlette.routing import Match
+
+from services.metrics import MetricsRegistry
+
+# Requests slower than this get a log line breaking their time down by span kind
+TRACE_SLOW_REQUEST_SECONDS = float(os.getenv("TRACE_SLOW_REQUEST_SECONDS", "1.0"))
+# How often the event loop is checked for blocking work
+EVENT_LOOP_LAG_INTERVAL_SECONDS = float(os.getenv("EVENT_LOOP_LAG_INTERVAL_SECONDS", "0.5"))
+
+TRACE_HEADER = "x-trace-id"
+TRACE_ID_PATTERN = re.compile(r"^[0-9a-fA-F-]{8,64}$")
+
+# Per-process metrics; each uvicorn worker serves its own /metrics
+METRICS = MetricsRegistry()
+REQUEST_SECONDS = METRICS.histogram(
+    "http_request_duration_seconds", "Time from request start to the last response byte, by route template",
+    ("method", "route", "status"))
+REQUESTS_IN_FLIGHT = METRICS.gauge(
+    "http_requests_in_flight", "Requests currently being served, by route template", ("method", "route"))
+SPAN_SECONDS = METRICS.histogram(
+    "span_duration_seconds", "Time spent in one downstream call or pipeline stage",
+    ("kind", "name", "outcome"))
+EVENT_LOOP_LAG_SECONDS = METRICS.histogram(
+    "event_loop_lag_seconds", "How late the event loop woke from a timed sleep (time it was blocked)")
+
+_current_trace = contextvars.ContextVar("trace", default=None)
+
+
+class Trace:
+    """Trace ID plus time spent per span kind for one request"""
+
+    def __init__(self, trace_id=None):
+        self.trace_id = trace_id or uuid.uuid4().hex
+        self.span_seconds = defaultdict(float)
+        self._lock = threading.Lock()
+
+    def add(self, kind, seconds):
+        with self._lock:
+            self.span_seconds[kind] += seconds
+
+    def breakdown(self):
+        return ", ".join(f"{kind} {seconds:.3f}s" for kind, seconds in sorted(self.span_seconds.items()))
+
+
+def current_trace_id():
+    """Trace ID of the request being served, None outside a request"""
+    trace = _current_trace.get()
+    return trace.trace_id if trace else None
+
+
+def record_span(kind, name, seconds, outcome="ok"):
+    SPAN_SECONDS.observe(seconds, kind=kind, name=name, outcome=outcome)
+    trace = _current_trace.get()
+    if trace is not None:
+        trace.add(kind, seconds)
+
+
+@contextmanager
+def span(kind, name):
+    """Time a block (sync or async) as one span of the current request"""
+    start = time.perf_counter()
+    outcome = "ok"
+    try:
+        yield
+    except BaseException:
+        outcome = "error"
+        raise
+    finally:
+        record_span(kind, name, time.perf_counter() - start, outcome)
+
+
+class MongoCommandSpans(monitoring.CommandListener):
+    """Records every MongoDB command as a mongo span; pass to the client's event_listeners"""
+
+    def __init__(self):
+        self._collections = {}
+
+    def started(self, event):
+        collection = event.command.get(event.command_name)
+        if isinstance(collection, str):
+            self._collections[(event.connection_id, event.request_id)] = collection
+
+    def _finish(self, event, outcome):
+        collection = self._collections.pop((event.connection_id, event.request_id), None)
+        name = f"{event.command_name} {collection}" if collection else event.command_name
+        # motor runs commands on executor threads with the request's context copied in
+        record_span("mongo", name, event.duration_micros / 1e6, outcome)
+
+    def succeeded(self, event):
+        self._finish(event, "ok")
+
+    def failed(self, event):
+        self._finish(event, "error")
+
+
+def route_template(scope):
+    """Path template of the route a request will match (keeps metric labels low-cardinality)"""
+    app = scope.get("app")
+    partial = None
+    for route in getattr(getattr(app, "router", None), "routes", []):
+        match, _ = route.matches(scope)
+        if match == Match.FULL:
+            return route.path
+        if match == Match.PARTIAL and partial is None:
+            partial = route.path
+    return partial or "unmatched"
+
+
+def incoming_trace_id(headers):
+    """Caller-supplied trace ID from X-Trace-Id or a W3C traceparent header, if well-formed"""
+    for name, value in headers:
+        if name == b"traceparent":
+            parts = value.decode("latin-1").split("-")
+            if len(parts) >= 2 and TRACE_ID_PATTERN.match(parts[1]):
+                return parts[1]
+        elif name == TRACE_HEADER.encode():
+            value = value.decode("latin-1")
+            if TRACE_ID_PATTERN.match(value):
+                return value
+    return None
+
+
+class TracingMiddleware:
+    """Per-route latency, in-flight and status metrics, and a trace ID for every HTTP request"""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        method, route = scope["method"], route_template(scope)
+        trace = Trace(incoming_trace_id(scope["headers"]))
+        token = _current_trace.set(trace)
+        status = 500
+
+        async def send_with_trace_id(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+                MutableHeaders(scope=message).append("X-Trace-Id", trace.trace_id)
+            await send(message)
+
+        REQUESTS_IN_FLIGHT.inc(method=method, route=route)
+        start = time.perf_counter()
+        try:
+            # Streaming responses (SSE) are timed until their last chunk is sent
+            await self.app(scope, receive, send_with_trace_id)
+        finally:
+            elapsed = time.perf_counter() - start
+            REQUESTS_IN_FLIGHT.dec(method=method, route=route)
+            REQUEST_SECONDS.observe(elapsed, method=method, route=route, status=status)
+            if elapsed >= TRACE_SLOW_REQUEST_SECONDS:
+                print(f"⚠ Slow request {method} {route} {status} in {elapsed:.3f}s: "
+                      f"{trace.breakdown() or 'no spans'}")
+            _current_trace.reset(token)
+
+
+async def monitor_event_loop_lag(interval=EVENT_LOOP_LAG_INTERVAL_SECONDS):
+    """Background task: oversleeping a timer means something blocked the loop"""
+    while True:
+        start = time.perf_counter()
+        await asyncio.sleep(interval)
+        EVENT_LOOP_LAG_SECONDS.observe(max(0.0, time.perf_counter() - start - interval))
+
+
+class TraceIdStream:
+    """Text stream wrapper that prefixes each line written during a request with its trace ID"""
+
+    def __init__(self, stream):
+        self._stream = stream
+        self._line_start = True
+
+    def write(self, text):
+        written = len(text)
+        trace_id = current_trace_id()
+        if trace_id and text:
+            prefix = f"[trace={trace_id}] "
+            text = (prefix if self._line_start else "") + text[:-1].replace("\n", "\n" + prefix) + text[-1]
+        if text:
+            self._line_start = text.endswith("\n")
+        self._stream.write(text)
+        return written
+
+    def __getattr__(self, name):
+        return getattr(self._stream, name)
+
+
+def install_trace_logging():
+    """Route print() output through TraceIdStream so request logs carry the trace ID"""
+    for name in ("stdout", "stderr"):
+        stream = getattr(sys, name)
+        if not isinstance(stream, TraceIdStream):
+            setattr(sys, name, TraceIdStream(stream))
@@ -0,0 +1,108 @@
+import os
+import shutil
+import socket
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+# Same import roots main.py uses: the backend package and the translation scripts
+BACKEND = Path(__file__).resolve().parent.parent
+for path in (BACKEND, BACKEND / "translation"):
+    if str(path) not in sys.path:
+        sys.path.insert(0, str(path))
+
+# Point at an existing server instead of starting mongod from PATH
+MONGO_TEST_URI = os.getenv("MONGO_TEST_URI")
+# S3-compatible endpoint (e.g. MinIO) for the S3 artifact tests; moto is used when unset
+ARTIFACT_TEST_S3_ENDPOINT = os.getenv("ARTIFACT_TEST_S3_ENDPOINT")
+
+
+def free_port():
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def wait_for_mongo(uri, proc, timeout=60):
+    from pymongo import MongoClient
+    from pymongo.errors import PyMongoError
+
+    deadline = time.monotonic() + timeout
+    client = MongoClient(uri, serverSelectionTimeoutMS=1000)
+    try:
+        while time.monotonic() < deadline:
+            if proc is not None and proc.poll() is not None:
+                raise RuntimeError(f"mongod exited with {proc.returncode}")
+            try:
+                client.admin.command("ping")
+                return
+            except PyMongoError:
+                time.sleep(0.25)
+    finally:
+        client.close()
+    raise RuntimeError(f"MongoDB at {uri} not reachable after {timeout}s")
+
+
+@pytest.fixture(scope="session")
+def mongo_uri(tmp_path_factory):
+    """A real MongoDB: MONGO_TEST_URI, else mongod from PATH on a throwaway dbpath (skips when neither)"""
+    if MONGO_TEST_URI:
+        wait_for_mongo(MONGO_TEST_URI, None)
+        yield MONGO_TEST_URI
+        return
+    binary = shutil.which("mongod")
+    if not binary:
+        pytest.skip("needs mongod on PATH or MONGO_TEST_URI")
+    dbpath = tmp_path_factory.mktemp("mongod")
+    port = free_port()
+    proc = subprocess.Popen([binary, "--dbpath", str(dbpath), "--port", str(port), "--bind_ip", "127.0.0.1"],
+                            stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    uri = f"mongodb://127.0.0.1:{port}"
+    try:
+        wait_for_mongo(uri, proc)
+        yield uri
+    finally:
+        proc.terminate()
+        proc.wait(timeout=30)
+
+
+@pytest.fixture
+def mongo_db(mongo_uri, request):
+    """A fresh database on the test server, dropped afterwards"""
+    from pymongo import MongoClient
+
+    client = MongoClient(mongo_uri)
+    name = f"test_{request.node.name}".replace("[", "_").replace("]", "").replace("-", "_")[:60]
+    client.drop_database(name)
+    try:
+        yield client[name]
+    finally:
+        client.drop_database(name)
+        client.close()
+
+
+@pytest.fixture
+def s3_bucket(monkeypatch):
+    """(bucket, endpoint_url) on ARTIFACT_TEST_S3_ENDPOINT, or on moto's in-process S3"""
+    boto3 = pytest.importorskip("boto3")
+    monkeypatch.setenv("AWS_DEFAULT_REGION", "us-east-1")
+    bucket = f"divergence-test-{os.getpid()}-{time.monotonic_ns()}"
+    if ARTIFACT_TEST_S3_ENDPOINT:
+        monkeypatch.setenv("AWS_ACCESS_KEY_ID", os.getenv("AWS_ACCESS_KEY_ID", "minioadmin"))
+        monkeypatch.setenv("AWS_SECRET_ACCESS_KEY", os.getenv("AWS_SECRET_ACCESS_KEY", "minioadmin"))
+        client = boto3.client("s3", endpoint_url=ARTIFACT_TEST_S3_ENDPOINT)
+        client.create_bucket(Bucket=bucket)
+        yield bucket, ARTIFACT_TEST_S3_ENDPOINT
+        for item in client.list_objects_v2(Bucket=bucket).get("Contents", []):
+            client.delete_object(Bucket=bucket, Key=item["Key"])
+        client.delete_bucket(Bucket=bucket)
+        return
+    moto = pytest.importorskip("moto")
+    monkeypatch.setenv("AWS_ACCESS_KEY_ID", "testing")
+    monkeypatch.setenv("AWS_SECRET_ACCESS_KEY", "testing")
+    with moto.mock_aws():
+        boto3.client("s3").create_bucket(Bucket=bucket)
+        yield bucket, None
@@ -0,0 +1,94 @@
+import io
+import time
+
+import pytest
+
+from services.artifact_storage import (ArtifactNotFound, GridFSArtifactStorage, LocalArtifactStorage,
+                                       S3ArtifactStorage, artifact_key, publish_pipeline_artifacts)
+
+BIG = bytes(range(256)) * 8192  # 2 MiB: more than one CHUNK_SIZE part / GridFS chunk
+
+
+@pytest.fixture(params=["local", "gridfs", "s3"])
+def storage(request, tmp_path):
+    if request.param == "local":
+        return LocalArtifactStorage(tmp_path / "store")
+    if request.param == "gridfs":
+        return GridFSArtifactStorage(request.getfixturevalue("mongo_db"))
+    bucket, endpoint_url = request.getfixturevalue("s3_bucket")
+    return S3ArtifactStorage(bucket, endpoint_url)
+
+
+def test_upload_read_and_replace(storage, tmp_path):
+    key = artifact_key("u1", "filtered.json")
+    source = tmp_path / "filtered.json"
+    source.write_bytes(b'{"a": 1}')
+    storage.upload_file(key, source)
+    assert storage.read_bytes(key) == b'{"a": 1}'
+
+    source.write_bytes(BIG)
+    storage.upload_file(key, source)
+    assert storage.read_bytes(key) == BIG
+    with storage.open(key) as f:
+        assert f.read(3) == BIG[:3]
+
+
+def test_write_from_stream(storage):
+    key = artifact_key("u1", "responses/translated.json.gz")
+    storage.write(key, io.BytesIO(BIG))
+    assert storage.read_bytes(key) == BIG
+
+
+def test_missing_and_delete(storage):
+    key = artifact_key("u1", "translated.json")
+    with pytest.raises(ArtifactNotFound):
+        storage.read_bytes(key)
+    assert storage.modified_at(key) is None
+    storage.delete(key)  # deleting nothing is not an error
+
+    storage.write(key, io.BytesIO(b"{}"))
+    storage.delete(key)
+    with pytest.raises(ArtifactNotFound):
+        storage.read_bytes(key)
+    assert storage.modified_at(key) is None
+
+
+def test_modified_at(storage):
+    key = artifact_key("u1", "RESULTS.txt")
+    before = time.time()
+    storage.write(key, io.BytesIO(b"results"))
+    modified = storage.modified_at(key)
+    # S3 and GridFS keep whole milliseconds or seconds, and their clocks are not ours
+    assert before - 5 <= modified <= time.time() + 5
+
+
+def test_holds_only_the_stored_file_itself(storage, tmp_path):
+    key = artifact_key("u1", "repos.json")
+    source = tmp_path / "repos.json"
+    source.write_bytes(b"[]")
+    assert not storage.holds(key, source)
+    if isinstance(storage, LocalArtifactStorage):
+        stored = storage.root / "u1" / "repos.json"
+        stored.parent.mkdir(parents=True)
+        stored.write_bytes(b"[]")
+        assert storage.holds(key, stored)
+        storage.upload_file(key, stored)  # a no-op, not a copy onto itself
+        assert storage.read_bytes(key) == b"[]"
+
+
+def test_local_keys_cannot_escape_the_root(tmp_path):
+    storage = LocalArtifactStorage(tmp_path / "store")
+    with pytest.raises(ValueError):
+        storage.read_bytes("../outside.json")
+
+
+def test_publish_pipeline_artifacts(storage, tmp_path):
+    user_dir = tmp_path / "scratch"
+    user_dir.mkdir()
+    for name, body in [("RESULTS.txt", b"r"), ("filtered.json", b"{}"), ("translated.json", b'{"t": 1}')]:
+        (user_dir / name).write_bytes(body)
+
+    assert publish_pipeline_artifacts(storage, "u2", user_dir) == ["RESULTS.txt", "filtered.json", "translated.json"]
+    assert storage.read_bytes(artifact_key("u2", "translated.json")) == b'{"t": 1}'
+    with pytest.raises(ArtifactNotFound):
+        storage.read_bytes(artifact_key("u2", "repos.json"))
@@ -0,0 +1,109 @@
+import asyncio
+from datetime import datetime, timedelta
+
+import pytest
+from motor.motor_asyncio import AsyncIOMotorClient
+
+from services.indexes import (HOT_QUERIES, INDEXES, backfill_participants, bootstrap, ensure_indexes, explain_query,
+                              verify_query_plans)
+from services.pipeline_runs import pipeline_run_histograms
+
+# Pipeline runs well before the default stats window
+RUNS_START = datetime.utcnow() - timedelta(days=90)
+
+# A few documents per collection, so the planner chooses between real plans rather than EOF
+SEED = {
+    "users": [{"username": f"user{i}", "github_id": i} for i in range(50)],
+    "github_data": [{"user_id": str(i), "username": f"user{i}"} for i in range(50)],
+    "projects": [{"project_id": str(i), "participants": [f"user{i}", "user0"], "createdAt": datetime(2029, 1, 1),
+                  **({"scopingThreadId": f"thread{i}"} if i % 2 else {})} for i in range(50)],
+    "project_compatibility": [{"project_id": str(i), "members": [f"user{i}"]} for i in range(50)],
+    "predictive_data": [{"user_id": str(i), "translated_hash": "h", "model_version": "1"} for i in range(50)],
+    "pipeline_runs": [{"username": f"user{i}", "started_at": RUNS_START + timedelta(hours=i),
+                       "wall_seconds": i, "stages": {}, "counters": {}} for i in range(50)],
+    "backboard_assistants": [{"prompt_hash": str(i)} for i in range(5)],
+}
+
+
+@pytest.fixture
+def db(mongo_uri, mongo_db):
+    """run(make): awaits make(db) with a motor handle on the fresh test database"""
+    def run(make):
+        async def main():
+            client = AsyncIOMotorClient(mongo_uri)
+            try:
+                return await make(client[mongo_db.name])
+            finally:
+                client.close()
+        return asyncio.run(main())
+    return run
+
+
+def seed(sync_db):
+    for collection, docs in SEED.items():
+        sync_db[collection].insert_many([dict(d) for d in docs])
+
+
+def test_every_declared_index_builds_on_existing_data(db, mongo_db):
+    seed(mongo_db)
+    assert db(ensure_indexes) == []
+    for collection, indexes in INDEXES.items():
+        names = set(mongo_db[collection].index_information())
+        assert {index.document["name"] for index in indexes} <= names
+
+
+@pytest.mark.parametrize("collection, query, sort", HOT_QUERIES,
+                         ids=[f"{c}-{i}" for i, (c, _, _) in enumerate(HOT_QUERIES)])
+def test_hot_query_plans_use_an_index(db, mongo_db, collection, query, sort):
+    seed(mongo_db)
+    db(ensure_indexes)
+    stages = db(lambda d: explain_query(d, collection, query, sort))
+    assert "COLLSCAN" not in stages
+    assert "IXSCAN" in stages
+
+
+def test_verify_query_plans_passes(db, mongo_db):
+    seed(mongo_db)
+    db(ensure_indexes)
+    assert db(verify_query_plans) == []
+
+
+def test_verify_query_plans_reports_collection_scans(db, mongo_db):
+    seed(mongo_db)  # no indexes built
+    scans = db(lambda d: verify_query_plans(d, [("users", {"username": "user1"}, None)]))
+    assert [s[:2] for s in scans] == [("users", {"username": "user1"})]
+
+
+@pytest.mark.parametrize("collection, field", [("users", "username"), ("users", "github_id"),
+                                               ("github_data", "user_id")])
+def test_duplicates_fail_a_verified_bootstrap(db, mongo_db, collection, field):
+    docs = [dict(d) for d in SEED[collection]]
+    docs.append({**docs[0]})
+    mongo_db[collection].insert_many(docs)
+
+    assert db(ensure_indexes) == [collection]
+    with pytest.raises(RuntimeError, match=collection):
+        db(lambda d: bootstrap(d, verify=True))
+    db(lambda d: bootstrap(d, verify=False))  # logged only
+
+
+def test_pipeline_stats_always_filter_on_started_at(db, mongo_db):
+    seed(mongo_db)
+    db(ensure_indexes)
+    stats = db(lambda d: pipeline_run_histograms(d.pipeline_runs, since=RUNS_START + timedelta(hours=10)))
+    assert stats["summary"]["runs"] == 40
+    # Without a start time only the recent window is read
+    recent = db(lambda d: pipeline_run_histograms(d.pipeline_runs))
+    assert recent["summary"] == {} or recent["summary"]["runs"] == 0
+
+
+def test_backfill_participants(db, mongo_db):
+    mongo_db.projects.insert_many([
+        {"project_id": "a", "ownerUsername": "alice", "teamMembers": ["bob", "alice", "", "carol"]},
+        {"project_id": "b", "ownerUsername": "alice"},
+        {"project_id": "c", "ownerUsername": "x", "participants": ["x", "y"]},
+    ])
+    assert db(bootstrap) is None
+    participants = {p["project_id"]: p["participants"] for p in mongo_db.projects.find({}, {"_id": 0})}
+    assert participants == {"a": ["alice", "bob", "carol"], "b": ["alice"], "c": ["x", "y"]}
+    assert db(backfill_participants) == 0  # idempotent
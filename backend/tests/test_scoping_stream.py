@@ -0,0 +1,114 @@
+import ast
+import json
+import random
+
+import pytest
+
+from services.scoping_stream import ScopingReplyParser, parse_scoping_reply, reply_confidence
+
+# Characters that stress the string state: quotes, escapes, control characters, non-BMP (surrogate pairs)
+ALPHABET = list("abc XYZ 019 ,:{}[]") + ['"', "'", "\\", "/", "\n", "\t", "\r", "\b", "\f", "\x00", "\x1f",
+                                          "é", "ß", "中", " ", "😀", "𝄞"]
+
+
+def random_text(rng, max_len=40):
+    return "".join(rng.choice(ALPHABET) for _ in range(rng.randint(0, max_len)))
+
+
+def random_reply(rng):
+    return {
+        "question": random_text(rng),
+        "confidence": rng.choice([0, 1, 0.5, round(rng.random(), 3), 1e-3]),
+        "reasoning": random_text(rng),
+        "understood_so_far": {
+            "problem": random_text(rng, 10),
+            "features": [random_text(rng, 8) for _ in range(rng.randint(0, 3))],
+            "constraints": [{"kind": random_text(rng, 5), "strict": rng.random() < 0.5}],
+        },
+        "ready": rng.choice([True, False, None]),
+    }
+
+
+def chunked(text, rng):
+    """text split at random boundaries, chunk sizes 1..16"""
+    i = 0
+    while i < len(text):
+        size = rng.randint(1, 16)
+        yield text[i:i + size]
+        i += size
+
+
+def run(text, chunks):
+    parser = ScopingReplyParser()
+    deltas, fields = [], []
+    for chunk in chunks:
+        for kind, name, value in parser.feed(chunk):
+            (deltas if kind == "delta" else fields).append((name, value))
+    return parser, deltas, fields
+
+
+def encodings(reply, rng):
+    yield json.dumps(reply)
+    yield json.dumps(reply, ensure_ascii=False)
+    yield json.dumps(reply, indent=2, ensure_ascii=rng.random() < 0.5)
+    yield "```json\n" + json.dumps(reply, separators=(",", ":")) + "\n```"
+
+
+@pytest.mark.parametrize("seed", range(200))
+def test_matches_json_loads_char_by_char_and_random_chunks(seed):
+    rng = random.Random(seed)
+    reply = random_reply(rng)
+    for text in encodings(reply, rng):
+        expected = parse_scoping_reply(text, 0.5)
+        assert expected == reply
+        for chunks in (list(text), list(chunked(text, rng))):
+            parser, deltas, fields = run(text, chunks)
+            assert parser.fields == expected
+            assert [name for name, _ in fields] == list(expected)
+            assert "".join(value for name, value in deltas if name == "question") == expected["question"]
+            assert {name for name, _ in deltas} <= {"question"}
+
+
+@pytest.mark.parametrize("seed", range(50))
+def test_single_quoted_pseudo_json(seed):
+    # The system prompt's own example is single-quoted; its top-level fields still parse
+    rng = random.Random(seed)
+    question = "".join(rng.choice(list("abc XYZ?!,:{}[]\"'") + ["é", "😀"]) for _ in range(30))
+    confidence = round(rng.random(), 2)
+    quoted = question.replace("'", "\\'")
+    text = "{'question': '%s', 'confidence': %s, 'reasoning': 'ok'}" % (quoted, confidence)
+    expected = ast.literal_eval(text)
+    assert expected["question"] == question
+    for chunks in (list(text), list(chunked(text, rng))):
+        parser, deltas, _ = run(text, chunks)
+        assert parser.fields == expected
+        assert "".join(value for _, value in deltas) == question
+
+
+def test_escape_and_surrogate_pair_split_across_chunks():
+    text = json.dumps({"question": 'a\\"b\n😀c', "confidence": 0.9})
+    assert "\\ud83d\\ude00" in text
+    split = text.index("\\ude00") + 3  # inside the low surrogate's hex digits
+    parser, deltas, _ = run(text, [text[:split], text[split:]])
+    assert parser.fields == {"question": 'a\\"b\n😀c', "confidence": 0.9}
+    assert "".join(value for _, value in deltas) == 'a\\"b\n😀c'
+
+
+def test_prose_before_the_object_is_skipped():
+    parser, _, _ = run("", ['Sure! Here is the JSON:\n```json\n{"question": "Who', ' uses it?", "confidence": .5}'])
+    assert parser.fields["question"] == "Who uses it?"
+    # Not valid JSON, so the scalar is kept as text; reply_confidence still reads it
+    assert parser.fields["confidence"] == ".5"
+    assert reply_confidence(parser.fields, 0.2) == 0.5
+
+
+@pytest.mark.parametrize("confidence, expected", [(0.9, 0.9), ("0.8", 0.8), (".5", 0.5), ("high", 0.3),
+                                                  (None, 0.3), ([1], 0.3)])
+def test_reply_confidence(confidence, expected):
+    assert reply_confidence({"confidence": confidence}, 0.3) == expected
+    assert reply_confidence({}, 0.3) == 0.3
+
+
+def test_parse_scoping_reply_falls_back_to_raw_text():
+    assert parse_scoping_reply("not json", 0.2) == {"question": "not json", "confidence": 0.2}
+    assert parse_scoping_reply('"a string"', 0.2) == {"question": '"a string"', "confidence": 0.2}
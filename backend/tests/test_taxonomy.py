@@ -0,0 +1,48 @@
+import json
+import os
+
+import pytest
+
+import taxonomy
+
+
+def write(path, category, mtime):
+    path.write_text(json.dumps({"categories": {category: ["numpy"]}}))
+    os.utime(path, (mtime, mtime))
+
+
+@pytest.fixture
+def data_file(tmp_path, monkeypatch):
+    path = tmp_path / "taxonomy.json"
+    write(path, "science", 1_000_000)
+    monkeypatch.setattr(taxonomy, "TAXONOMY_FILE", path)
+    monkeypatch.setattr(taxonomy, "_index", None)
+    monkeypatch.setattr(taxonomy, "_index_mtime", None)
+    return path
+
+
+def test_edits_are_picked_up_after_the_check_interval(data_file, monkeypatch):
+    clock = [100.0]
+    monkeypatch.setattr(taxonomy.time, "monotonic", lambda: clock[0])
+    assert taxonomy.library_category("numpy") == "science"
+
+    write(data_file, "ml", 2_000_000)
+    clock[0] += taxonomy.TAXONOMY_RELOAD_CHECK_SECONDS / 2
+    assert taxonomy.library_category("numpy") == "science"  # not checked yet
+
+    clock[0] += taxonomy.TAXONOMY_RELOAD_CHECK_SECONDS
+    assert taxonomy.library_category("numpy") == "ml"
+
+
+def test_no_stat_within_the_check_interval(data_file, monkeypatch):
+    taxonomy.get_taxonomy()
+    monkeypatch.setattr(taxonomy.os, "stat", lambda path: pytest.fail("stat on a cached lookup"))
+    for _ in range(1000):
+        taxonomy.get_taxonomy()
+
+
+def test_reload_taxonomy_applies_an_edit_immediately(data_file):
+    assert taxonomy.library_category("numpy") == "science"
+    write(data_file, "ml", 2_000_000)
+    taxonomy.reload_taxonomy(data_file)
+    assert taxonomy.library_category("numpy") == "ml"
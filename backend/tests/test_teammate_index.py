@@ -0,0 +1,20 @@
+import numpy as np
+
+from services.teammate_index import SPACES, TeammateIndex
+
+
+def test_results_carry_only_username_and_match_fields():
+    index = TeammateIndex()
+    rng = np.random.default_rng(0)
+    for i in range(10):
+        index.usernames[f"id{i}"] = f"user{i}"
+        for space, names in SPACES.items():
+            index.indexes[space].upsert(f"id{i}", rng.random(len(names)))
+
+    for space in SPACES:
+        results = index.find(space, "complementary", 3, user_id="id0")
+        assert len(results) == 3
+        for result in results:
+            assert set(result) == {"username", "distance", "matched_on"}
+            assert result["username"] != "user0"
+            assert set(result["matched_on"]) <= set(SPACES[space])
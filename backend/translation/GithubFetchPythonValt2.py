@@ -5,14 +5,24 @@ import shutil
 import subprocess
 import requests
 import time
+import json
 from pathlib import Path
+from repo_store import resolve_head, find_result_path
+from pipeline_metrics import StageMetrics
 
 # Optional: Use a GitHub token to increase API rate limits
 GITHUB_TOKEN = os.getenv('GITHUB_PERSACCESS_TOKEN')
 
+# GitHub endpoints (overridable so load tests can use a local stand-in)
+GITHUB_API_URL = os.getenv('GITHUB_API_URL', 'https://api.github.com')
+GITHUB_WEB_URL = os.getenv('GITHUB_WEB_URL', 'https://github.com')
+
 # Configurable: Number of repos to fetch (default 3 to reduce rate limit usage)
 MAX_REPOS = int(os.getenv('GITHUB_MAX_REPOS', '3'))
 
+# Timing and counters for this run (API calls, bytes cloned, files scanned, cache hits)
+METRICS = StageMetrics('fetch')
+
 # Files to EXCLUDE
 EXCLUDE_FILES = {
     'package-lock.json', 'yarn.lock', 'pnpm-lock.yaml', 'bun.lockb',
@@ -97,7 +107,7 @@ def fetch_all_repos_for_user(username, max_repos=None):
     if max_repos is None:
         max_repos = MAX_REPOS
     
-    url = f"https://api.github.com/users/{username}/repos"
+    url = f"{GITHUB_API_URL}/users/{username}/repos"
     params = {
         'page': 1,
         'per_page': max_repos,
@@ -126,21 +136,22 @@ def fetch_all_repos_for_user(username, max_repos=None):
                 print(f"Retrying in {wait_time} seconds...")
                 time.sleep(wait_time)
             
+            METRICS.incr('github_api_calls')
             response = requests.get(url, params=params, headers=headers, timeout=10)
-        
-        # Check rate limit status
-        rate_limit_remaining = response.headers.get('X-RateLimit-Remaining')
-        rate_limit_reset = response.headers.get('X-RateLimit-Reset')
-        
-        if rate_limit_remaining:
-            print(f"GitHub API rate limit: {rate_limit_remaining} requests remaining")
-            if int(rate_limit_remaining) < 10:
-                print(f"⚠ WARNING: Only {rate_limit_remaining} API requests remaining!")
-                if rate_limit_reset:
-                    from datetime import datetime
-                    reset_time = datetime.fromtimestamp(int(rate_limit_reset))
-                    print(f"Rate limit resets at: {reset_time}")
-        
+            
+            # Check rate limit status
+            rate_limit_remaining = response.headers.get('X-RateLimit-Remaining')
+            rate_limit_reset = response.headers.get('X-RateLimit-Reset')
+            
+            if rate_limit_remaining:
+                print(f"GitHub API rate limit: {rate_limit_remaining} requests remaining")
+                if int(rate_limit_remaining) < 10:
+                    print(f"⚠ WARNING: Only {rate_limit_remaining} API requests remaining!")
+                    if rate_limit_reset:
+                        from datetime import datetime
+                        reset_time = datetime.fromtimestamp(int(rate_limit_reset))
+                        print(f"Rate limit resets at: {reset_time}")
+            
             if response.status_code == 403:
                 retry_after = response.headers.get('Retry-After', '60')
                 print(f"❌ GitHub API rate limit exceeded! (attempt {attempt + 1}/{max_retries})")
@@ -190,11 +201,24 @@ def clone_repo(clone_url, dest_dir):
             capture_output=True,
             text=True
         )
+        METRICS.incr('repos_cloned')
+        METRICS.incr('bytes_cloned', directory_size(dest_dir))
         return True
     except subprocess.CalledProcessError as e:
         print(f"Error cloning repository: {e.stderr}")
         return False
 
+def directory_size(path):
+    """Total size in bytes of all files under path"""
+    total = 0
+    for root, dirs, files in os.walk(path):
+        for name in files:
+            try:
+                total += os.path.getsize(os.path.join(root, name))
+            except OSError:
+                pass
+    return total
+
 def process_local_repo(repo_path, output_file, repo_name):
     """Process a locally cloned repository"""
     processed_files = []
@@ -232,6 +256,8 @@ def process_local_repo(repo_path, output_file, repo_name):
                         f.write("\n\n")
                     
                     processed_files.append(rel_filepath)
+                    METRICS.incr('files_scanned')
+                    METRICS.incr('bytes_dumped', len(content))
                     print(f"Processed: {rel_filepath}")
                     
                 except Exception as e:
@@ -266,7 +292,7 @@ def fetch_github_repo(profile_or_repo_url, output_file="RESULTS.txt"):
             repos_info = fetch_all_repos_for_user(username, max_repos=MAX_REPOS)
             repos_to_process = [(r['name'], r['clone_url']) for r in repos_info]
         else:
-            clone_url = f"https://github.com/{username}/{repo}.git"
+            clone_url = f"{GITHUB_WEB_URL}/{username}/{repo}.git"
             repos_to_process = [(repo, clone_url)]
         
         # Clear output file
@@ -276,11 +302,27 @@ def fetch_github_repo(profile_or_repo_url, output_file="RESULTS.txt"):
             f.write(f"{'='*80}\n\n")
         
         total_files = 0
+        repo_index = []
         
         # Process each repository
         for repo_name, clone_url in repos_to_process:
             repo_dir = os.path.join(temp_dir, repo_name)
             
+            # Skip the clone entirely if this commit has already been analyzed
+            head_oid = resolve_head(clone_url)
+            METRICS.incr('git_ls_remote_calls')
+            cached = find_result_path(clone_url, head_oid) is not None
+            repo_index.append({
+                'name': repo_name,
+                'clone_url': clone_url,
+                'head_oid': head_oid,
+                'cached': cached
+            })
+            if cached:
+                METRICS.incr('repo_cache_hits')
+                print(f"{repo_name} unchanged at {head_oid[:12]}, using stored analysis")
+                continue
+            
             # Clone the repository
             if clone_repo(clone_url, repo_dir):
                 # Process the cloned repository
@@ -297,6 +339,11 @@ def fetch_github_repo(profile_or_repo_url, output_file="RESULTS.txt"):
                 except Exception as e:
                     print(f"Warning: Error cleaning {repo_dir}: {e}")
         
+        # Repo list with HEAD OIDs, read by filtering.py to reuse / store per-repo results
+        index_file = Path(output_file).with_name('repos.json')
+        with open(index_file, 'w', encoding='utf-8') as f:
+            json.dump(repo_index, f, indent=2)
+        
         print(f"\nDone! Saved {total_files} files to {output_file}")
         return output_file
         
@@ -344,4 +391,7 @@ if __name__ == "__main__":
     
     profile_or_repo_url = sys.argv[1]
     output_file = sys.argv[2] if len(sys.argv) > 2 else "RESULTS.txt"
-    fetch_github_repo(profile_or_repo_url, output_file)
\ No newline at end of file
+    try:
+        fetch_github_repo(profile_or_repo_url, output_file)
+    finally:
+        METRICS.write()
\ No newline at end of file
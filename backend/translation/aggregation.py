@@ -0,0 +1,225 @@
+import statistics
+from collections import defaultdict
+from datetime import datetime
+
+import numpy as np
+
+from taxonomy import count_matches, indicator_groups
+
+# File extensions counted towards each side of the composition split
+FRONTEND_TYPES = {'html', 'css', 'scss', 'sass', 'jsx', 'tsx', 'vue'}
+BACKEND_TYPES = {'py', 'java', 'go', 'rs', 'rb', 'php', 'js', 'ts'}
+DATA_TYPES = {'sql', 'csv', 'json', 'xml', 'parquet', 'db'}
+
+
+def commit_timestamps(commits):
+    """Commit times as a sorted int64 array of seconds since the epoch (wall-clock, as committed)"""
+    dates = [c['date'] for c in commits if c.get('date')]
+    timestamps = np.array(dates, dtype='datetime64[s]').astype(np.int64)
+    return np.sort(timestamps)
+
+
+def compute_habits(timestamps, commit_counts, repo_sizes):
+    """Cadence statistics over sorted commit timestamps (vectorized)"""
+    n = timestamps.size
+
+    if n > 1:
+        time_span_days = (timestamps[-1] - timestamps[0]) / 86400
+        frequency = n / max(time_span_days / 7, 1) if time_span_days > 0 else 0
+    else:
+        frequency = 0.0
+
+    if n > 2:
+        intervals = np.diff(timestamps)
+        consistency = 1.0 / (1.0 + intervals.std(ddof=1) / 86400)
+    else:
+        consistency = 0.0
+
+    # Every commit in a repo is attributed that repo's average commit size
+    has_commits = commit_counts > 0
+    if has_commits.any():
+        avg_commit_size = repo_sizes[has_commits].sum() / commit_counts[has_commits].sum()
+    else:
+        avg_commit_size = 0.0
+
+    if frequency > 5:
+        pattern = 'daily'
+    elif frequency > 2:
+        pattern = 'regular'
+    elif frequency > 0.5:
+        pattern = 'weekly'
+    else:
+        pattern = 'sporadic'
+
+    # Histograms (1970-01-01 was a Thursday, so shift by 3 for Monday = 0)
+    days = timestamps // 86400
+    weekday_histogram = np.bincount((days + 3) % 7, minlength=7)
+    hour_histogram = np.bincount((timestamps % 86400) // 3600, minlength=24)
+
+    # Rolling windows: most commits within any 7 / 30 day span
+    week_end = np.searchsorted(timestamps, timestamps + 7 * 86400, side='left')
+    month_end = np.searchsorted(timestamps, timestamps + 30 * 86400, side='left')
+    positions = np.arange(n)
+
+    return {
+        'frequency': round(float(frequency), 2),
+        'consistency': round(float(consistency), 3),
+        'avg_commit_size_kb': round(float(avg_commit_size), 2),
+        'commit_pattern': pattern,
+        'weekday_histogram': weekday_histogram.tolist(),
+        'hour_histogram': hour_histogram.tolist(),
+        'busiest_week_commits': int((week_end - positions).max()) if n else 0,
+        'busiest_month_commits': int((month_end - positions).max()) if n else 0
+    }
+
+
+class ProfileAggregator:
+    """Builds every translated.json aggregate incrementally, one repository at a time"""
+
+    def __init__(self):
+        self.repo_count = 0
+        self.total_commits = 0
+        self.language_counts = defaultdict(int)
+        self.library_repos = defaultdict(int)
+        self.framework_repos = defaultdict(int)
+        self.composition_counts = {'frontend': 0, 'backend': 0, 'data': 0}
+        self.skill_names = set()
+        self.repo_sizes = []
+        self.coverage_values = []
+        self.commits = []
+        self.commit_counts = []
+
+    def add_repo(self, repo):
+        """Fold one analyze_single_repo result into the running aggregates"""
+        self.repo_count += 1
+
+        # Handle both dict and list language formats
+        languages = repo.get('languages') or {}
+        if isinstance(languages, dict):
+            for lang, count in languages.items():
+                self.language_counts[lang] += int(count)
+        else:
+            for lang in languages:
+                self.language_counts[lang] += 1
+
+        # Libraries and frameworks are counted once per repository that uses them
+        for lib in repo['libraries']:
+            self.library_repos[lib] += 1
+            self.skill_names.add(lib.lower())
+        for fw in repo['frameworks']:
+            self.framework_repos[fw] += 1
+            self.skill_names.add(fw.lower())
+
+        for file_type, count in repo['file_types'].items():
+            if file_type in FRONTEND_TYPES:
+                self.composition_counts['frontend'] += count
+            if file_type in BACKEND_TYPES:
+                self.composition_counts['backend'] += count
+            if file_type in DATA_TYPES:
+                self.composition_counts['data'] += count
+
+        self.repo_sizes.append(repo['size_kb'])
+        self.coverage_values.append(repo['test_coverage'])
+        self.commits.extend(repo['commits'])
+        self.commit_counts.append(len(repo['commits']))
+        self.total_commits += len(repo['commits'])
+
+    def languages(self):
+        total = sum(self.language_counts.values())
+        # edge case: user does not use any language in repo
+        if total == 0:
+            return {}
+        return {lang: round((count / total) * 100, 2) for lang, count in self.language_counts.items()}
+
+    def libraries(self):
+        return dict(sorted(self.library_repos.items(), key=lambda x: x[1], reverse=True))
+
+    def frameworks(self):
+        return dict(sorted(self.framework_repos.items(), key=lambda x: x[1], reverse=True))
+
+    def habits(self):
+        return compute_habits(commit_timestamps(self.commits),
+                              np.array(self.commit_counts, dtype=np.int64),
+                              np.array(self.repo_sizes, dtype=np.float64))
+
+    def technical_depth(self):
+        if not self.repo_sizes:
+            return {'depth_score': 0.0, 'avg_repo_size': 0.0, 'max_repo_size': 0.0, 'level': 'beginner'}
+
+        avg_size = statistics.mean(self.repo_sizes)
+        depth_score = min(avg_size / 500, 1.0)
+
+        if depth_score > 0.7:
+            level = 'advanced'
+        elif depth_score > 0.4:
+            level = 'intermediate'
+        else:
+            level = 'beginner'
+
+        return {
+            'depth_score': round(depth_score, 3),
+            'avg_repo_size': round(avg_size, 2),
+            'max_repo_size': round(max(self.repo_sizes), 2),
+            'level': level
+        }
+
+    def composition(self):
+        total = sum(self.composition_counts.values())
+        if total == 0:
+            return {'frontend': 0.0, 'backend': 0.0, 'data': 0.0}
+        return {side: round(count / total, 3) for side, count in self.composition_counts.items()}
+
+    def skills(self):
+        # score each skill area against the taxonomy indicator sets
+        return {
+            area: round(count_matches(self.skill_names, 'skill_areas', area) / len(indicators), 3)
+            for area, indicators in indicator_groups('skill_areas').items()
+        }
+
+    def quality(self):
+        if not self.coverage_values:
+            return {'avg_test_coverage': 0.0, 'quality_score': 0.0, 'rating': 'unknown'}
+
+        avg_coverage = statistics.mean(self.coverage_values)
+        quality_score = min(avg_coverage / 100, 1.0)
+
+        if avg_coverage > 70:
+            rating = 'excellent'
+        elif avg_coverage > 40:
+            rating = 'good'
+        elif avg_coverage > 20:
+            rating = 'fair'
+        else:
+            rating = 'needs improvement'
+
+        return {
+            'avg_test_coverage': round(avg_coverage, 2),
+            'quality_score': round(quality_score, 3),
+            'rating': rating
+        }
+
+    def profile(self):
+        """The final translated.json document"""
+        return {
+            'languages': self.languages(),
+            'libraries': self.libraries(),
+            'frameworks': self.frameworks(),
+            'habits': self.habits(),
+            'technical_depth': self.technical_depth(),
+            'composition': self.composition(),
+            'skills': self.skills(),
+            'quality': self.quality(),
+            'metadata': {
+                'total_repositories': self.repo_count,
+                'total_commits': self.total_commits,
+                'analysis_timestamp': datetime.now().isoformat()
+            }
+        }
+
+
+def build_profile(repositories):
+    """Translated profile from a list of per-repo results"""
+    aggregator = ProfileAggregator()
+    for repo in repositories:
+        aggregator.add_repo(repo)
+    return aggregator.profile()
@@ -0,0 +1,147 @@
+import json
+import sys
+from typing import Dict, List, Tuple
+
+import numpy as np
+
+from modelling import (CAPABILITY_INPUTS, CAPABILITY_WEIGHTS, DEVTOOLS_WEIGHTS, FEATURES, FRICTION_INPUTS,
+                       FRICTION_WEIGHTS, FRICTIONS, PROJECT_TYPES, SKILL_CAPS, SKILL_WEIGHTS, SKILLS, STYLE_BIAS,
+                       STYLE_CAPS, STYLE_WEIGHTS, STYLES, DivergencePredictiveModel, profile_features)
+
+CAPABILITIES = PROJECT_TYPES
+
+
+class WeightMatrix:
+    """The modelling weight tables as (input column, weight) terms per output column"""
+
+    def __init__(self, outputs, inputs, weights):
+        self.outputs = outputs
+        self.inputs = inputs
+        # Non-zero (column, weight) pairs per output, in the order the per-user weighted_sum adds them
+        self.terms = [[(inputs.index(name), weight) for name, weight in weights.get(output, {}).items()]
+                      for output in outputs]
+
+    def apply(self, X):
+        """X times the weight table, adding each column's terms in formula order
+
+        BLAS reassociates the sums, which moves values that sit on a rounding
+        tie (common, since the inputs are already rounded to 3 places) by 0.001.
+        """
+        out = np.zeros((X.shape[0], len(self.outputs)))
+        for j, column in enumerate(self.terms):
+            for i, weight in column:
+                out[:, j] += X[:, i] * weight
+        return out
+
+
+def _vector(names, values, default):
+    return np.array([values.get(name, default) for name in names], dtype=np.float64)
+
+
+def round3(values):
+    """Python's round(x, 3) elementwise (np.round scales by 1000 first and can disagree on ties)"""
+    rounded = np.round(values, 3)
+    scaled = values * 1000
+    near_tie = np.abs(scaled - np.floor(scaled) - 0.5) < 1e-6
+    rounded[near_tie] = [round(x, 3) for x in values[near_tie].tolist()]
+    return rounded
+
+
+W_SKILL = WeightMatrix(SKILLS, FEATURES, SKILL_WEIGHTS)
+W_STYLE = WeightMatrix(STYLES, FEATURES, STYLE_WEIGHTS)
+W_DEVTOOLS = WeightMatrix(['devtools'], FEATURES, {'devtools': DEVTOOLS_WEIGHTS})
+W_FRICTION = WeightMatrix(FRICTIONS, FRICTION_INPUTS, FRICTION_WEIGHTS)
+W_CAPABILITY = WeightMatrix(CAPABILITIES, CAPABILITY_INPUTS, CAPABILITY_WEIGHTS)
+
+B_STYLE = _vector(STYLES, STYLE_BIAS, 0.0)
+SKILL_CAP = _vector(SKILLS, SKILL_CAPS, 1.0)
+STYLE_CAP = _vector(STYLES, STYLE_CAPS, 1.0)
+
+
+def feature_matrix(profiles):
+    """N x F feature matrix from N translated profiles"""
+    return np.array([profile_features(data) for data in profiles], dtype=np.float64).reshape(-1, len(FEATURES))
+
+
+def score_features(X):
+    """Skill, code style, devtools, friction and capability matrices for an N x F feature matrix"""
+    X = np.asarray(X, dtype=np.float64)
+    quality = X[:, [FEATURES.index('quality_score')]]
+
+    # Each stage rounds to 3 places before feeding the next, like the per-user path
+    skill = round3(np.minimum(W_SKILL.apply(X), SKILL_CAP))
+    style = round3(np.minimum(B_STYLE + W_STYLE.apply(X), STYLE_CAP))
+    devtools = round3(W_DEVTOOLS.apply(X))
+
+    friction = 1 - W_FRICTION.apply(np.hstack([skill, style, quality]))
+    capability = np.minimum(W_CAPABILITY.apply(np.hstack([skill, quality, devtools])), 1.0)
+
+    return {
+        'skill_vector': skill,
+        'code_style_profile': style,
+        'devtools_skill': devtools[:, 0],
+        'friction_profile': round3(np.maximum(friction, 0)),
+        'capability_assessment': round3(capability)
+    }
+
+
+def score_profiles(profiles):
+    """Batch-score already loaded translated profiles"""
+    return score_features(feature_matrix(profiles))
+
+
+def scores_for_user(scores, i) -> Dict:
+    """Row i of a score_features result in the per-user predictive profile shape"""
+    columns = {'skill_vector': SKILLS, 'code_style_profile': STYLES,
+               'friction_profile': FRICTIONS, 'capability_assessment': CAPABILITIES}
+    result = {key: dict(zip(names, scores[key][i].tolist())) for key, names in columns.items()}
+    result['devtools_skill'] = float(scores['devtools_skill'][i])
+    return result
+
+
+def load_scorable_profiles(translated_files: List[str]):
+    """(paths, profiles) for the files that have every field the model reads; older schemas are reported and skipped"""
+    paths, profiles = [], []
+    for path in translated_files:
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        try:
+            profile_features(data)
+        except (KeyError, TypeError) as e:
+            # Same cause as the API's 409: translated before the current schema
+            print(f"⚠ Skipping {path}: translated profile is missing {e}; re-process GitHub data")
+            continue
+        paths.append(path)
+        profiles.append(data)
+    return paths, profiles
+
+
+def compare_with_model(translated_files: List[str]) -> Tuple[float, int]:
+    """(largest absolute difference between batch and per-user scores, profiles compared) over the given files"""
+    paths, profiles = load_scorable_profiles(translated_files)
+    if not profiles:
+        return 0.0, 0
+    scores = score_profiles(profiles)
+
+    worst = 0.0
+    for i, data in enumerate(profiles):
+        expected = DivergencePredictiveModel.from_profile(data).generate_predictive_profile()
+        actual = scores_for_user(scores, i)
+        worst = max(worst, abs(expected['devtools_skill'] - actual['devtools_skill']))
+        for key in ('skill_vector', 'code_style_profile', 'friction_profile', 'capability_assessment'):
+            for name, value in expected[key].items():
+                worst = max(worst, abs(value - actual[key][name]))
+    return worst, len(paths)
+
+
+if __name__ == '__main__':
+    if len(sys.argv) < 2:
+        print("Usage: python batch_scoring.py <translated.json> [translated.json ...]")
+        sys.exit(1)
+
+    difference, scored = compare_with_model(sys.argv[1:])
+    if not scored:
+        print("No scorable profiles (all use an older translated.json schema)")
+        sys.exit(1)
+    print(f"Scored {scored} of {len(sys.argv) - 1} profiles; max difference from the per-user model: {difference}")
+    sys.exit(0 if difference == 0 else 1)
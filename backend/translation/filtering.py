@@ -1,16 +1,36 @@
 import json
+import os
 import re
 from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
-import statistics
 from pathlib import Path
+import numpy as np
+from source_imports import extract_imports, source_language
+from manifests import manifest_kind, parse_manifest
+from aggregation import build_profile
+from repo_store import load_result, save_result
+from pipeline_metrics import StageMetrics
 
-def analyze_github_dump(text):
+# Bytes of source per repository to scan for imports after manifests are parsed (0 disables)
+IMPORT_SCAN_BUDGET_KB = int(os.getenv('IMPORT_SCAN_BUDGET_KB', '2048'))
+
+# Worker processes for per-repository analysis (defaults to one per CPU)
+FILTER_MAX_WORKERS = int(os.getenv('FILTER_MAX_WORKERS', '0')) or os.cpu_count() or 1
+
+# Timing and counters for this run (repos analyzed, files and bytes scanned, cache hits)
+METRICS = StageMetrics('filter')
+
+def analyze_github_dump(text, repo_index=None):
     """Analyze the GitHub repository dump and create both filtered and translated outputs"""
     
     # Parse the dump into repository sections
     repos = parse_repositories(text)
     
+    # Reuse stored per-repo results for repos whose HEAD has not moved
+    if repo_index is not None:
+        repos = attach_stored_results(repos, repo_index)
+    
     # Create filtered data
     filtered_data = create_filtered_data(repos)
     
@@ -39,15 +59,67 @@ def parse_repositories(text):
     
     return repos
 
+def attach_stored_results(repos, repo_index):
+    """Order repos as in repos.json, attaching stored results for unchanged (cached) repos"""
+    sections = {repo_data['name']: repo_data for repo_data in repos}
+    ordered = []
+    
+    for entry in repo_index:
+        name = entry['name']
+        repo_data = dict(sections.get(name, {'name': name}))
+        repo_data['clone_url'] = entry.get('clone_url')
+        repo_data['head_oid'] = entry.get('head_oid')
+        
+        if entry.get('cached'):
+            stored = load_result(entry['clone_url'], entry['head_oid'], name)
+            if stored is not None:
+                repo_data['result'] = stored
+        
+        if 'result' in repo_data or 'content' in repo_data:
+            ordered.append(repo_data)
+        else:
+            print(f"Skipping {name}: not in dump and no stored result")
+    
+    return ordered
+
+def analyze_repositories(repos, max_workers=FILTER_MAX_WORKERS):
+    """Analyze repositories in parallel; results come back in input order"""
+    names = [repo_data['name'] for repo_data in repos]
+    contents = [repo_data['content'] for repo_data in repos]
+    
+    workers = min(max_workers, len(repos))
+    if workers <= 1:
+        return list(map(analyze_single_repo, names, contents))
+    
+    # Repos are independent, so the only shared state is the merge in create_filtered_data
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(analyze_single_repo, names, contents))
+
 def create_filtered_data(repos):
     """Create filtered.json structure"""
+    # Only repos without a stored result are analyzed; new results are stored by HEAD OID
+    pending = [repo_data for repo_data in repos if 'result' not in repo_data]
+    # The fetch stage counts repo_cache_hits / files_scanned; these are the filter stage's own view
+    METRICS.incr('repos_reused', len(repos) - len(pending))
+    METRICS.incr('repos_analyzed', len(pending))
+    for repo_data in pending:
+        METRICS.incr('files_analyzed', repo_data['content'].count('\nFILE: '))
+        METRICS.incr('bytes_scanned', len(repo_data['content']))
+    analyzed = iter(analyze_repositories(pending))
+    
     repositories = []
+    for repo_data in repos:
+        if 'result' in repo_data:
+            repositories.append(repo_data['result'])
+            continue
+        repo_info = next(analyzed)
+        if repo_data.get('head_oid'):
+            save_result(repo_data['clone_url'], repo_data['head_oid'], repo_info)
+        repositories.append(repo_info)
     all_commits = []
     all_languages = set()
     
-    for repo_data in repos:
-        repo_info = analyze_single_repo(repo_data['name'], repo_data['content'])
-        repositories.append(repo_info)
+    for repo_info in repositories:
         all_commits.extend(repo_info['commits'])
         all_languages.update(repo_info['languages'].keys())
     
@@ -94,8 +166,9 @@ def create_filtered_data(repos):
     }
     
     # Create top projects list based on size and complexity
+    # (ties broken by name so the result does not depend on analysis order)
     top_projects = []
-    for repo in sorted(repositories, key=lambda r: r['size_kb'], reverse=True)[:5]:
+    for repo in sorted(repositories, key=lambda r: (-r['size_kb'], r['name']))[:5]:
         # Get primary language
         primary_lang = max(repo['languages'].items(), key=lambda x: x[1])[0] if repo['languages'] else 'Unknown'
         
@@ -111,7 +184,7 @@ def create_filtered_data(repos):
     # Create new projects list (most recent repositories by analyzing commit patterns)
     new_projects = []
     # Sort by number of recent commits (last in commit list)
-    repos_with_recent = sorted(repositories, key=lambda r: len(r['commits']), reverse=True)[:5]
+    repos_with_recent = sorted(repositories, key=lambda r: (-len(r['commits']), r['name']))[:5]
     
     for repo in repos_with_recent:
         primary_lang = max(repo['languages'].items(), key=lambda x: x[1])[0] if repo['languages'] else 'Unknown'
@@ -142,7 +215,7 @@ def create_filtered_data(repos):
             })
     
     # Sort by date and take most recent
-    all_commits_with_repo.sort(key=lambda x: x['commit'].get('date', ''), reverse=True)
+    all_commits_with_repo.sort(key=lambda x: (x['commit'].get('date', ''), x['repo']), reverse=True)
     
     # If we have commits, use them
     if all_commits_with_repo:
@@ -187,7 +260,7 @@ def create_filtered_data(repos):
     return {
         'repositories': repositories,
         'total_commits': total_commits,
-        'commit_dates': sorted([c['date'] for c in all_commits if c.get('date')]),
+        'commit_dates': sorted_commit_dates(all_commits),
         'statsHome': {
             'totalProjects': total_projects,
             'totalRating': star_rating,
@@ -201,14 +274,26 @@ def create_filtered_data(repos):
         'recentWorks': recent_works
     }
 
+def parse_files(content):
+    """Split a repository section into (path, file content) pairs"""
+    sections = re.split(r'={80}\nFILE:\s*(.+?)\n={80}\n', content)
+    
+    return [(sections[i].strip(), sections[i + 1]) 
+            for i in range(1, len(sections) - 1, 2)]
+
 def analyze_single_repo(name, content):
     """Analyze a single repository"""
     
+    files = parse_files(content)
+    
     # Detect languages
     languages = detect_languages(content)
     
+    # Declared dependencies from manifests (primary library signal)
+    dependencies = detect_dependencies(files)
+    
     # Detect libraries (with frequency)
-    libraries = detect_libraries(content)
+    libraries = detect_libraries(files, dependencies)
     
     # Detect frameworks
     frameworks = detect_frameworks(content)
@@ -229,6 +314,7 @@ def analyze_single_repo(name, content):
         'name': name,
         'languages': languages,
         'libraries': libraries,
+        'dependencies': dependencies,
         'frameworks': frameworks,
         'commits': commits,
         'size_kb': round(size_kb, 2),
@@ -259,21 +345,40 @@ def detect_languages(text):
     
     return dict(languages)
 
-def detect_libraries(text):
-    """Detect libraries with frequency counts"""
+def detect_dependencies(files):
+    """Parse manifests (package.json, requirements.txt, pyproject.toml, Cargo.toml, go.mod)"""
+    runtime = set()
+    dev = set()
+    
+    for path, content in files:
+        if manifest_kind(path):
+            deps = parse_manifest(path, content)
+            runtime.update(deps['runtime'])
+            dev.update(deps['dev'])
+    
+    return {
+        'runtime': sorted(runtime),
+        'dev': sorted(dev - runtime)
+    }
+
+def detect_libraries(files, dependencies=None, scan_budget_kb=IMPORT_SCAN_BUDGET_KB):
+    """Detect libraries with frequency counts: declared dependencies first, then source imports"""
     libraries = defaultdict(int)
     
-    # Python imports
-    py_imports = re.findall(r'(?:import|from)\s+([a-zA-Z0-9_.-]+)', text)
-    for lib in py_imports:
-        base_lib = lib.split('.')[0]
-        libraries[base_lib] += 1
+    if dependencies:
+        for lib in dependencies['runtime'] + dependencies['dev']:
+            libraries[lib] += 1
     
-    # Package names from JSON
-    # Look for common package manager patterns
-    package_names = re.findall(r'"([a-zA-Z0-9_-]+)":\s*"\d+\.\d+\.\d+"', text)
-    for pkg in package_names:
-        libraries[pkg] += 1
+    # Fallback: language-specific import scan, capped per repository
+    budget = scan_budget_kb * 1024
+    for path, content in files:
+        if budget <= 0:
+            break
+        if not source_language(path):
+            continue
+        budget -= len(content)
+        for lib in extract_imports(path, content):
+            libraries[lib] += 1
     
     # Filter out very common/standard items
     filtered = {lib: count for lib, count in libraries.items() 
@@ -355,181 +460,15 @@ def estimate_test_coverage(text):
     coverage = min((test_matches / max(code_files, 1)) * 100, 100)
     return round(coverage, 2)
 
+def sorted_commit_dates(commits):
+    """Commit date strings in chronological order"""
+    dates = [c['date'] for c in commits if c.get('date')]
+    order = np.argsort(np.array(dates, dtype='datetime64[s]').astype(np.int64), kind='stable')
+    return [dates[i] for i in order]
+
 def create_translated_data(filtered_data):
-    """Create translated.json from filtered data"""
-    
-    # Aggregate languages
-    language_counts = defaultdict(int)
-    for repo in filtered_data['repositories']:
-        for lang, count in repo['languages'].items():
-            language_counts[lang] += count
-    
-    total_lang = sum(language_counts.values())
-    languages = {lang: round((count / total_lang) * 100, 2) 
-                for lang, count in language_counts.items()} if total_lang > 0 else {}
-    
-    # Aggregate libraries
-    library_counts = defaultdict(int)
-    for repo in filtered_data['repositories']:
-        for lib, count in repo['libraries'].items():
-            library_counts[lib] += count
-    
-    libraries = dict(sorted(library_counts.items(), key=lambda x: x[1], reverse=True))
-    
-    # Aggregate frameworks
-    framework_counts = defaultdict(int)
-    for repo in filtered_data['repositories']:
-        for fw in repo['frameworks']:
-            framework_counts[fw] += 1
-    
-    frameworks = dict(sorted(framework_counts.items(), key=lambda x: x[1], reverse=True))
-    
-    # Analyze habits
-    all_commits = []
-    commit_sizes = []
-    for repo in filtered_data['repositories']:
-        all_commits.extend(repo['commits'])
-        if len(repo['commits']) > 0:
-            avg_size = repo['size_kb'] / len(repo['commits'])
-            commit_sizes.extend([avg_size] * len(repo['commits']))
-    
-    timestamps = [c['timestamp'] for c in all_commits if c.get('timestamp')]
-    if len(timestamps) > 1:
-        time_span_days = (max(timestamps) - min(timestamps)) / 86400
-        frequency = len(timestamps) / max(time_span_days / 7, 1) if time_span_days > 0 else 0
-    else:
-        frequency = 0.0
-    
-    if len(timestamps) > 2:
-        intervals = [timestamps[i+1] - timestamps[i] for i in range(len(timestamps)-1)]
-        consistency = 1.0 / (1.0 + statistics.stdev(intervals) / 86400)
-    else:
-        consistency = 0.0
-    
-    avg_commit_size = statistics.mean(commit_sizes) if commit_sizes else 0.0
-    
-    if frequency > 5:
-        pattern = 'daily'
-    elif frequency > 2:
-        pattern = 'regular'
-    elif frequency > 0.5:
-        pattern = 'weekly'
-    else:
-        pattern = 'sporadic'
-    
-    habits = {
-        'frequency': round(frequency, 2),
-        'consistency': round(consistency, 3),
-        'avg_commit_size_kb': round(avg_commit_size, 2),
-        'commit_pattern': pattern
-    }
-    
-    # Technical depth
-    repo_sizes = [repo['size_kb'] for repo in filtered_data['repositories']]
-    avg_size = statistics.mean(repo_sizes) if repo_sizes else 0
-    max_size = max(repo_sizes) if repo_sizes else 0
-    depth_score = min(avg_size / 500, 1.0)
-    
-    if depth_score > 0.7:
-        level = 'advanced'
-    elif depth_score > 0.4:
-        level = 'intermediate'
-    else:
-        level = 'beginner'
-    
-    technical_depth = {
-        'depth_score': round(depth_score, 3),
-        'avg_repo_size_kb': round(avg_size, 2),
-        'max_repo_size_kb': round(max_size, 2),
-        'level': level
-    }
-    
-    # Composition
-    frontend_types = {'html', 'css', 'scss', 'sass', 'jsx', 'tsx', 'vue', 'md'}
-    backend_types = {'py', 'sh', 'js', 'ts', 'json', 'yml', 'yaml'}
-    data_types = {'json', 'csv', 'xml'}
-    
-    frontend_count = 0
-    backend_count = 0
-    data_count = 0
-    
-    for repo in filtered_data['repositories']:
-        for file_type, count in repo['file_types'].items():
-            if file_type in frontend_types:
-                frontend_count += count
-            if file_type in backend_types:
-                backend_count += count
-            if file_type in data_types:
-                data_count += count
-    
-    total = frontend_count + backend_count + data_count
-    composition = {
-        'frontend': round(frontend_count / total, 3) if total > 0 else 0,
-        'backend': round(backend_count / total, 3) if total > 0 else 0,
-        'data': round(data_count / total, 3) if total > 0 else 0
-    }
-    
-    # Skills analysis
-    skills = {}
-    
-    all_libs = set()
-    all_frameworks = set()
-    for repo in filtered_data['repositories']:
-        all_libs.update([lib.lower() for lib in repo['libraries'].keys()])
-        all_frameworks.update([fw.lower() for fw in repo['frameworks']])
-    
-    combined = all_libs | all_frameworks
-    
-    # Developer tools & automation
-    devtools_indicators = {'pytest', 'git', 'github', 'docker', 'validation', 'scaffold'}
-    skills['devtools_automation'] = len(combined & devtools_indicators) / max(len(devtools_indicators), 1)
-    
-    # AI/ML
-    ai_ml_indicators = {'ollama', 'claude', 'llm', 'ai', 'ml'}
-    skills['ai_ml'] = len(combined & ai_ml_indicators) / max(len(ai_ml_indicators), 1)
-    
-    # Plugin/Extension development
-    plugin_indicators = {'plugin', 'marketplace', 'cli', 'tools'}
-    skills['plugin_development'] = len(combined & plugin_indicators) / max(len(plugin_indicators), 1)
-    
-    # Filter and round
-    skills = {k: round(v, 3) for k, v in skills.items() if v > 0.05}
-    
-    # Quality
-    coverage_values = [repo['test_coverage'] for repo in filtered_data['repositories']]
-    avg_coverage = statistics.mean(coverage_values) if coverage_values else 0
-    quality_score = min(avg_coverage / 100, 1.0)
-    
-    if avg_coverage > 70:
-        rating = 'excellent'
-    elif avg_coverage > 40:
-        rating = 'good'
-    elif avg_coverage > 20:
-        rating = 'fair'
-    else:
-        rating = 'needs_improvement'
-    
-    quality = {
-        'avg_test_coverage': round(avg_coverage, 2),
-        'quality_score': round(quality_score, 3),
-        'rating': rating
-    }
-    
-    return {
-        'languages': languages,
-        'libraries': libraries,
-        'frameworks': frameworks,
-        'habits': habits,
-        'technical_depth': technical_depth,
-        'composition': composition,
-        'skills': skills,
-        'quality': quality,
-        'metadata': {
-            'total_repositories': len(filtered_data['repositories']),
-            'total_commits': filtered_data['total_commits'],
-            'analysis_timestamp': datetime.now().isoformat()
-        }
-    }
+    """Create translated.json from filtered data (single pass over the per-repo results)"""
+    return build_profile(filtered_data['repositories'])
 
 if __name__ == '__main__':
     import sys
@@ -548,8 +487,15 @@ if __name__ == '__main__':
     with open(input_file, 'r', encoding='utf-8', errors='ignore') as f:
         text = f.read()
     
+    # Repo list with HEAD OIDs written by the fetcher (absent for hand-made dumps)
+    repo_index = None
+    index_file = input_file.with_name('repos.json')
+    if index_file.exists():
+        with open(index_file, 'r', encoding='utf-8') as f:
+            repo_index = json.load(f)
+    
     # Analyze
-    filtered_data, translated_data = analyze_github_dump(text)
+    filtered_data, translated_data = analyze_github_dump(text, repo_index)
     
     # Save filtered.json
     filtered_output = output_dir / 'filtered.json'
@@ -557,7 +503,7 @@ if __name__ == '__main__':
         json.dump(filtered_data, f, indent=2)
     print(f"Created {filtered_output} with {len(filtered_data['repositories'])} repositories")
     
-    # Save translated.json (will be overwritten by translation.py, but keep for now)
+    # Save translated.json (final profile schema, consumed by the API and modelling.py)
     translated_output = output_dir / 'translated.json'
     with open(translated_output, 'w', encoding='utf-8') as f:
         json.dump(translated_data, f, indent=2)
@@ -566,4 +512,6 @@ if __name__ == '__main__':
     print(f"  Top Languages: {list(translated_data['languages'].keys())[:3]}")
     print(f"  Primary Skills: {list(translated_data['skills'].keys())}")
     print(f"  Commit Pattern: {translated_data['habits']['commit_pattern']}")
-    print(f"  Technical Level: {translated_data['technical_depth']['level']}")
\ No newline at end of file
+    print(f"  Technical Level: {translated_data['technical_depth']['level']}")
+    
+    METRICS.write()
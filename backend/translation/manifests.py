@@ -0,0 +1,120 @@
+import json
+import re
+
+try:
+    import tomllib
+except ModuleNotFoundError:  # Python < 3.11
+    tomllib = None
+
+from source_imports import go_package_name
+
+# Optional-dependency / group names that hold development-only tooling
+DEV_GROUP_NAMES = {'dev', 'develop', 'development', 'test', 'tests', 'testing', 'lint', 'docs', 'typing'}
+
+# PEP 508 requirement: the distribution name is the leading identifier
+REQUIREMENT_NAME_RE = re.compile(r'^\s*([A-Za-z0-9][A-Za-z0-9._-]*)')
+
+# go.mod: `require x v1` and `require ( ... )` blocks
+GO_REQUIRE_LINE_RE = re.compile(r'^require[ \t]+(\S+)[ \t]+\S+(.*)$', re.MULTILINE)
+GO_REQUIRE_BLOCK_RE = re.compile(r'^require[ \t]*\(([^)]*)\)', re.MULTILINE)
+
+
+def manifest_kind(path):
+    """Return the manifest format for a file path, or None if it is not a manifest"""
+    filename = path.replace('\\', '/').rsplit('/', 1)[-1].lower()
+    if filename in ('package.json', 'pyproject.toml', 'cargo.toml', 'go.mod'):
+        return filename
+    if filename.startswith('requirements') and filename.endswith('.txt'):
+        return 'requirements.txt'
+    return None
+
+
+def parse_manifest(path, content):
+    """Parse one manifest into {'runtime': set, 'dev': set} of package names"""
+    kind = manifest_kind(path)
+    deps = {'runtime': set(), 'dev': set()}
+
+    try:
+        if kind == 'package.json':
+            _parse_package_json(content, deps)
+        elif kind == 'requirements.txt':
+            _parse_requirements(path, content, deps)
+        elif kind == 'pyproject.toml' and tomllib:
+            _parse_pyproject(tomllib.loads(content), deps)
+        elif kind == 'cargo.toml' and tomllib:
+            _parse_cargo(tomllib.loads(content), deps)
+        elif kind == 'go.mod':
+            _parse_go_mod(content, deps)
+    except (ValueError, TypeError, AttributeError) as e:
+        # Broken manifests (merge conflicts, templates) contribute nothing
+        print(f"Skipping unparseable manifest {path}: {e}")
+        return {'runtime': set(), 'dev': set()}
+
+    deps['dev'] -= deps['runtime']
+    return deps
+
+
+def requirement_name(requirement):
+    """Distribution name from a PEP 508 requirement string, lowercased"""
+    match = REQUIREMENT_NAME_RE.match(requirement)
+    return match.group(1).lower() if match else None
+
+
+def _parse_package_json(content, deps):
+    data = json.loads(content)
+    for section in ('dependencies', 'peerDependencies', 'optionalDependencies'):
+        deps['runtime'].update(data.get(section) or {})
+    deps['dev'].update(data.get('devDependencies') or {})
+
+
+def _parse_requirements(path, content, deps):
+    filename = path.replace('\\', '/').rsplit('/', 1)[-1].lower()
+    target = 'dev' if any(word in filename for word in ('dev', 'test', 'lint', 'doc')) else 'runtime'
+
+    for line in content.splitlines():
+        line = line.split('#', 1)[0].strip()
+        # Skip blanks, pip options (-r, -e, --index-url) and direct URLs
+        if not line or line.startswith('-') or '://' in line:
+            continue
+        name = requirement_name(line)
+        if name:
+            deps[target].add(name)
+
+
+def _parse_pyproject(data, deps):
+    project = data.get('project', {})
+    deps['runtime'].update(filter(None, map(requirement_name, project.get('dependencies', []))))
+    for group, requirements in project.get('optional-dependencies', {}).items():
+        target = 'dev' if group.lower() in DEV_GROUP_NAMES else 'runtime'
+        deps[target].update(filter(None, map(requirement_name, requirements)))
+
+    # PEP 735 dependency groups are development-only by definition
+    for requirements in data.get('dependency-groups', {}).values():
+        deps['dev'].update(filter(None, map(requirement_name, (r for r in requirements if isinstance(r, str)))))
+
+    poetry = data.get('tool', {}).get('poetry', {})
+    deps['runtime'].update(name.lower() for name in poetry.get('dependencies', {}) if name.lower() != 'python')
+    deps['dev'].update(name.lower() for name in poetry.get('dev-dependencies', {}))
+    for group in poetry.get('group', {}).values():
+        deps['dev'].update(name.lower() for name in group.get('dependencies', {}))
+
+
+def _parse_cargo(data, deps):
+    tables = [data] + list(data.get('target', {}).values())
+    for table in tables:
+        deps['runtime'].update(table.get('dependencies', {}))
+        deps['dev'].update(table.get('dev-dependencies', {}))
+        deps['dev'].update(table.get('build-dependencies', {}))
+
+
+def _parse_go_mod(content, deps):
+    lines = [f"{path} x{rest}" for path, rest in GO_REQUIRE_LINE_RE.findall(content)]
+    for block in GO_REQUIRE_BLOCK_RE.findall(content):
+        lines.extend(block.splitlines())
+
+    for line in lines:
+        parts = line.split()
+        # Indirect requirements are pulled in by other modules, not chosen by the author
+        if len(parts) < 2 or parts[0].startswith('//') or '// indirect' in line:
+            continue
+        deps['runtime'].add(go_package_name(parts[0]))
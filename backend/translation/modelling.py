@@ -1,7 +1,9 @@
 import json
 import math
+from functools import wraps
 from typing import Dict, List, Tuple
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, asdict, fields
+from taxonomy import count_matches, library_category
 
 @dataclass
 class SkillVector:
@@ -46,56 +48,179 @@ class CapabilityAssessment:
     infrastructure: float
     plugin_system: float
 
+# Bump whenever a weight, formula or taxonomy.json entry changes (stored predictions are keyed by it)
+MODEL_VERSION = '2.1.0'
+
+# Every project type the model can score (one per CapabilityAssessment field)
+PROJECT_TYPES = [f.name for f in fields(CapabilityAssessment)]
+
+SKILLS = [f.name for f in fields(SkillVector)]
+STYLES = [f.name for f in fields(CodeStyleProfile)]
+FRICTIONS = [f.name for f in fields(FrictionProfile)]
+
+# Per-profile inputs to the weighted scores, in the order profile_features returns them
+FEATURES = [
+    'backend_share', 'frontend_share', 'data_share',
+    'python_share', 'frontend_lang_share', 'typescript_share',
+    'data_engineering', 'ai_ml', 'cloud_devops',
+    'quality_score', 'depth_score', 'repo_size_factor',
+    'ai_libs', 'typing_libs', 'functional_libs', 'language_diversity',
+    'cli_tools', 'advanced_python', 'testing_tools'
+]
+
+# Weighted sums, one row per output score, terms in the order they are added.
+# Read by both the per-user model and batch_scoring; change them here only.
+SKILL_WEIGHTS = {
+    # Python + backend composition + quality
+    'backend': {'backend_share': 0.5, 'python_share': 0.3, 'quality_score': 0.2},
+    # JS/TS + HTML/CSS
+    'frontend': {'frontend_share': 0.7, 'frontend_lang_share': 0.3},
+    'data': {'data_share': 0.5, 'data_engineering': 0.5},
+    # Skills plus OpenAI/Anthropic library usage
+    'ai_ml': {'ai_ml': 1.0, 'ai_libs': 0.2},
+    'cloud_infrastructure': {'cloud_devops': 1.0},
+    # Large, well-tested projects indicate architectural experience
+    'architecture': {'depth_score': 0.5, 'quality_score': 0.3, 'repo_size_factor': 0.2},
+}
+# Upper bound per score (1.0 unless listed)
+SKILL_CAPS = {'cloud_infrastructure': math.inf}
+
+STYLE_WEIGHTS = {
+    # TypeScript + typed Python indicators
+    'type_safety_preference': {'typescript_share': 2.0, 'typing_libs': 0.3},
+    # 0=functional, 1=OOP: more than two functional libraries moves 0.7 to 0.3
+    'functional_vs_oop': {'functional_libs': -0.4},
+    'language_diversity': {'language_diversity': 1.0},
+    # Large repos = comfortable with complexity
+    'complexity_tolerance': {'depth_score': 1.0},
+}
+STYLE_BIAS = {'functional_vs_oop': 0.7}
+STYLE_CAPS = {'functional_vs_oop': math.inf, 'complexity_tolerance': math.inf}
+
+# CLI libraries, advanced Python patterns, testing tools and quality discipline
+DEVTOOLS_WEIGHTS = {'cli_tools': 0.35, 'advanced_python': 0.25, 'testing_tools': 0.25, 'quality_score': 0.15}
+
+# Friction is 1 - (weighted sum) over the rounded skill and style scores plus quality
+FRICTION_INPUTS = SKILLS + STYLES + ['quality_score']
+FRICTION_WEIGHTS = {
+    'react_friction': {'frontend': 0.4, 'type_safety_preference': 0.3, 'complexity_tolerance': 0.3},
+    # Vue is simpler, less typing needed
+    'vue_friction': {'frontend': 0.6, 'language_diversity': 0.4},
+    'typescript_friction': {'type_safety_preference': 0.5, 'frontend': 0.3, 'complexity_tolerance': 0.2},
+    'python_typing_friction': {'type_safety_preference': 0.6, 'backend': 0.4},
+    'ml_project_friction': {'ai_ml': 0.4, 'data': 0.3, 'backend': 0.2, 'quality_score': 0.1},
+    'devops_friction': {'cloud_infrastructure': 0.6, 'backend': 0.4},
+    'microservices_friction': {'architecture': 0.4, 'backend': 0.3, 'cloud_infrastructure': 0.3},
+    'fullstack_friction': {'frontend': 0.4, 'backend': 0.4, 'architecture': 0.2},
+    'mobile_friction': {'frontend': 0.5, 'language_diversity': 0.3, 'architecture': 0.2},
+}
+
+CAPABILITY_INPUTS = SKILLS + ['quality_score', 'devtools']
+CAPABILITY_WEIGHTS = {
+    'api_service': {'backend': 0.5, 'architecture': 0.3, 'quality_score': 0.2},
+    'cli_tool': {'backend': 0.4, 'devtools': 0.4, 'quality_score': 0.2},
+    'data_pipeline': {'data': 0.4, 'backend': 0.4, 'architecture': 0.2},
+    'ml_model': {'ai_ml': 0.5, 'data': 0.3, 'quality_score': 0.2},
+    'frontend_app': {'frontend': 0.7, 'quality_score': 0.3},
+    'fullstack_app': {'frontend': 0.3, 'backend': 0.4, 'architecture': 0.3},
+    'infrastructure': {'cloud_infrastructure': 0.5, 'backend': 0.3, 'architecture': 0.2},
+    'plugin_system': {'backend': 0.4, 'architecture': 0.3, 'devtools': 0.3},
+}
+
+# Map project types to relevant friction
+PROJECT_FRICTION = {
+    'frontend_app': 'react_friction',
+    'fullstack_app': 'fullstack_friction',
+    'ml_model': 'ml_project_friction',
+    'infrastructure': 'devops_friction',
+    'cli_tool': 'python_typing_friction'
+}
+
+# Minimum skill levels per project type
+PROJECT_SKILL_THRESHOLDS = {
+    'frontend_app': [('frontend', 0.5), ('architecture', 0.4)],
+    'fullstack_app': [('frontend', 0.5), ('backend', 0.6), ('architecture', 0.5)],
+    'ml_model': [('ai_ml', 0.4), ('data', 0.4)],
+    'infrastructure': [('cloud_infrastructure', 0.4), ('backend', 0.5)],
+}
+
+
+def profile_features(data) -> List[float]:
+    """One FEATURES row from a translated.json profile (KeyError on profiles missing a field)"""
+    comp = data['composition']
+    langs = data['languages']
+    skills = data['skills']
+    quality = data['quality']
+    depth = data['technical_depth']
+    libs = list(data.get('libraries', {}).keys())
+
+    return [
+        comp['backend'], comp['frontend'], comp['data'],
+        langs.get('Python', 0) / 100,
+        (langs.get('JavaScript', 0) + langs.get('TypeScript', 0) + langs.get('HTML', 0) + langs.get('CSS', 0)) / 100,
+        langs.get('TypeScript', 0) / 100,
+        skills.get('data_engineering', 0), skills.get('ai_ml', 0), skills.get('cloud_devops', 0),
+        quality['quality_score'], depth['depth_score'], min(depth['avg_repo_size'] / 2000, 1.0),
+        1.0 if count_matches(libs, 'signals', 'ai_providers') > 0 else 0.0,
+        1.0 if count_matches(libs, 'signals', 'typing') > 0 else 0.0,
+        1.0 if count_matches(libs, 'signals', 'functional') > 2 else 0.0,
+        min(len([v for v in langs.values() if v > 1]) / 6, 1.0),
+        min(count_matches(libs, 'signals', 'cli_tools') / 2, 1.0),
+        min(count_matches(libs, 'signals', 'advanced_python') / 4, 1.0),
+        min(count_matches(libs, 'signals', 'testing_tools') / 2, 1.0),
+    ]
+
+
+def weighted_sum(weights: Dict[str, float], values: Dict[str, float], bias: float = 0.0) -> float:
+    """bias + sum of values[name] * weight, added in table order"""
+    total = 0.0
+    for name, weight in weights.items():
+        total += values[name] * weight
+    return bias + total
+
+
+def _memoized(method):
+    """Compute a derived value once per loaded profile (cleared by load_data)"""
+    @wraps(method)
+    def wrapper(self):
+        if method.__name__ not in self._derived:
+            self._derived[method.__name__] = method(self)
+        return self._derived[method.__name__]
+    return wrapper
+
+
 class DivergencePredictiveModel:
     def __init__(self, translated_file: str):
         self.translated_file = translated_file
         self.data = None
+        self._derived = {}
+    
+    @classmethod
+    def from_profile(cls, data: Dict) -> 'DivergencePredictiveModel':
+        """Model over an already loaded translated profile (no file read)"""
+        model = cls(translated_file=None)
+        model.data = data
+        return model
         
     def load_data(self):
         """Load translated profile data"""
         with open(self.translated_file, 'r', encoding='utf-8') as f:
             self.data = json.load(f)
+        self._derived = {}
+    
+    def _ensure_loaded(self):
+        if self.data is None:
+            self.load_data()
+    
+    @_memoized
+    def _features(self) -> Dict[str, float]:
+        return dict(zip(FEATURES, profile_features(self.data)))
     
     def _detect_library_category(self, lib_name: str) -> str:
-        """Categorize a library by its purpose"""
-        lib = lib_name.lower()
-        
-        # AI/ML libraries
-        if lib in ['openai', 'anthropic', 'transformers', 'pytorch', 'tensorflow', 
-                   'sklearn', 'keras', 'langchain']:
-            return 'ai_ml'
-        
-        # Data processing
-        if lib in ['pandas', 'numpy', 'scipy', 'polars', 'dask']:
-            return 'data_processing'
-        
-        # Web frameworks
-        if lib in ['flask', 'django', 'fastapi', 'express', 'react', 'vue', 'angular']:
-            return 'web_framework'
-        
-        # DevOps/Infrastructure
-        if lib in ['docker', 'kubernetes', 'terraform', 'ansible']:
-            return 'devops'
-        
-        # Testing
-        if lib in ['pytest', 'unittest', 'jest', 'mocha', 'cypress']:
-            return 'testing'
-        
-        # CLI/Tooling - KEY INDICATORS FOR DEVTOOLS SKILL
-        if lib in ['argparse', 'click', 'typer', 'rich', 'colorama', 'prompt-toolkit']:
-            return 'cli_tool'
-        
-        # Async/Concurrency
-        if lib in ['asyncio', 'aiohttp', 'celery', 'threading']:
-            return 'async'
-        
-        # Data structures (advanced Python usage)
-        if lib in ['collections', 'itertools', 'functools', 'heapq', 'deque', 
-                   'counter', 'lru_cache', 'cache']:
-            return 'advanced_python'
-        
-        return 'other'
+        """Categorize a library by its purpose (see taxonomy.json)"""
+        return library_category(lib_name)
     
+    @_memoized
     def _infer_devtools_skill(self) -> float:
         """
         Infer developer tooling skill from:
@@ -104,131 +229,31 @@ class DivergencePredictiveModel:
         3. Advanced Python patterns (decorators, data structures)
         4. Language diversity (polyglot developers build more tools)
         """
-        libs = self.data.get('libraries', {})
-        quality = self.data['quality']
-        
-        # Check for CLI tooling libraries
-        cli_indicators = {'argparse', 'click', 'typer', 'rich', 'colorama'}
-        has_cli_tools = sum(1 for lib in libs.keys() if lib.lower() in cli_indicators)
-        cli_score = min(has_cli_tools / 2, 1.0)  # Normalize to 0-1
-        
-        # Check for advanced Python patterns (indicates tool-building)
-        advanced_indicators = {'functools', 'itertools', 'collections', 'heapq', 
-                              'lru_cache', 'cache', 'deque'}
-        has_advanced = sum(1 for lib in libs.keys() if lib.lower() in advanced_indicators)
-        advanced_score = min(has_advanced / 4, 1.0)
-        
-        # Testing sophistication (pytest is a devtool)
-        testing_indicators = {'pytest', 'unittest', 'mock'}
-        has_testing = sum(1 for lib in libs.keys() if lib.lower() in testing_indicators)
-        testing_score = min(has_testing / 2, 1.0)
-        
-        # Quality discipline (good devtools have good tests)
-        quality_score = quality['quality_score']
-        
-        # Combine signals
-        devtools_skill = (
-            cli_score * 0.35 +
-            advanced_score * 0.25 +
-            testing_score * 0.25 +
-            quality_score * 0.15
-        )
-        
-        return round(devtools_skill, 3)
+        return round(weighted_sum(DEVTOOLS_WEIGHTS, self._features()), 3)
     
+    @_memoized
     def compute_skill_vector(self) -> SkillVector:
         """
         Synthesize normalized skill scores from available data
         No time-series or commit patterns - only static analysis
         """
-        comp = self.data['composition']
-        langs = self.data['languages']
-        skills = self.data['skills']
-        quality = self.data['quality']
-        depth = self.data['technical_depth']
-        libs = self.data.get('libraries', {})
-        
-        # Backend skill (Python + backend composition + quality)
-        python_strength = langs.get('Python', 0) / 100
-        backend = (
-            comp['backend'] * 0.5 +
-            python_strength * 0.3 +
-            quality['quality_score'] * 0.2
-        )
-        
-        # Frontend skill (JS/TS + HTML/CSS)
-        frontend_langs = (
-            langs.get('JavaScript', 0) +
-            langs.get('TypeScript', 0) +
-            langs.get('HTML', 0) +
-            langs.get('CSS', 0)
-        ) / 100
-        frontend = comp['frontend'] * 0.7 + frontend_langs * 0.3
-        
-        # Data skill (data composition + data engineering)
-        data = (
-            comp['data'] * 0.5 +
-            skills.get('data_engineering', 0) * 0.5
-        )
-        
-        # AI/ML skill (from skills + OpenAI/Anthropic library usage)
-        has_ai_libs = any(lib.lower() in ['openai', 'anthropic', 'langchain'] 
-                         for lib in libs.keys())
-        ai_ml = skills.get('ai_ml', 0) + (0.2 if has_ai_libs else 0)
-        
-        # Cloud/Infrastructure
-        cloud = skills.get('cloud_devops', 0)
-        
-        # Architecture skill (inferred from depth + size + quality)
-        # Large, well-tested projects indicate architectural experience
-        architecture = (
-            depth['depth_score'] * 0.5 +
-            quality['quality_score'] * 0.3 +
-            min(depth['avg_repo_size'] / 2000, 1.0) * 0.2
-        )
-        
-        return SkillVector(
-            backend=round(min(backend, 1.0), 3),
-            frontend=round(min(frontend, 1.0), 3),
-            data=round(min(data, 1.0), 3),
-            ai_ml=round(min(ai_ml, 1.0), 3),
-            cloud_infrastructure=round(cloud, 3),
-            architecture=round(min(architecture, 1.0), 3)
-        )
+        features = self._features()
+        return SkillVector(**{
+            name: round(min(weighted_sum(SKILL_WEIGHTS[name], features), SKILL_CAPS.get(name, 1.0)), 3)
+            for name in SKILLS
+        })
     
+    @_memoized
     def compute_code_style_profile(self) -> CodeStyleProfile:
         """
         Analyze coding style preferences from language usage
         """
-        langs = self.data['languages']
-        depth = self.data['technical_depth']
-        libs = self.data.get('libraries', {})
-        
-        # Type safety preference (TypeScript + typed Python indicators)
-        ts_usage = langs.get('TypeScript', 0)
-        has_typing = any(lib.lower() in ['typing', 'mypy', 'pydantic'] 
-                        for lib in libs.keys())
-        type_safety = (ts_usage / 50 + (0.3 if has_typing else 0))
-        
-        # Functional vs OOP (based on library patterns)
-        functional_libs = {'functools', 'itertools', 'map', 'filter', 'reduce'}
-        oop_libs = {'class', 'inheritance', 'polymorphism'}
-        func_count = sum(1 for lib in libs.keys() if lib.lower() in functional_libs)
-        functional_vs_oop = 0.3 if func_count > 2 else 0.7  # 0=functional, 1=OOP
-        
-        # Language diversity (polyglot tendency)
-        lang_count = len([v for v in langs.values() if v > 1])
-        language_diversity = min(lang_count / 6, 1.0)
-        
-        # Complexity tolerance (large repos = comfortable with complexity)
-        complexity_tolerance = depth['depth_score']
-        
-        return CodeStyleProfile(
-            type_safety_preference=round(min(type_safety, 1.0), 3),
-            functional_vs_oop=round(functional_vs_oop, 3),
-            language_diversity=round(language_diversity, 3),
-            complexity_tolerance=round(complexity_tolerance, 3)
-        )
+        features = self._features()
+        return CodeStyleProfile(**{
+            name: round(min(weighted_sum(STYLE_WEIGHTS[name], features, STYLE_BIAS.get(name, 0.0)),
+                            STYLE_CAPS.get(name, 1.0)), 3)
+            for name in STYLES
+        })
     
     def compute_friction_profile(self, skill_vector: SkillVector, 
                                  code_style: CodeStyleProfile) -> FrictionProfile:
@@ -236,83 +261,12 @@ class DivergencePredictiveModel:
         Calculate friction without behavioral/temporal data
         Based purely on current skill levels and style preferences
         """
-        langs = self.data['languages']
-        
-        # Type safety experience (for typed frameworks)
-        type_experience = code_style.type_safety_preference
-        
-        # React friction (needs frontend + type safety + complexity)
-        react_friction = 1 - (
-            skill_vector.frontend * 0.4 +
-            type_experience * 0.3 +
-            code_style.complexity_tolerance * 0.3
-        )
-        
-        # Vue friction (simpler, less typing needed)
-        vue_friction = 1 - (
-            skill_vector.frontend * 0.6 +
-            code_style.language_diversity * 0.4
-        )
-        
-        # TypeScript friction
-        typescript_friction = 1 - (
-            type_experience * 0.5 +
-            skill_vector.frontend * 0.3 +
-            code_style.complexity_tolerance * 0.2
-        )
-        
-        # Python typing friction (mypy, type hints)
-        python_typing_friction = 1 - (
-            type_experience * 0.6 +
-            skill_vector.backend * 0.4
-        )
-        
-        # ML project friction
-        ml_project_friction = 1 - (
-            skill_vector.ai_ml * 0.4 +
-            skill_vector.data * 0.3 +
-            skill_vector.backend * 0.2 +
-            self.data['quality']['quality_score'] * 0.1
-        )
-        
-        # DevOps friction
-        devops_friction = 1 - (
-            skill_vector.cloud_infrastructure * 0.6 +
-            skill_vector.backend * 0.4
-        )
-        
-        # Microservices friction (needs architecture + backend + cloud)
-        microservices_friction = 1 - (
-            skill_vector.architecture * 0.4 +
-            skill_vector.backend * 0.3 +
-            skill_vector.cloud_infrastructure * 0.3
-        )
-        
-        # Fullstack friction
-        fullstack_friction = 1 - (
-            skill_vector.frontend * 0.4 +
-            skill_vector.backend * 0.4 +
-            skill_vector.architecture * 0.2
-        )
-        
-        # Mobile friction (needs frontend fundamentals)
-        mobile_friction = 1 - (
-            skill_vector.frontend * 0.5 +
-            code_style.language_diversity * 0.3 +
-            skill_vector.architecture * 0.2
-        )
-        
-        return FrictionProfile(
-            react_friction=round(max(react_friction, 0), 3),
-            vue_friction=round(max(vue_friction, 0), 3),
-            typescript_friction=round(max(typescript_friction, 0), 3),
-            python_typing_friction=round(max(python_typing_friction, 0), 3),
-            ml_project_friction=round(max(ml_project_friction, 0), 3),
-            devops_friction=round(max(devops_friction, 0), 3),
-            microservices_friction=round(max(microservices_friction, 0), 3),
-            fullstack_friction=round(max(fullstack_friction, 0), 3),
-            mobile_friction=round(max(mobile_friction, 0), 3)
-        )
+        inputs = {**asdict(skill_vector), **asdict(code_style),
+                  'quality_score': self.data['quality']['quality_score']}
+        return FrictionProfile(**{
+            name: round(max(1 - weighted_sum(FRICTION_WEIGHTS[name], inputs), 0), 3)
+            for name in FRICTIONS
+        })
     
     def compute_capability_assessment(self, skill_vector: SkillVector,
                                       code_style: CodeStyleProfile) -> CapabilityAssessment:
@@ -320,74 +274,12 @@ class DivergencePredictiveModel:
         Predict success likelihood for project types
         Based on skill match, no temporal factors
         """
-        quality = self.data['quality']['quality_score']
-        
-        # API service (backend + architecture + quality)
-        api_service = (
-            skill_vector.backend * 0.5 +
-            skill_vector.architecture * 0.3 +
-            quality * 0.2
-        )
-        
-        # CLI tool (backend + code quality)
-        devtools_skill = self._infer_devtools_skill()
-        cli_tool = (
-            skill_vector.backend * 0.4 +
-            devtools_skill * 0.4 +
-            quality * 0.2
-        )
-        
-        # Data pipeline (data + backend + architecture)
-        data_pipeline = (
-            skill_vector.data * 0.4 +
-            skill_vector.backend * 0.4 +
-            skill_vector.architecture * 0.2
-        )
-        
-        # ML model (AI/ML + data + quality)
-        ml_model = (
-            skill_vector.ai_ml * 0.5 +
-            skill_vector.data * 0.3 +
-            quality * 0.2
-        )
-        
-        # Frontend app (frontend + quality)
-        frontend_app = (
-            skill_vector.frontend * 0.7 +
-            quality * 0.3
-        )
-        
-        # Fullstack app (both + architecture)
-        fullstack_app = (
-            skill_vector.frontend * 0.3 +
-            skill_vector.backend * 0.4 +
-            skill_vector.architecture * 0.3
-        )
-        
-        # Infrastructure (cloud + backend + architecture)
-        infrastructure = (
-            skill_vector.cloud_infrastructure * 0.5 +
-            skill_vector.backend * 0.3 +
-            skill_vector.architecture * 0.2
-        )
-        
-        # Plugin system (backend + architecture + devtools)
-        plugin_system = (
-            skill_vector.backend * 0.4 +
-            skill_vector.architecture * 0.3 +
-            devtools_skill * 0.3
-        )
-        
-        return CapabilityAssessment(
-            api_service=round(min(api_service, 1.0), 3),
-            cli_tool=round(min(cli_tool, 1.0), 3),
-            data_pipeline=round(min(data_pipeline, 1.0), 3),
-            ml_model=round(min(ml_model, 1.0), 3),
-            frontend_app=round(min(frontend_app, 1.0), 3),
-            fullstack_app=round(min(fullstack_app, 1.0), 3),
-            infrastructure=round(min(infrastructure, 1.0), 3),
-            plugin_system=round(min(plugin_system, 1.0), 3)
-        )
+        inputs = {**asdict(skill_vector), 'quality_score': self.data['quality']['quality_score'],
+                  'devtools': self._infer_devtools_skill()}
+        return CapabilityAssessment(**{
+            name: round(min(weighted_sum(CAPABILITY_WEIGHTS[name], inputs), 1.0), 3)
+            for name in PROJECT_TYPES
+        })
     
     def identify_skill_gaps(self, skill_vector: SkillVector) -> Dict[str, float]:
         """Identify low-scoring areas (potential growth zones)"""
@@ -436,25 +328,34 @@ class DivergencePredictiveModel:
         
         return recommendations
     
+    @_memoized
+    def _friction(self) -> FrictionProfile:
+        return self.compute_friction_profile(self.compute_skill_vector(), self.compute_code_style_profile())
+    
+    @_memoized
+    def _capabilities(self) -> CapabilityAssessment:
+        return self.compute_capability_assessment(self.compute_skill_vector(), self.compute_code_style_profile())
+    
+    @_memoized
+    def _derived_dicts(self) -> Dict[str, Dict]:
+        """Skill, friction and capability scores as plain dicts, computed once per profile"""
+        return {
+            'skills': asdict(self.compute_skill_vector()),
+            'friction': asdict(self._friction()),
+            'capabilities': asdict(self._capabilities())
+        }
+    
     def predict_project_success(self, project_type: str,
-                               capabilities: CapabilityAssessment,
-                               friction: FrictionProfile) -> Dict[str, any]:
+                               capabilities: CapabilityAssessment = None,
+                               friction: FrictionProfile = None) -> Dict[str, any]:
         """Predict project success and identify risks"""
-        cap_dict = asdict(capabilities)
-        friction_dict = asdict(friction)
+        self._ensure_loaded()
+        derived = self._derived_dicts()
+        cap_dict = asdict(capabilities) if capabilities is not None else derived['capabilities']
+        friction_dict = asdict(friction) if friction is not None else derived['friction']
         
         success_score = cap_dict.get(project_type, 0.5)
-        
-        # Map project types to relevant friction
-        friction_map = {
-            'frontend_app': 'react_friction',
-            'fullstack_app': 'fullstack_friction',
-            'ml_model': 'ml_project_friction',
-            'infrastructure': 'devops_friction',
-            'cli_tool': 'python_typing_friction'
-        }
-        
-        relevant_friction = friction_dict.get(friction_map.get(project_type, ''), 0.5)
+        relevant_friction = friction_dict.get(PROJECT_FRICTION.get(project_type, ''), 0.5)
         
         # Determine risk
         if success_score > 0.7:
@@ -479,21 +380,18 @@ class DivergencePredictiveModel:
             'friction_score': round(relevant_friction, 3),
             'risk_level': risk,
             'tension_points': tensions,
-            'skill_gaps': self._identify_project_gaps(project_type, asdict(self.compute_skill_vector()))
+            'skill_gaps': self._identify_project_gaps(project_type, derived['skills'])
         }
     
+    def predict_all_projects(self) -> Dict[str, Dict]:
+        """Success, friction and skill gaps for every project type in one call"""
+        return {project_type: self.predict_project_success(project_type) for project_type in PROJECT_TYPES}
+    
     def _identify_project_gaps(self, project_type: str, skills: Dict) -> List[str]:
         """Identify specific skill gaps for a project type"""
         gaps = []
         
-        gap_map = {
-            'frontend_app': [('frontend', 0.5), ('architecture', 0.4)],
-            'fullstack_app': [('frontend', 0.5), ('backend', 0.6), ('architecture', 0.5)],
-            'ml_model': [('ai_ml', 0.4), ('data', 0.4)],
-            'infrastructure': [('cloud_infrastructure', 0.4), ('backend', 0.5)],
-        }
-        
-        for skill, threshold in gap_map.get(project_type, []):
+        for skill, threshold in PROJECT_SKILL_THRESHOLDS.get(project_type, []):
             if skills.get(skill, 0) < threshold:
                 gaps.append(f'{skill}: {skills.get(skill, 0):.2f} (needs ≥{threshold})')
         
@@ -501,12 +399,12 @@ class DivergencePredictiveModel:
     
     def generate_predictive_profile(self) -> Dict:
         """Generate complete predictive profile"""
-        self.load_data()
+        self._ensure_loaded()
         
         skill_vector = self.compute_skill_vector()
         code_style = self.compute_code_style_profile()
-        friction = self.compute_friction_profile(skill_vector, code_style)
-        capabilities = self.compute_capability_assessment(skill_vector, code_style)
+        friction = self._friction()
+        capabilities = self._capabilities()
         skill_gaps = self.identify_skill_gaps(skill_vector)
         learning_path = self.recommend_learning_path(skill_vector, friction)
         devtools_skill = self._infer_devtools_skill()
@@ -519,8 +417,9 @@ class DivergencePredictiveModel:
             'skill_gaps': skill_gaps,
             'learning_recommendations': learning_path,
             'devtools_skill': devtools_skill,
+            'project_predictions': self.predict_all_projects(),
             'metadata': {
-                'model_version': '2.0.0',
+                'model_version': MODEL_VERSION,
                 'based_on_repos': self.data['metadata']['total_repositories'],
                 'data_source': 'static_analysis_only',
                 'analysis_timestamp': self.data['metadata']['analysis_timestamp']
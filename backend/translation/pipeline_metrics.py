@@ -0,0 +1,66 @@
+import json
+import os
+import sys
+import time
+from collections import defaultdict
+from pathlib import Path
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+# Set by main.py for each pipeline run; scripts write {stage}.json into it
+METRICS_DIR_ENV = 'PIPELINE_METRICS_DIR'
+
+
+def peak_rss_mb(who=None):
+    """Peak resident set size in MB for this process (or its children), None where unsupported"""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF if who is None else who).ru_maxrss
+    # ru_maxrss is KB on Linux, bytes on macOS
+    return round(peak / (1024 * 1024 if sys.platform == 'darwin' else 1024), 1)
+
+
+def process_cpu_seconds():
+    """User + system CPU of this process and the children it waited for, None where unsupported"""
+    if resource is None:
+        return None
+    usages = [resource.getrusage(who) for who in (resource.RUSAGE_SELF, resource.RUSAGE_CHILDREN)]
+    return round(sum(u.ru_utime + u.ru_stime for u in usages), 3)
+
+
+class StageMetrics:
+    """Wall/CPU time, peak RSS and named counters for one pipeline stage"""
+
+    def __init__(self, stage):
+        self.stage = stage
+        self.counters = defaultdict(int)
+        self._wall_start = time.perf_counter()
+        self._cpu_start = time.process_time()
+
+    def incr(self, name, amount=1):
+        self.counters[name] += amount
+
+    def summary(self):
+        # Whole-process figures (interpreter start-up and imports included): each stage is its own process
+        cpu_seconds = process_cpu_seconds()
+        return {
+            'stage': self.stage,
+            'wall_seconds': round(time.perf_counter() - self._wall_start, 3),
+            'cpu_seconds': cpu_seconds if cpu_seconds is not None else round(time.process_time() - self._cpu_start, 3),
+            'peak_rss_mb': peak_rss_mb(),
+            'children_peak_rss_mb': peak_rss_mb(resource.RUSAGE_CHILDREN) if resource else None,
+            'counters': dict(self.counters)
+        }
+
+    def write(self):
+        """Write the summary where main.py will pick it up (no-op when run by hand)"""
+        metrics_dir = os.getenv(METRICS_DIR_ENV)
+        if not metrics_dir:
+            return
+        path = Path(metrics_dir) / f"{self.stage}.json"
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(self.summary(), f, indent=2)
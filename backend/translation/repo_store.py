@@ -0,0 +1,91 @@
+import hashlib
+import json
+import os
+import subprocess
+from pathlib import Path
+
+# Bump whenever analyze_single_repo output changes, so stale stored results are ignored
+ANALYZER_VERSION = '1'
+
+# Per-repository analysis results, shared by every user who owns a copy of a repo
+REPO_STORE_DIR = Path(os.getenv('REPO_STORE_DIR', Path(__file__).parent / 'repo_store'))
+
+
+def normalize_clone_url(clone_url):
+    """Canonical form of a clone URL (case, trailing slash and .git suffix ignored)"""
+    url = clone_url.strip().rstrip('/').lower()
+    return url[:-4] if url.endswith('.git') else url
+
+
+def resolve_head(clone_url):
+    """HEAD commit OID of the remote default branch, without cloning (None on failure)"""
+    try:
+        result = subprocess.run(
+            ['git', 'ls-remote', clone_url, 'HEAD'],
+            check=True,
+            capture_output=True,
+            text=True,
+            timeout=30
+        )
+    except (subprocess.CalledProcessError, subprocess.TimeoutExpired, OSError) as e:
+        print(f"Could not resolve HEAD for {clone_url}: {e}")
+        return None
+
+    line = result.stdout.strip().split('\n')[0]
+    return line.split()[0] if line else None
+
+
+def _result_dir(head_oid):
+    return REPO_STORE_DIR / ANALYZER_VERSION / head_oid
+
+
+def _result_path(clone_url, head_oid):
+    url_key = hashlib.sha256(normalize_clone_url(clone_url).encode('utf-8')).hexdigest()[:32]
+    return _result_dir(head_oid) / f"{url_key}.json"
+
+
+def find_result_path(clone_url, head_oid):
+    """Stored result for (clone URL, HEAD OID, analyzer version), or one for the same commit in a fork"""
+    if not head_oid:
+        return None
+
+    exact = _result_path(clone_url, head_oid)
+    if exact.exists():
+        return exact
+
+    # Forks share commit OIDs, and the same commit always yields the same analysis
+    commit_dir = _result_dir(head_oid)
+    if commit_dir.is_dir():
+        for candidate in sorted(commit_dir.glob('*.json')):
+            return candidate
+    return None
+
+
+def load_result(clone_url, head_oid, name):
+    """Stored analysis for a repo at a given HEAD, renamed for this owner's copy"""
+    path = find_result_path(clone_url, head_oid)
+    if path is None:
+        return None
+
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            result = json.load(f)
+    except (OSError, ValueError) as e:
+        print(f"Ignoring unreadable stored result {path}: {e}")
+        return None
+
+    result['name'] = name
+    return result
+
+
+def save_result(clone_url, head_oid, result):
+    """Persist one repo's analysis (atomic, so concurrent pipelines never read partial files)"""
+    if not head_oid:
+        return
+
+    path = _result_path(clone_url, head_oid)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(result, f)
+    os.replace(tmp_path, path)
@@ -0,0 +1,140 @@
+import os
+import re
+
+# Extension -> language used to pick an import grammar
+SOURCE_LANGUAGES = {
+    '.py': 'python',
+    '.js': 'javascript', '.jsx': 'javascript', '.mjs': 'javascript', '.cjs': 'javascript',
+    '.ts': 'javascript', '.tsx': 'javascript',
+    '.go': 'go',
+    '.rs': 'rust',
+    '.java': 'java', '.kt': 'java', '.scala': 'java',
+}
+
+# Lines longer than this are minified/generated code, not hand-written imports
+MAX_LINE_LENGTH = 1000
+
+# Reverse-DNS prefixes for Java-style package names (org.springframework -> springframework)
+JAVA_DOMAIN_PREFIXES = {'com', 'org', 'io', 'net', 'dev', 'edu', 'me', 'co'}
+
+# Python: statements anchored at line start, so prose and string contents mid-line never match
+PY_IMPORT_RE = re.compile(r'^[ \t]*(?:from[ \t]+([A-Za-z_][\w.]*)[ \t]+import\b|import[ \t]+([A-Za-z_][\w., \t]*))', re.MULTILINE)
+
+# JS/TS: `import x from 'y'`, `export * from 'y'`, `import 'y'`, `require('y')`, `import('y')`
+JS_FROM_RE = re.compile(r'''\bfrom[ \t]*['"]([^'"\n]{1,200})['"]''')
+JS_BARE_IMPORT_RE = re.compile(r'''^[ \t]*import[ \t]*['"]([^'"\n]{1,200})['"]''', re.MULTILINE)
+JS_CALL_RE = re.compile(r'''\b(?:require|import)[ \t]*\([ \t]*['"]([^'"\n]{1,200})['"][ \t]*\)''')
+
+# Go: single `import "x"` / `import alias "x"` and parenthesised import blocks
+GO_SINGLE_RE = re.compile(r'^import[ \t]+(?:[\w.]+[ \t]+)?"([^"\n]+)"', re.MULTILINE)
+GO_BLOCK_RE = re.compile(r'^import[ \t]*\(([^)]*)\)', re.MULTILINE)
+GO_BLOCK_ITEM_RE = re.compile(r'"([^"\n]+)"')
+
+# Rust: `use crate_name::...;` and `extern crate name;`
+RUST_USE_RE = re.compile(r'^[ \t]*(?:pub(?:\([^)\n]*\))?[ \t]+)?use[ \t]+:{0,2}([A-Za-z_]\w*)', re.MULTILINE)
+RUST_EXTERN_RE = re.compile(r'^[ \t]*extern[ \t]+crate[ \t]+([A-Za-z_]\w*)', re.MULTILINE)
+RUST_LOCAL_PATHS = {'crate', 'self', 'super', 'Self'}
+
+# Java/Kotlin/Scala: `import a.b.c;` / `import static a.b.C.d;`
+JAVA_IMPORT_RE = re.compile(r'^[ \t]*import[ \t]+(?:static[ \t]+)?([A-Za-z_][\w.]*)', re.MULTILINE)
+
+
+def source_language(path):
+    """Return the import grammar for a file path, or None for non-source files"""
+    filename = path.replace('\\', '/').rsplit('/', 1)[-1].lower()
+    if filename.endswith(('.min.js', '.bundle.js')):
+        return None
+    _, ext = os.path.splitext(filename)
+    return SOURCE_LANGUAGES.get(ext)
+
+
+def extract_imports(path, content):
+    """Return the set of top-level packages imported by one source file"""
+    language = source_language(path)
+    if language is None:
+        return set()
+
+    if language == 'python':
+        return _python_imports(content)
+
+    # Minified bundles put whole programs on one line; drop those lines up front
+    if any(len(line) > MAX_LINE_LENGTH for line in content.splitlines()):
+        content = '\n'.join(line for line in content.splitlines() if len(line) <= MAX_LINE_LENGTH)
+
+    if language == 'javascript':
+        return _javascript_imports(content)
+    if language == 'go':
+        return _go_imports(content)
+    if language == 'rust':
+        return _rust_imports(content)
+    return _java_imports(content)
+
+
+def _python_imports(content):
+    """Python top-level modules from import statements (relative imports are skipped)"""
+    modules = set()
+    for from_name, import_names in PY_IMPORT_RE.findall(content):
+        names = [from_name] if from_name else import_names.split(',')
+        for name in names:
+            name = name.strip().split(' ')[0]
+            if name:
+                modules.add(name.split('.')[0])
+    return modules
+
+
+def _javascript_imports(content):
+    """JS/TS module specifiers, normalised to npm package names"""
+    specifiers = set(JS_FROM_RE.findall(content))
+    specifiers.update(JS_BARE_IMPORT_RE.findall(content))
+    specifiers.update(JS_CALL_RE.findall(content))
+
+    packages = set()
+    for spec in specifiers:
+        if spec.startswith(('.', '/', '~', '#')) or '://' in spec:
+            continue  # relative paths, aliases and URLs are not packages
+        if spec.startswith('node:'):
+            spec = spec[len('node:'):]
+        parts = spec.split('/')
+        if spec.startswith('@'):
+            if len(parts) < 2:
+                continue
+            packages.add('/'.join(parts[:2]))
+        else:
+            packages.add(parts[0])
+    return packages
+
+
+def _go_imports(content):
+    """Go import paths, reduced to the repository name for hosted modules"""
+    paths = set(GO_SINGLE_RE.findall(content))
+    for block in GO_BLOCK_RE.findall(content):
+        paths.update(GO_BLOCK_ITEM_RE.findall(block))
+
+    return {go_package_name(path) for path in paths}
+
+
+def go_package_name(path):
+    """Reduce a Go import/module path to a package name"""
+    parts = path.split('/')
+    if '.' in parts[0] and len(parts) >= 3:
+        return parts[2]  # github.com/gin-gonic/gin -> gin
+    return parts[0]  # standard library: net/http -> net
+
+
+def _rust_imports(content):
+    """Rust crate names from use / extern crate declarations"""
+    crates = set(RUST_USE_RE.findall(content))
+    crates.update(RUST_EXTERN_RE.findall(content))
+    return crates - RUST_LOCAL_PATHS
+
+
+def _java_imports(content):
+    """Java/Kotlin/Scala package roots"""
+    packages = set()
+    for name in JAVA_IMPORT_RE.findall(content):
+        parts = name.split('.')
+        if parts[0] in JAVA_DOMAIN_PREFIXES and len(parts) > 2:
+            packages.add(parts[1])
+        else:
+            packages.add(parts[0])
+    return packages
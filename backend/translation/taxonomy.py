@@ -0,0 +1,101 @@
+import json
+import os
+import threading
+import time
+from pathlib import Path
+
+# Package -> category / skill-area data shared by filtering, translation and modelling
+TAXONOMY_FILE = Path(os.getenv('TAXONOMY_FILE', Path(__file__).parent / 'taxonomy.json'))
+# Seconds between mtime checks of the data file; reload_taxonomy() applies an edit immediately
+TAXONOMY_RELOAD_CHECK_SECONDS = float(os.getenv('TAXONOMY_RELOAD_CHECK_SECONDS', '1'))
+
+_lock = threading.Lock()
+_index = None
+_index_mtime = None
+_checked_at = 0.0
+
+
+def load_taxonomy(path=TAXONOMY_FILE):
+    """Build the lookup index: canonical name -> category, alias -> canonical, indicator sets"""
+    with open(path, 'r', encoding='utf-8') as f:
+        raw = json.load(f)
+
+    aliases = {alias.lower(): name.lower() for alias, name in raw.get('aliases', {}).items()}
+
+    # First category listed wins, matching the old chained membership tests
+    categories = {}
+    for category, names in raw.get('categories', {}).items():
+        for name in names:
+            categories.setdefault(name.lower(), category)
+
+    indicators = {
+        group: {key: frozenset(name.lower() for name in names) for key, names in sets.items()}
+        for group, sets in raw.get('indicators', {}).items()
+    }
+
+    return {
+        'version': raw.get('version', 1),
+        'aliases': aliases,
+        'categories': categories,
+        'indicators': indicators
+    }
+
+
+def _swap_in(path):
+    """Load path as the shared index; caller holds _lock"""
+    global _index, _index_mtime, _checked_at
+    _index = load_taxonomy(path)
+    _index_mtime = os.stat(path).st_mtime
+    _checked_at = time.monotonic()
+    return _index
+
+
+def reload_taxonomy(path=TAXONOMY_FILE):
+    """Re-read the taxonomy file and swap it in for every caller"""
+    with _lock:
+        return _swap_in(path)
+
+
+def get_taxonomy():
+    """Loaded taxonomy index; stats the data file at most every TAXONOMY_RELOAD_CHECK_SECONDS"""
+    global _checked_at
+    index = _index
+    if index is not None and time.monotonic() - _checked_at < TAXONOMY_RELOAD_CHECK_SECONDS:
+        return index
+    with _lock:
+        if _index is None:
+            return _swap_in(TAXONOMY_FILE)
+        if time.monotonic() - _checked_at < TAXONOMY_RELOAD_CHECK_SECONDS:
+            return _index  # another thread checked while we waited
+        try:
+            mtime = os.stat(TAXONOMY_FILE).st_mtime
+        except OSError:
+            mtime = _index_mtime
+        if mtime != _index_mtime:
+            return _swap_in(TAXONOMY_FILE)
+        _checked_at = time.monotonic()
+        return _index
+
+
+def canonical_name(lib_name, index=None):
+    """Resolve aliases (torch -> pytorch, next -> nextjs)"""
+    lib = lib_name.lower()
+    return (index or get_taxonomy())['aliases'].get(lib, lib)
+
+
+def library_category(lib_name):
+    """Category for a package, or 'other'"""
+    index = get_taxonomy()
+    return index['categories'].get(canonical_name(lib_name, index), 'other')
+
+
+def indicator_groups(group):
+    """All indicator sets in a group as {key: frozenset}"""
+    return get_taxonomy()['indicators'][group]
+
+
+def count_matches(lib_names, group, key):
+    """Number of distinct canonical names in lib_names that are indicators for group/key"""
+    index = get_taxonomy()
+    names = {canonical_name(lib, index) for lib in lib_names}
+    return len(names & index['indicators'][group][key])
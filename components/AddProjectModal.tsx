@@ -3,6 +3,7 @@
 import { useState } from 'react'
 import styles from './AddProjectModal.module.css'
 import ProjectScopingChat from './ProjectScopingChat'
+import { getAuthHeader } from '@/lib/auth'
 
 interface AddProjectModalProps {
   isOpen: boolean
@@ -36,7 +37,7 @@ export default function AddProjectModal({ isOpen, onClose }: AddProjectModalProp
     try {
       const response = await fetch('http://localhost:8000/api/projects', {
         method: 'POST',
-        headers: { 'Content-Type': 'application/json' },
+        headers: { 'Content-Type': 'application/json', ...getAuthHeader() },
         body: JSON.stringify(payload)
       })
       
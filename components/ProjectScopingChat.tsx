@@ -3,6 +3,7 @@
 import { useState, useEffect, useRef } from 'react'
 import { Send, Loader2, X } from 'lucide-react'
 import styles from './ProjectScopingChat.module.css'
+import { getAuthHeader } from '@/lib/auth'
 
 interface Message {
   type: 'user' | 'assistant' | 'system' | 'error'
@@ -55,39 +56,64 @@ export default function ProjectScopingChat({
     setIsLoading(true)
 
     try {
-      // Call your Backboard API endpoint
-      const result = await fetch(`http://localhost:8000/api/projects/${projectId}/chat`, {
+      // Stream the assistant's reply (Server-Sent Events) so the question appears as it is generated
+      const result = await fetch(`http://localhost:8000/api/projects/${projectId}/chat/stream`, {
         method: 'POST',
-        headers: { 'Content-Type': 'application/json' },
+        headers: { 'Content-Type': 'application/json', ...getAuthHeader() },
         body: JSON.stringify({
           message: response,
           session_id: sessionId
         })
       })
-      
-      const data = await result.json()
-      
-      // Update session ID
-      if (data.session_id) {
-        setSessionId(data.session_id)
+      if (!result.ok || !result.body) {
+        throw new Error(`Chat request failed: ${result.status}`)
       }
-      
-      // Update confidence
-      setConfidence(Math.round(data.confidence * 100))
-      
-      // Check if complete
-      if (data.complete) {
-        setIsComplete(true)
-        setChatHistory(prev => [...prev, { 
-          type: 'system', 
-          content: '🎉 Analysis complete! Generating your personalized project breakdown...' 
-        }])
-      } else {
-        // Add AI response
-        setChatHistory(prev => [...prev, { 
-          type: 'assistant', 
-          content: data.message 
-        }])
+
+      // Placeholder assistant message, filled in as question_delta events arrive
+      let streamedQuestion = ''
+      setChatHistory(prev => [...prev, { type: 'assistant', content: '' }])
+      const updateAssistantMessage = (content: string) => {
+        setChatHistory(prev => [...prev.slice(0, -1), { type: 'assistant', content }])
+      }
+
+      const reader = result.body.getReader()
+      const decoder = new TextDecoder()
+      let buffer = ''
+      while (true) {
+        const { done, value } = await reader.read()
+        if (done) break
+        buffer += decoder.decode(value, { stream: true })
+
+        // SSE frames are separated by a blank line
+        let boundary
+        while ((boundary = buffer.indexOf('\n\n')) !== -1) {
+          const frame = buffer.slice(0, boundary)
+          buffer = buffer.slice(boundary + 2)
+          const event = frame.match(/^event: (.*)$/m)?.[1]
+          const data = JSON.parse(frame.match(/^data: (.*)$/m)?.[1] || '{}')
+
+          if (event === 'thread') {
+            setSessionId(data.thread_id)
+          } else if (event === 'question_delta') {
+            streamedQuestion += data.text
+            updateAssistantMessage(streamedQuestion)
+          } else if (event === 'confidence') {
+            setConfidence(Math.round(data.confidence * 100))
+          } else if (event === 'error') {
+            throw new Error(data.detail)
+          } else if (event === 'done') {
+            setConfidence(Math.round(data.confidence * 100))
+            if (data.complete) {
+              setIsComplete(true)
+              setChatHistory(prev => [...prev.slice(0, -1), {
+                type: 'system',
+                content: '🎉 Analysis complete! Generating your personalized project breakdown...'
+              }])
+            } else {
+              updateAssistantMessage(data.question)
+            }
+          }
+        }
       }
     } catch (error) {
       console.error('Error:', error)